@@ -3,8 +3,15 @@ from __future__ import annotations
 import json
 import pathlib
 import re
+import sys
 
 ROOT = pathlib.Path(__file__).resolve().parents[2]
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[3]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from tools.taskpacks import catalog  # noqa: E402
+
 ART = ROOT / "taskpacks" / "TASK-1290-platform-taskpack-hygiene-audit" / "artifacts"
 
 TEST_DISCOVER_RE = re.compile(r"unittest.*discover")
@@ -14,17 +21,17 @@ def scan_taskpacks():
     findings = []
     tp_root = ROOT / "taskpacks"
 
-    for tp in tp_root.iterdir():
-        if not tp.is_dir():
-            continue
-        if not (tp / "task.yml").exists():
+    # Stat-level checks only: nothing here needs the parsed YAML.
+    for tp in catalog.taskpack_dirs(tp_root, pattern="*"):
+        missing = catalog.missing_files(tp)
+        if "task.yml" in missing:
             continue
 
         name = tp.name
 
         # --- Required files ---
         for req in ("spec.md", "acceptance.yml", "risk.md", "runbook.md"):
-            if not (tp / req).exists():
+            if req in missing:
                 findings.append({
                     "taskpack": name,
                     "type": "missing_file",
@@ -32,8 +39,7 @@ def scan_taskpacks():
                 })
 
         # --- Acceptance hygiene ---
-        acc = tp / "acceptance.yml"
-        acc_text = acc.read_text(encoding="utf-8") if acc.exists() else ""
+        acc_text = catalog.read_text(tp / "acceptance.yml") or ""
         if "compileall" not in acc_text:
             findings.append({
                 "taskpack": name,
@@ -55,7 +61,7 @@ def scan_taskpacks():
 
         # --- Import path footgun ---
         for tool in (tp / "tools").glob("*.py"):
-            t = tool.read_text(encoding="utf-8")
+            t = catalog.read_text(tool) or ""
             if "from src." in t and "sys.path.insert" not in t:
                 findings.append({
                     "taskpack": name,
@@ -84,10 +90,10 @@ def scan_taskpacks():
 
         # --- Deploy / network language ---
         for doc in ("spec.md", "runbook.md", "risk.md"):
-            p = tp / doc
-            if not p.exists():
+            text = catalog.read_text(tp / doc)
+            if text is None:
                 continue
-            text = p.read_text(encoding="utf-8").lower()
+            text = text.lower()
             for word in ("deploy", "deployment", "publish", "hosting", "release", "cloud"):
                 if word in text:
                     findings.append({
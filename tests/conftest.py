@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+import pytest
+
+
+def _git(repo: Path, *args: str) -> str:
+    proc = subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True)
+    return proc.stdout.strip()
+
+
+def _init_git_repo(path: Path, *, files: Optional[Dict[str, str]] = None, commit: bool = True) -> str:
+    path.mkdir(parents=True, exist_ok=True)
+    _git(path, "init", "-b", "main")
+    _git(path, "config", "user.email", "test@example.com")
+    _git(path, "config", "user.name", "Test User")
+    if not commit:
+        return ""
+    for rel, text in {"README.md": "base", **(files or {})}.items():
+        (path / rel).parent.mkdir(parents=True, exist_ok=True)
+        (path / rel).write_text(text, encoding="utf-8")
+    _git(path, "add", "-A")
+    _git(path, "commit", "-m", "base")
+    return _git(path, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def git() -> Callable[..., str]:
+    """`git(repo, *args)` runs git in `repo` and returns its stripped stdout."""
+    return _git
+
+
+@pytest.fixture
+def init_git_repo() -> Callable[..., str]:
+    """
+    `init_git_repo(path, files=None, commit=True)` creates a repo on branch
+    `main` with a test identity and, unless commit=False, a base commit of
+    README.md plus `files`. Returns the base commit sha ("" without a commit).
+    """
+    return _init_git_repo
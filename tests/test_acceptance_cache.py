@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from tools.orchestrator.acceptance_cache import AcceptanceCache, cache_key
+from tools.orchestrator.orchestrate import (
+    TaskPack,
+    _format_acceptance_results,
+    evidence_excludes,
+    git_worktree_tree_hash,
+    run_acceptance,
+)
+
+
+def test_cache_stores_only_pass_and_warning(tmp_path: Path) -> None:
+    cache = AcceptanceCache(tmp_path / "cache")
+    key = cache_key(tree_hash="t", command="pytest", deps_digest="d")
+
+    cache.put(key, section="tests", command="pytest", status="fail", log="boom")
+    assert cache.get(key) is None
+
+    cache.put(key, section="tests", command="pytest", status="pass", log="ok")
+    entry = cache.get(key)
+    assert entry is not None
+    assert entry["status"] == "pass"
+    assert entry["log"] == "ok"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_cache_key_depends_on_all_inputs() -> None:
+    base = cache_key(tree_hash="t", command="c", deps_digest="d")
+    assert base != cache_key(tree_hash="t2", command="c", deps_digest="d")
+    assert base != cache_key(tree_hash="t", command="c2", deps_digest="d")
+    assert base != cache_key(tree_hash="t", command="c", deps_digest="d2")
+
+
+def test_run_acceptance_replays_cached_results(tmp_path: Path, init_git_repo) -> None:
+    repo = tmp_path / "repo"
+    init_git_repo(repo, files={"src/app.txt": "v1"})
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    counter = tmp_path / "counter.txt"
+    tp = TaskPack(
+        path=repo,
+        task={"scope": {"allowed_paths": ["src/"]}},
+        spec="",
+        risk="",
+        acceptance={"tests": {"commands": [f"echo ran >> {counter} && echo output"]}},
+    )
+
+    first = run_acceptance(tp, workspace_root=repo, log_dir=log_dir, cache=AcceptanceCache(tmp_path / "c"))
+    assert "cached" not in first[0]
+
+    # Edits outside scope.allowed_paths keep the cache key stable.
+    (repo / "README.md").write_text("edited", encoding="utf-8")
+    cache = AcceptanceCache(tmp_path / "c")
+    second = run_acceptance(tp, workspace_root=repo, log_dir=log_dir, cache=cache)
+    assert second[0]["cached"] is True
+    assert second[0]["status"] == "pass"
+    assert Path(second[0]["log_path"]).read_text(encoding="utf-8").strip() == "output"
+    assert counter.read_text(encoding="utf-8").count("ran") == 1
+    assert cache.stats()["hits"] == 1
+    assert "[pass, cached]" in _format_acceptance_results(second)
+
+    (repo / "src" / "app.txt").write_text("v2", encoding="utf-8")
+    third = run_acceptance(tp, workspace_root=repo, log_dir=log_dir, cache=AcceptanceCache(tmp_path / "c"))
+    assert "cached" not in third[0]
+    assert counter.read_text(encoding="utf-8").count("ran") == 2
+
+
+def test_tree_hash_ignores_the_runs_evidence_dir(tmp_path: Path, init_git_repo) -> None:
+    repo = tmp_path / "repo"
+    init_git_repo(repo, files={"src/app.txt": "v1"})
+    exclude = evidence_excludes(repo / "evidence", workspace_root=repo)
+    before = git_worktree_tree_hash(cwd=repo, exclude=exclude)
+
+    (repo / "evidence" / "run-1").mkdir(parents=True)
+    (repo / "evidence" / "run-1" / "manifest.json").write_text("{}", encoding="utf-8")
+
+    assert git_worktree_tree_hash(cwd=repo, exclude=exclude) == before
+    assert git_worktree_tree_hash(cwd=repo) != before
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from tools.acceptance import scan
+
+
+@pytest.fixture
+def tree(tmp_path: Path, monkeypatch) -> Path:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "artifacts").mkdir()
+    (tmp_path / "artifacts" / "report.json").write_text('{"status": "PASS"}\n', encoding="utf-8")
+    (tmp_path / "artifacts" / "run").write_text("engine: godot\n", encoding="utf-8")
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "notes.md").write_text("intro\nthis feels right\n", encoding="utf-8")
+    (tmp_path / "node_modules").mkdir()
+    (tmp_path / "node_modules" / "x.md").write_text("kubectl " + "apply\n", encoding="utf-8")
+    (tmp_path / "task.yml").write_text("id: demo\n", encoding="utf-8")
+    (tmp_path / "spec.md").write_text("spec\n", encoding="utf-8")
+    return tmp_path
+
+
+def run(*specs: tuple[str, list[str]]) -> list[scan.RuleResult]:
+    return scan.run_rules(scan.build_rules(specs))
+
+
+def test_rules_keep_the_standalone_scripts_exit_codes_and_messages(tree: Path) -> None:
+    results = run(
+        ("present", ["artifacts"]),
+        ("present", ["missing"]),
+        ("contains-any", ["artifacts", "pass"]),
+        ("contains-any", ["artifacts", "nothing-here"]),
+        ("engine-declared", ["task.yml", "spec.md", "artifacts"]),
+        ("no-language", ["qualitative", "."]),
+        ("no-language", ["deploy", "."]),
+    )
+
+    assert [r.exit_code for r in results] == [0, 2, 0, 3, 0, 2, 0]
+    assert results[0].lines == ["[acceptance] OK: 2 artifact file(s) present under artifacts"]
+    assert results[2].lines == ["[acceptance] OK: token match found in artifacts/report.json"]
+    assert results[3].lines == [
+        "[acceptance] FAIL: none of tokens ['nothing-here'] found in artifacts under artifacts"
+    ]
+    assert results[5].lines == [
+        "[acceptance] FAIL: subjective/playtest language detected:",
+        " - docs/notes.md:2:6: feels",
+    ]
+    # node_modules is skipped by the language rules, as in language_scan.
+    assert results[6].lines == ["[acceptance] OK: no deployment language detected"]
+
+
+def test_each_file_is_read_once_and_reading_stops_after_a_match(tree: Path, monkeypatch) -> None:
+    opened: list[str] = []
+    original = scan._Content.buffer.fget
+
+    def counting(self):
+        if self._buffer is None:
+            opened.append(Path(self.path).name)
+        return original(self)
+
+    monkeypatch.setattr(scan._Content, "buffer", property(counting))
+    results = run(("contains-any", ["artifacts", "status"]), ("engine-declared", ["task.yml", "spec.md", "artifacts"]))
+
+    assert [r.exit_code for r in results] == [0, 0]
+    # report.json satisfies contains-any and is shared with the engine rule; `run` satisfies
+    # the engine rule, so task.yml and spec.md are never opened.
+    assert opened == ["report.json", "run"]
+
+
+def test_large_files_are_memory_mapped(tree: Path, monkeypatch) -> None:
+    monkeypatch.setattr(scan, "MMAP_MIN_BYTES", 16)
+    (tree / "artifacts" / "big.log").write_bytes(b"x" * 64 + b"\nDETERMINISTIC\n")
+
+    results = run(("contains-any", ["artifacts", "deterministic"]))
+
+    assert results[0].exit_code == 0
+    assert results[0].lines == ["[acceptance] OK: token match found in artifacts/big.log"]
+
+
+def test_main_exits_with_first_failing_rule(tree: Path, capsys) -> None:
+    code = scan.main(["--present", "artifacts", "--contains-any", "artifacts", "absent", "--present", "missing"])
+
+    out = capsys.readouterr().out
+    assert code == 3
+    assert "[acceptance] scan: contains-any artifacts: exit 3" in out
+    assert "[acceptance] scan: present missing: exit 2" in out
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import io
+import json
+import sys
+from pathlib import Path
+
+from tools.orchestrator.codex_events import EventSummary, compact_event, consume_stream, run_codex_json
+
+
+def _events() -> list[str]:
+    return [
+        json.dumps({"type": "thread.started", "thread_id": "t1"}),
+        json.dumps({"type": "turn.started"}),
+        json.dumps({"type": "item.started", "item": {"id": "item_0", "type": "command_execution", "command": "pytest -q"}}),
+        "WARNING: not json",
+        json.dumps(
+            {
+                "type": "item.completed",
+                "item": {
+                    "id": "item_0",
+                    "type": "command_execution",
+                    "command": "pytest -q",
+                    "aggregated_output": "x" * 5000,
+                    "exit_code": 0,
+                },
+            }
+        ),
+        json.dumps({"type": "item.completed", "item": {"id": "item_1", "type": "agent_message", "text": "All done."}}),
+        json.dumps({"type": "turn.completed", "usage": {"input_tokens": 120, "cached_input_tokens": 20, "output_tokens": 30}}),
+    ]
+
+
+def test_consume_stream_summarises_usage_tools_and_latency() -> None:
+    ticks = iter([0.0, 1.0, 2.0, 9.5, 10.0, 10.5])
+    events_out, text_out = io.StringIO(), io.StringIO()
+
+    summary = consume_stream(_events(), events_out=events_out, text_out=text_out, clock=lambda: next(ticks))
+    data = summary.to_dict()
+
+    assert data["events"] == 6
+    assert data["usage"] == {"cached_input_tokens": 20, "input_tokens": 120, "output_tokens": 30}
+    assert data["tool_calls"] == {"command_execution": 1}
+    assert data["slowest_steps"][0] == {
+        "id": "item_0",
+        "type": "command_execution",
+        "label": "pytest -q",
+        "duration_s": 7.5,
+    }
+    # The agent message had no start event; its latency is the gap since the previous event.
+    assert data["slowest_steps"][1]["duration_s"] == 0.5
+
+    lines = events_out.getvalue().splitlines()
+    assert len(lines) == 6
+    assert len(lines[3]) < 1000
+    assert "WARNING: not json" in text_out.getvalue()
+    assert "All done." in text_out.getvalue()
+
+
+def test_compact_event_truncates_nested_strings() -> None:
+    event = {"item": {"aggregated_output": "y" * 500, "exit_code": 1}}
+    compacted = compact_event(event)
+    assert compacted["item"]["exit_code"] == 1
+    assert compacted["item"]["aggregated_output"].startswith("y" * 200)
+    assert compacted["item"]["aggregated_output"].endswith("(+300 chars)")
+
+
+def test_compact_event_truncates_strings_inside_lists() -> None:
+    event = {"item": {"changes": [{"path": "a.py", "diff": "z" * 500}], "output": ["w" * 500, 3]}}
+    compacted = compact_event(event)
+    assert compacted["item"]["changes"][0]["path"] == "a.py"
+    assert compacted["item"]["changes"][0]["diff"].endswith("(+300 chars)")
+    assert compacted["item"]["output"][0].endswith("(+300 chars)")
+    assert compacted["item"]["output"][1] == 3
+
+
+def test_errors_are_collected() -> None:
+    summary = EventSummary()
+    summary.feed({"type": "turn.failed", "error": {"message": "rate limited"}}, received_at=0.0)
+    summary.feed({"type": "error", "message": "stream closed"}, received_at=1.0)
+    assert summary.to_dict()["errors"] == ["rate limited", "stream closed"]
+
+
+def test_plain_log_keeps_nested_turn_failed_message() -> None:
+    lines = [
+        json.dumps({"type": "turn.failed", "error": {"message": "rate limited"}}),
+        json.dumps({"type": "error", "message": "stream closed"}),
+    ]
+    text_out = io.StringIO()
+    consume_stream(lines, events_out=io.StringIO(), text_out=text_out)
+    assert text_out.getvalue().splitlines() == ["rate limited", "stream closed"]
+
+
+def test_run_codex_json_streams_subprocess(tmp_path: Path) -> None:
+    script = tmp_path / "fake_codex.py"
+    script.write_text(
+        "import sys\n" + "".join(f"print({line!r}, flush=True)\n" for line in _events()),
+        encoding="utf-8",
+    )
+    rc, out, summary = run_codex_json(
+        [sys.executable, str(script)],
+        cwd=tmp_path,
+        events_path=tmp_path / "implementer_attempt1.events.jsonl",
+        log_path=tmp_path / "implementer_attempt1.log",
+    )
+    assert rc == 0
+    assert "All done." in out
+    assert summary.usage["output_tokens"] == 30
+    assert (tmp_path / "implementer_attempt1.events.jsonl").read_text(encoding="utf-8").count("\n") == 6
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from tools.common import git_diff
+
+
+@pytest.fixture
+def repo(tmp_path: Path, init_git_repo, git) -> Path:
+    repo = tmp_path / "repo"
+    init_git_repo(
+        repo,
+        files={
+            "keep.txt": "a\nb\n",
+            "old_name.txt": "".join(f"line {i}\n" for i in range(20)),
+            "gone.txt": "x\n",
+        },
+    )
+    git(repo, "checkout", "-q", "-b", "feature")
+    (repo / "keep.txt").write_text("a\nB\nc\n", encoding="utf-8")
+    git(repo, "mv", "old_name.txt", "new name.txt")
+    (repo / "gone.txt").unlink()
+    (repo / "blob.bin").write_bytes(b"\x00\x01\x02")
+    (repo / ".orchestrator_logs").mkdir()
+    (repo / ".orchestrator_logs" / "log.txt").write_text("1\n2\n3\n", encoding="utf-8")
+    git(repo, "add", "-A")
+    git(repo, "commit", "-q", "-m", "feature")
+    git_diff.clear_memo()
+    return repo
+
+
+def test_diff_summary_combines_name_status_and_numstat(repo: Path, git) -> None:
+    summary = git_diff.diff_summary("main", cwd=repo)
+
+    changes = {change.path: change for change in summary.changes}
+    assert set(summary.paths) == {".orchestrator_logs/log.txt", "blob.bin", "gone.txt", "keep.txt", "new name.txt"}
+    assert changes["new name.txt"].status == "R"
+    assert changes["new name.txt"].old_path == "old_name.txt"
+    assert (changes["new name.txt"].added, changes["new name.txt"].deleted) == (0, 0)
+    assert changes["gone.txt"].status == "D"
+    assert (changes["keep.txt"].added, changes["keep.txt"].deleted) == (2, 1)
+    assert changes["blob.bin"].added is None
+
+    assert summary.changed_lines() == 2 + 1 + 1 + 3
+    assert summary.changed_lines(exclude=(".orchestrator_logs",)) == 4
+    assert summary.paths == git(repo, "diff", "--name-only", "main...HEAD").splitlines()
+    assert "5 files changed, 5 insertions(+), 2 deletions(-)" in summary.format_stat()
+    assert " blob.bin" in summary.format_stat() and "| Bin" in summary.format_stat()
+
+
+def test_diff_summary_is_cached_per_commit_pair(repo: Path, tmp_path: Path, monkeypatch, git) -> None:
+    cache_dir = tmp_path / "evidence" / "git_diff"
+    first = git_diff.diff_summary("main", cwd=repo, cache_dir=cache_dir)
+    assert len(list(cache_dir.glob("*.json"))) == 1
+
+    # A fresh process (empty memo) reads the evidence cache instead of re-diffing.
+    git_diff.clear_memo()
+    calls: list[list[str]] = []
+    original = git_diff._git
+    monkeypatch.setattr(git_diff, "_git", lambda args, **kw: calls.append(args) or original(args, **kw))
+    second = git_diff.diff_summary("main", cwd=repo, cache_dir=cache_dir)
+    assert second == first
+    assert [args[0] for args in calls] == ["rev-parse", "merge-base"]
+
+    # A new commit is a new (base, head) pair.
+    (repo / "keep.txt").write_text("changed again\n", encoding="utf-8")
+    git(repo, "commit", "-q", "-am", "more")
+    third = git_diff.diff_summary("main", cwd=repo, cache_dir=cache_dir)
+    assert third.head != first.head
+    assert len(list(cache_dir.glob("*.json"))) == 2
+
+
+def test_working_tree_mode_and_errors(repo: Path) -> None:
+    (repo / "keep.txt").write_text("uncommitted\n", encoding="utf-8")
+    assert git_diff.changed_paths("HEAD", None, cwd=repo) == ["keep.txt"]
+
+    with pytest.raises(git_diff.GitDiffError):
+        git_diff.diff_summary("no-such-ref", cwd=repo)
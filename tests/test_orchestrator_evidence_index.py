@@ -94,3 +94,45 @@ def test_evidence_index_failure_is_non_fatal(
     assert manifest_out.get("evidence_index_error") == "ValueError: boom"
     assert "evidence_index_path" not in manifest_out
     assert "evidence_index_schema_version" not in manifest_out
+
+
+def test_review_checks_report_is_written_into_the_run_dir_and_indexed(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    log_root = setup_orchestrator_paths(tmp_path, monkeypatch)
+    run_dir = log_root / "run-d"
+    run_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = run_dir / "manifest.json"
+    manifest = {"result": "started", "run_id": "run-d"}
+    orchestrate._write_manifest(manifest_path, manifest)
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        report = Path(cmd[cmd.index("--json") + 1])
+        report.write_text(json.dumps({"summary": {"status": "pass"}}), encoding="utf-8")
+
+    monkeypatch.setattr(orchestrate, "run", fake_run)
+    orchestrate._collect_review_checks_report(
+        manifest,
+        manifest_path=manifest_path,
+        log_dir=run_dir,
+        repo_root=tmp_path,
+        cwd=tmp_path,
+        base_ref="main",
+    )
+    orchestrate._maybe_collect_evidence_index(
+        True,
+        manifest,
+        manifest_path=manifest_path,
+        evidence_root=log_root,
+        repo_root=tmp_path,
+    )
+
+    assert calls[0][1:6] == ["-m", "tools.review.run_review_checks", "--fast", "--base-ref", "main"]
+    manifest_out = read_json(manifest_path)
+    assert manifest_out["review_checks_status"] == "pass"
+    assert manifest_out["review_checks_report_path"] == ".orchestrator_logs/run-d/review_checks_report.json"
+    index = read_json(log_root / "evidence_index.json")
+    types = [artifact["type"] for run in index["runs"] for artifact in run["artifacts"]]
+    assert "review_checks_report" in types
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from tools.bench.import_time import measure_imports, parse_importtime
+
+# Loaded on first use only; see orchestrate._LAZY_ATTRS.
+LAZY_MODULES = (
+    "yaml",
+    "tools.evidence.index",
+    "tools.evidence.schemas",
+    "tools.orchestrator.plugins.runner",
+    "tools.orchestrator.plugins.interface",
+    "tools.orchestrator.workspaces",
+)
+
+
+def test_parse_importtime() -> None:
+    stderr = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       120 |        120 |   _io",
+            "import time:      2000 |       5000 | tools.orchestrator.orchestrate",
+        ]
+    )
+    assert parse_importtime(stderr) == {"_io": 120, "tools.orchestrator.orchestrate": 5000}
+
+
+def test_orchestrate_import_skips_optional_subsystems() -> None:
+    imported = measure_imports("tools.orchestrator.orchestrate")
+    assert "tools.orchestrator.orchestrate" in imported
+    assert [name for name in LAZY_MODULES if name in imported] == []
+
+
+def test_lazy_attributes_still_resolve() -> None:
+    from tools.evidence import index as evidence_index
+    from tools.orchestrator import orchestrate
+
+    assert orchestrate.evidence_index is evidence_index
+    assert orchestrate.resolve_workspace.__module__ == "tools.orchestrator.workspaces"
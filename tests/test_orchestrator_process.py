@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from tools.orchestrator.process import git_status, parse_porcelain_v2, prepare, run_process
+
+
+def test_prepare_skips_shell_for_plain_commands() -> None:
+    assert prepare(["git", "status"]) == (["git", "status"], False)
+    assert prepare("python -m pytest -q 'tests/a b.py'") == (
+        ["python", "-m", "pytest", "-q", "tests/a b.py"],
+        False,
+    )
+    assert prepare("python -m pytest --maxfail=1") == (["python", "-m", "pytest", "--maxfail=1"], False)
+
+
+def test_prepare_keeps_shell_for_shell_syntax() -> None:
+    for cmd in (
+        "python a.py && python b.py",
+        "echo hi > out.txt",
+        "ls *.py",
+        "echo $HOME",
+        "PYTHONPATH=. python -m pytest",
+    ):
+        assert prepare(cmd) == (cmd, True)
+
+
+def test_prepare_sends_shell_builtins_through_the_shell(tmp_path: Path) -> None:
+    for cmd in ("cd src", "exit 3", "test -f README.md", "true", "export FOO=1", "source env.sh"):
+        assert prepare(cmd) == (cmd, True)
+
+    (tmp_path / "sub").mkdir()
+    assert run_process("cd sub", cwd=tmp_path).returncode == 0
+    assert run_process("exit 3", cwd=tmp_path).returncode == 3
+    assert run_process("true", cwd=tmp_path).returncode == 0
+
+
+def test_run_process_missing_binary_returns_127(tmp_path: Path) -> None:
+    proc = run_process(["definitely-not-a-real-binary-xyz"], cwd=tmp_path)
+    assert proc.returncode == 127
+
+
+def test_parse_porcelain_v2() -> None:
+    out = "\n".join(
+        [
+            "# branch.oid 0123abcd",
+            "# branch.head codex/task-1",
+            "# branch.upstream origin/codex/task-1",
+            "1 .M N... 100644 100644 100644 aaa bbb file.txt",
+        ]
+    )
+    status = parse_porcelain_v2(out)
+    assert status.branch == "codex/task-1"
+    assert status.head == "0123abcd"
+    assert status.has_changes
+
+    detached = parse_porcelain_v2("# branch.oid (initial)\n# branch.head (detached)\n")
+    assert detached.branch == "HEAD"
+    assert detached.head == ""
+    assert not detached.has_changes
+
+
+def test_git_status_single_call(tmp_path: Path, init_git_repo) -> None:
+    head = init_git_repo(tmp_path)
+
+    status = git_status(cwd=tmp_path)
+    assert status.branch == "main"
+    assert status.head == head
+    assert not status.has_changes
+
+    (tmp_path / "new.txt").write_text("x", encoding="utf-8")
+    assert git_status(cwd=tmp_path).has_changes
+
+
+def test_git_head_commit_does_not_scan_the_worktree(tmp_path: Path, init_git_repo, monkeypatch) -> None:
+    from tools.orchestrator import orchestrate
+
+    head = init_git_repo(tmp_path)
+    monkeypatch.setattr(orchestrate, "git_status", lambda **_: pytest.fail("git status used to read HEAD"))
+
+    assert orchestrate.git_head_commit(cwd=tmp_path) == head
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from tools.orchestrator.orchestrate import (
+    TaskPack,
+    _next_attempt_number,
+    checkout_resume_branch,
+    completed_phases,
+    expected_resume_head,
+    record_phase_checkpoint,
+    run_acceptance,
+)
+
+
+def test_phase_checkpoints_replace_same_phase() -> None:
+    manifest: dict = {"result": "started"}
+    record_phase_checkpoint(manifest, phase="planner", attempt=1, commit="aaa")
+    record_phase_checkpoint(manifest, phase="implementer", attempt=2, commit="bbb")
+    record_phase_checkpoint(manifest, phase="planner", attempt=3, commit="ccc")
+
+    assert completed_phases(manifest) == {"planner", "implementer"}
+    assert manifest["checkpoints"] == [
+        {"phase": "implementer", "attempt": 2, "commit": "bbb"},
+        {"phase": "planner", "attempt": 3, "commit": "ccc"},
+    ]
+
+
+def test_next_attempt_number_continues_after_existing_logs(tmp_path: Path) -> None:
+    assert _next_attempt_number(tmp_path, "verifier") == 1
+    (tmp_path / "verifier_attempt1.log").write_text("", encoding="utf-8")
+    (tmp_path / "verifier_attempt2.log").write_text("", encoding="utf-8")
+    assert _next_attempt_number(tmp_path, "verifier") == 3
+
+
+def test_acceptance_sections_reused_when_inputs_unchanged(tmp_path: Path, init_git_repo) -> None:
+    repo = tmp_path / "repo"
+    init_git_repo(repo)
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    counter = tmp_path / "counter.txt"
+    tp = TaskPack(
+        path=repo,
+        task={},
+        spec="",
+        risk="",
+        acceptance={"lint": {"commands": [f"echo run >> {counter}"]}},
+    )
+
+    checkpoints: dict = {}
+    first = run_acceptance(tp, workspace_root=repo, log_dir=log_dir, checkpoints=checkpoints)
+    second = run_acceptance(tp, workspace_root=repo, log_dir=log_dir, checkpoints=checkpoints)
+
+    assert [r["status"] for r in first] == ["pass"]
+    assert second == first
+    assert counter.read_text(encoding="utf-8").count("run") == 1
+
+    (repo / "src.txt").write_text("changed", encoding="utf-8")
+    run_acceptance(tp, workspace_root=repo, log_dir=log_dir, checkpoints=checkpoints)
+    assert counter.read_text(encoding="utf-8").count("run") == 2
+
+
+def test_expected_resume_head_prefers_last_recorded_commit() -> None:
+    manifest: dict = {}
+    assert expected_resume_head(manifest) is None
+    record_phase_checkpoint(manifest, phase="planner", attempt=1, commit="aaa")
+    record_phase_checkpoint(manifest, phase="implementer", attempt=1, commit="bbb")
+    assert expected_resume_head(manifest) == "bbb"
+    manifest["head_commit"] = "ccc"  # e.g. partial commit after a failed phase
+    assert expected_resume_head(manifest) == "ccc"
+
+
+def test_resume_fetches_branch_that_only_exists_on_origin(tmp_path: Path, init_git_repo, git) -> None:
+    origin = tmp_path / "origin"
+    init_git_repo(origin)
+    git(origin, "checkout", "-q", "-b", "codex/run-1")
+    (origin / "plan.md").write_text("plan", encoding="utf-8")
+    git(origin, "add", "-A")
+    git(origin, "commit", "-q", "-m", "planner")
+    planner = git(origin, "rev-parse", "HEAD")
+    git(origin, "checkout", "-q", "-")
+    runner = tmp_path / "runner"
+    git(tmp_path, "clone", "-q", str(origin), str(runner))
+
+    checkout_resume_branch("codex/run-1", expected_head=planner, cwd=runner)
+
+    assert git(runner, "rev-parse", "HEAD") == planner
+    assert (runner / "plan.md").is_file()
+
+
+def test_resume_refuses_when_checkpoint_commit_is_not_head(tmp_path: Path, init_git_repo, git) -> None:
+    repo = tmp_path / "repo"
+    base = init_git_repo(repo)
+
+    # Branch missing everywhere: it would be recreated from base without the phase commits.
+    with pytest.raises(SystemExit, match="not found locally or on origin"):
+        checkout_resume_branch("codex/run-1", expected_head="0" * 40, cwd=repo)
+
+    git(repo, "branch", "codex/run-1")
+    with pytest.raises(SystemExit, match="last checkpoint"):
+        checkout_resume_branch("codex/run-1", expected_head="0" * 40, cwd=repo)
+
+    # A run that crashed before its first commit can start the branch from base.
+    checkout_resume_branch("codex/run-2", expected_head=None, cwd=repo)
+    assert git(repo, "rev-parse", "HEAD") == base
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+
+from tools.orchestrator import orchestrate
+from tools.orchestrator.orchestrate import count_changed_lines, evidence_excludes, run_phase_with_retries
+from tools.orchestrator.retry import (
+    RetryPolicy,
+    SignatureTracker,
+    backoff_delay,
+    error_signature,
+    load_retry_policy,
+)
+
+
+def test_policy_file_loads() -> None:
+    policy = load_retry_policy()
+    assert policy.max_attempts == 2
+    assert policy.repeat_error_signature_limit == 2
+    assert policy.max_total_changed_lines == 800
+    assert policy.backoff_base_seconds == 2
+
+
+def test_backoff_is_jittered_and_capped() -> None:
+    rng = random.Random(7)
+    for attempt in range(1, 8):
+        ceiling = min(10.0, 1.0 * 2 ** (attempt - 1))
+        delay = backoff_delay(attempt, base=1.0, cap=10.0, rng=rng)
+        assert ceiling / 2 <= delay <= ceiling
+
+
+def test_error_signature_masks_volatile_tokens() -> None:
+    first = "step 1\nError: timeout after 31.2s in /tmp/abc123/run (commit deadbeefcafe)\n"
+    second = "step 1\nError: timeout after 58.9s in /tmp/zzz999/run (commit 0123456789ab)\n"
+    other = "step 1\nError: permission denied\n"
+    assert error_signature(first) == error_signature(second)
+    assert error_signature(first) != error_signature(other)
+
+
+def test_signature_tracker_limit() -> None:
+    tracker = SignatureTracker(2)
+    assert tracker.observe("a") is False
+    assert tracker.observe("b") is False
+    assert tracker.observe("a") is True
+
+
+def test_phase_retries_stop_on_repeated_signature(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+
+    def fake_exec(prompt, *, log_name, cwd, log_dir):
+        calls.append(log_name)
+        return 1, "fatal: same deterministic failure\n"
+
+    monkeypatch.setattr(orchestrate, "codex_exec", fake_exec)
+    records: list = []
+    sleeps: list = []
+
+    ok, attempt, reason = run_phase_with_retries(
+        "prompt",
+        "planner",
+        policy=RetryPolicy(repeat_error_signature_limit=2, backoff_base_seconds=1, backoff_max_seconds=4),
+        max_attempts=5,
+        first_attempt=1,
+        cwd=tmp_path,
+        log_dir=tmp_path,
+        on_attempt=records.append,
+        sleep=sleeps.append,
+    )
+
+    assert not ok
+    assert attempt == 2
+    assert calls == ["planner_attempt1", "planner_attempt2"]
+    assert reason is not None and "repeated 2 times" in reason
+    assert len(sleeps) == 1
+    assert records[0]["signature"] == records[1]["signature"]
+    assert "retry_delay_s" in records[0]
+    assert all("duration_s" in r for r in records)
+
+
+def test_phase_retries_succeed_after_transient_failure(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    results = iter([(1, "network blip\n"), (0, "done\n")])
+    monkeypatch.setattr(orchestrate, "codex_exec", lambda *a, **k: next(results))
+    records: list = []
+
+    ok, attempt, reason = run_phase_with_retries(
+        "prompt",
+        "implementer",
+        policy=RetryPolicy(),
+        max_attempts=3,
+        first_attempt=4,
+        cwd=tmp_path,
+        log_dir=tmp_path,
+        on_attempt=records.append,
+        sleep=lambda _: None,
+    )
+
+    assert ok
+    assert attempt == 5
+    assert reason is None
+    assert [r["returncode"] for r in records] == [1, 0]
+
+
+def test_changed_lines_count_skips_in_repo_evidence(tmp_path: Path, init_git_repo, git) -> None:
+    base = init_git_repo(tmp_path, files={"a.txt": "base\n"})
+    (tmp_path / "a.txt").write_text("".join(f"line {i}\n" for i in range(10)), encoding="utf-8")
+    (tmp_path / "evidence" / "run").mkdir(parents=True)
+    (tmp_path / "evidence" / "run" / "log.txt").write_text("x\n" * 50, encoding="utf-8")
+    git(tmp_path, "add", "-A")
+    git(tmp_path, "commit", "-m", "grow")
+
+    exclude = evidence_excludes(tmp_path / "evidence", workspace_root=tmp_path)
+    assert exclude == ("evidence",)
+    assert count_changed_lines(workspace_root=tmp_path, base_ref=base, exclude=exclude) == 11
+    assert count_changed_lines(workspace_root=tmp_path, base_ref=base) == 61
+    assert evidence_excludes(tmp_path.parent / "elsewhere", workspace_root=tmp_path) == ()
+
+
+def test_phase_retries_record_json_events(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    summary = {"usage": {"output_tokens": 7}, "tool_calls": {"command_execution": 2}, "slowest_steps": []}
+    monkeypatch.setattr(orchestrate, "codex_exec_json", lambda *a, **k: (0, "done\n", summary))
+    records: list = []
+
+    ok, _, _ = run_phase_with_retries(
+        "prompt",
+        "planner",
+        policy=RetryPolicy(),
+        max_attempts=1,
+        first_attempt=1,
+        cwd=tmp_path,
+        log_dir=tmp_path,
+        on_attempt=records.append,
+        sleep=lambda _: None,
+        json_events=True,
+    )
+
+    assert ok
+    assert records[0]["events"] == summary
@@ -4,3 +4,65 @@ def test_load_echo_plugin():
     taskpack = {"plugin": "solutions.security.echo.plugin:EchoPlugin"}
     plugin = load_plugin(taskpack)
     assert plugin.id() == "security/echo"
+
+
+def test_registry_caches_class_and_capabilities():
+    from tools.orchestrator.plugins.loader import PluginRegistry
+
+    spec = "solutions.security.echo.plugin:EchoPlugin"
+    registry = PluginRegistry()
+    first = registry.load({"plugin": spec})
+    second = registry.load({"plugin": spec})
+
+    assert first is not second
+    assert registry.imports == 1
+    assert registry.resolve(spec).plugin_id == "security/echo"
+    assert registry.resolve(spec).capabilities.requires_network is False
+
+
+def test_registry_reuses_instances_when_enabled():
+    from tools.orchestrator.plugins.loader import PluginRegistry
+
+    registry = PluginRegistry(reuse_instances=True)
+    taskpack = {"plugin": "solutions.security.echo.plugin:EchoPlugin"}
+    assert registry.load(taskpack) is registry.load(taskpack)
+
+
+def test_registry_prewarm_reports_broken_specs():
+    from tools.orchestrator.plugins.loader import PluginRegistry
+
+    registry = PluginRegistry()
+    results = registry.prewarm(
+        [
+            {"plugin": "solutions.security.echo.plugin:EchoPlugin"},
+            {"plugin": "solutions.security.echo.plugin:EchoPlugin"},
+            {"plugin": "solutions.does_not_exist:Plugin"},
+            {"id": "TASK-NO-PLUGIN"},
+        ]
+    )
+
+    assert results["solutions.security.echo.plugin:EchoPlugin"] is None
+    assert "Failed importing plugin module" in results["solutions.does_not_exist:Plugin"]
+    assert registry.imports == 1
+
+
+def test_registry_hands_out_the_validated_instance(monkeypatch):
+    from solutions.security.echo.plugin import EchoPlugin
+    from tools.orchestrator.plugins.loader import PluginRegistry
+
+    created = []
+    original_init = EchoPlugin.__init__
+
+    def counting_init(self, *args, **kwargs):
+        created.append(self)
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(EchoPlugin, "__init__", counting_init)
+    registry = PluginRegistry()
+    taskpack = {"plugin": "solutions.security.echo.plugin:EchoPlugin"}
+
+    first = registry.load(taskpack)
+    assert created == [first]
+    second = registry.load(taskpack)
+    assert second is not first
+    assert len(created) == 2
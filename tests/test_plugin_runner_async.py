@@ -0,0 +1,137 @@
+import asyncio
+import json
+import os
+import tempfile
+import time
+
+import pytest
+
+from tools.orchestrator.plugins.executor import StepExecutionError, group_steps
+from tools.orchestrator.plugins.interface import ExecutionContext, Plan, PluginCapabilities, RawOutput, ValidationReport
+from tools.orchestrator.plugins.loader import PluginRegistry
+from tools.orchestrator.plugins.runner import run_plugin
+
+
+class SleepyStepsPlugin:
+    def id(self):
+        return "test/sleepy"
+
+    def version(self):
+        return "0.0.1"
+
+    def capabilities(self):
+        return PluginCapabilities(produces_domain_result=False)
+
+    def validate(self, taskpack, ctx):
+        return ValidationReport(ok=True)
+
+    def plan(self, taskpack, ctx):
+        steps = [{"action": "sleep", "name": f"s{i}", "independent": True} for i in range(4)]
+        steps.append({"action": "fail" if taskpack.get("fail") else "sleep", "name": "final"})
+        return Plan(steps=steps)
+
+    async def run_step(self, step, ctx, progress):
+        if step["action"] == "fail":
+            raise ValueError("boom")
+        progress("halfway")
+        await asyncio.sleep(0.2)
+        path = os.path.join(ctx.artifact_dir, f"{step['name']}.txt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(step["name"])
+        return RawOutput(artifacts=[path], metadata={step["name"]: "ok"})
+
+    def report(self, raw, ctx):
+        return []
+
+
+def _ctx(d):
+    return ExecutionContext(
+        run_id="test",
+        taskpack_path=d,
+        workspace_dir=d,
+        constraints={},
+        artifact_dir=os.path.join(d, "artifacts"),
+        log=lambda *_: None,
+    )
+
+
+def test_group_steps_batches_consecutive_independent_steps():
+    steps = [{"independent": True}, {"independent": True}, {}, {"independent": True}, {}]
+    assert group_steps(steps) == [[0, 1], [2], [3], [4]]
+
+
+def test_async_steps_run_concurrently_and_record_durations():
+    taskpack = {"plugin": f"{__name__}:SleepyStepsPlugin"}
+    with tempfile.TemporaryDirectory() as d:
+        ctx = _ctx(d)
+        started = time.monotonic()
+        result = run_plugin(taskpack, ctx, registry=PluginRegistry())
+        elapsed = time.monotonic() - started
+
+        # Four independent 0.2s steps in parallel, then the final step.
+        assert elapsed < 0.8
+        assert result["status"] == "OK"
+        assert result["raw"]["artifacts"] == [f"s{i}.txt" for i in range(4)] + ["final.txt"]
+        execution = result["execution"]
+        assert execution["mode"] == "async_steps"
+        assert [s["status"] for s in execution["steps"]] == ["completed"] * 5
+        assert all(s["duration_s"] >= 0.2 for s in execution["steps"])
+
+        with open(os.path.join(ctx.artifact_dir, "plugin_result.json"), encoding="utf-8") as f:
+            assert json.load(f)["execution"]["steps"][0]["action"] == "sleep"
+        with open(os.path.join(ctx.artifact_dir, "plugin_progress.jsonl"), encoding="utf-8") as f:
+            statuses = [json.loads(line)["status"] for line in f]
+        assert statuses.count("started") == 5
+        assert statuses.count("progress") == 5
+
+
+def test_failed_step_records_result_and_raises():
+    taskpack = {"plugin": f"{__name__}:SleepyStepsPlugin", "fail": True}
+    with tempfile.TemporaryDirectory() as d:
+        ctx = _ctx(d)
+        with pytest.raises(StepExecutionError, match="boom"):
+            run_plugin(taskpack, ctx, registry=PluginRegistry())
+
+        with open(os.path.join(ctx.artifact_dir, "plugin_result.json"), encoding="utf-8") as f:
+            result = json.load(f)
+        assert result["status"] == "RUN_FAILED"
+        assert result["execution"]["steps"][-1]["status"] == "failed"
+        assert result["execution"]["steps"][-1]["error"] == "ValueError: boom"
+
+
+def test_sync_plugin_records_run_duration_only():
+    taskpack = {"plugin": "solutions.security.echo.plugin:EchoPlugin"}
+    with tempfile.TemporaryDirectory() as d:
+        ctx = _ctx(d)
+        result = run_plugin(taskpack, ctx, registry=PluginRegistry())
+        assert result["execution"]["mode"] == "sync"
+        assert "steps" not in result["execution"]
+        assert not os.path.exists(os.path.join(ctx.artifact_dir, "plugin_progress.jsonl"))
+
+
+class StepAbort(BaseException):
+    pass
+
+
+class InterruptedStepPlugin(SleepyStepsPlugin):
+    def plan(self, taskpack, ctx):
+        return Plan(steps=[{"action": "interrupt", "name": "only"}])
+
+    async def run_step(self, step, ctx, progress):
+        raise StepAbort()
+
+
+def test_interrupted_step_reports_cancelled_and_keeps_the_original_error():
+    from tools.orchestrator.plugins.executor import execute_plan
+
+    events = []
+    with tempfile.TemporaryDirectory() as d:
+        with pytest.raises(StepAbort):
+            execute_plan(
+                InterruptedStepPlugin(),
+                Plan(steps=[{"action": "interrupt", "name": "only"}]),
+                _ctx(d),
+                on_progress=events.append,
+            )
+
+    assert [e.status for e in events] == ["started", "cancelled"]
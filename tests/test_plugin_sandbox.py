@@ -0,0 +1,98 @@
+import json
+import os
+import subprocess
+import tempfile
+
+import pytest
+
+from tools.orchestrator.plugins.interface import ExecutionContext, Plan, PluginCapabilities, RawOutput, ValidationReport
+from tools.orchestrator.plugins.loader import PluginRegistry
+from tools.orchestrator.plugins.runner import run_plugin
+from tools.orchestrator.plugins.sandbox import PluginSandboxError, SandboxLimits
+
+
+class HungryPlugin:
+    """Behaviour is chosen by taskpack['mode']: print, spin or allocate."""
+
+    def id(self):
+        return "test/hungry"
+
+    def version(self):
+        return "0.0.1"
+
+    def capabilities(self):
+        return PluginCapabilities(produces_domain_result=False)
+
+    def validate(self, taskpack, ctx):
+        return ValidationReport(ok=True)
+
+    def plan(self, taskpack, ctx):
+        return Plan(steps=[{"action": taskpack["mode"]}])
+
+    def run(self, plan, ctx):
+        action = plan.steps[0]["action"]
+        if action == "spin":
+            while True:
+                pass
+        if action == "allocate":
+            blob = bytearray(512 * 1024 * 1024)
+            return RawOutput(metadata={"size": len(blob)})
+        print("noise on stdout must not break the protocol")
+        os.write(1, b"fd-level noise without a newline ")
+        subprocess.run(["echo", "child process noise"], check=True)
+        ctx.log("hello from worker", os.getpid())
+        return RawOutput(artifacts=[os.path.join(ctx.artifact_dir, "x.txt")], metadata={"pid": os.getpid()})
+
+    def report(self, raw, ctx):
+        return []
+
+
+def _run(d, mode, limits, logs):
+    ctx = ExecutionContext(
+        run_id="test",
+        taskpack_path=d,
+        workspace_dir=d,
+        constraints={},
+        artifact_dir=os.path.join(d, "artifacts"),
+        log=lambda *args: logs.append(" ".join(str(a) for a in args)),
+    )
+    return run_plugin({"plugin": f"{__name__}:HungryPlugin", "mode": mode}, ctx, registry=PluginRegistry(), sandbox=limits)
+
+
+def test_sandbox_runs_plan_out_of_process_and_records_resources():
+    logs = []
+    with tempfile.TemporaryDirectory() as d:
+        result = _run(d, "print", SandboxLimits(cpu_seconds=10, memory_mb=1024), logs)
+
+        assert result["status"] == "OK"
+        assert result["raw"]["metadata"]["pid"] != os.getpid()
+        assert result["raw"]["artifacts"] == ["x.txt"]
+        assert any(line.startswith("hello from worker") for line in logs)
+        resources = result["resources"]
+        assert resources["exit_code"] == 0
+        assert resources["limits"] == {"cpu_seconds": 10, "memory_mb": 1024}
+        assert resources["max_rss_kb"] > 0
+        with open(os.path.join(d, "artifacts", "plugin_worker.stderr.log"), encoding="utf-8") as f:
+            stderr_log = f.read()
+        assert "noise on stdout" in stderr_log
+        assert "fd-level noise" in stderr_log
+        assert "child process noise" in stderr_log
+
+
+def test_sandbox_cpu_limit_kills_runaway_plugin():
+    with tempfile.TemporaryDirectory() as d:
+        with pytest.raises(PluginSandboxError, match="SIGXCPU|SIGKILL") as info:
+            _run(d, "spin", SandboxLimits(cpu_seconds=1), [])
+
+        assert info.value.resources["signal"] in ("SIGXCPU", "SIGKILL")
+        assert info.value.resources["cpu_user_s"] >= 0.5
+        with open(os.path.join(d, "artifacts", "plugin_result.json"), encoding="utf-8") as f:
+            result = json.load(f)
+        assert result["status"] == "RUN_FAILED"
+        assert result["resources"]["signal"] == info.value.resources["signal"]
+
+
+def test_sandbox_memory_limit_surfaces_memory_error():
+    with tempfile.TemporaryDirectory() as d:
+        with pytest.raises(PluginSandboxError, match="MemoryError"):
+            _run(d, "allocate", SandboxLimits(memory_mb=256), [])
@@ -0,0 +1,164 @@
+import os
+import tempfile
+
+from tools.orchestrator.plugins.interface import ExecutionContext, Plan, PluginCapabilities, RawOutput, ValidationReport
+from tools.orchestrator.plugins.loader import PluginRegistry
+from tools.orchestrator.plugins.runner import run_plugin
+from tools.orchestrator.plugins.step_cache import StepCache, step_cache_key
+
+CALLS = []
+
+
+class _Base:
+    def id(self):
+        return "test/cached"
+
+    def version(self):
+        return "1.0.0"
+
+    def capabilities(self):
+        return PluginCapabilities(produces_domain_result=False)
+
+    def validate(self, taskpack, ctx):
+        return ValidationReport(ok=True)
+
+    def report(self, raw, ctx):
+        return []
+
+
+def _write(ctx, name, content):
+    path = os.path.join(ctx.artifact_dir, name)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return path
+
+
+class AsyncCachedPlugin(_Base):
+    def plan(self, taskpack, ctx):
+        return Plan(
+            steps=[
+                {"action": "render", "name": "a.txt", "content": taskpack.get("content", "A"), "cacheable": True},
+                {"action": "render", "name": "b.txt", "content": "B"},
+            ]
+        )
+
+    async def run_step(self, step, ctx, progress):
+        CALLS.append(step["name"])
+        return RawOutput(artifacts=[_write(ctx, step["name"], step["content"])])
+
+
+class SyncCachedPlugin(_Base):
+    def capabilities(self):
+        return PluginCapabilities(produces_domain_result=False, accepts_partial_plans=True)
+
+    def plan(self, taskpack, ctx):
+        return Plan(
+            steps=[
+                {"action": "render", "name": "a.txt", "cacheable": True, "outputs": ["a.txt"]},
+                {"action": "render", "name": "b.txt"},
+            ]
+        )
+
+    def run(self, plan, ctx):
+        CALLS.extend(step["name"] for step in plan.steps)
+        return RawOutput(artifacts=[_write(ctx, step["name"], step["name"]) for step in plan.steps])
+
+
+class SyncFullPlanPlugin(SyncCachedPlugin):
+    def capabilities(self):
+        return PluginCapabilities(produces_domain_result=False)
+
+
+class AsyncNoOutputPlugin(_Base):
+    def plan(self, taskpack, ctx):
+        return Plan(steps=[{"action": "noop", "name": "a.txt", "cacheable": True}])
+
+    async def run_step(self, step, ctx, progress):
+        CALLS.append(step["name"])
+        return None
+
+
+def _ctx(d, run_id):
+    return ExecutionContext(
+        run_id=run_id,
+        taskpack_path=d,
+        workspace_dir=d,
+        constraints={},
+        artifact_dir=os.path.join(d, run_id),
+        log=lambda *_: None,
+    )
+
+
+def test_step_cache_key_is_canonical():
+    a = step_cache_key(plugin_id="p", plugin_version="1", step={"x": 1, "y": [1, 2]})
+    b = step_cache_key(plugin_id="p", plugin_version="1", step={"y": [1, 2], "x": 1})
+    assert a == b
+    assert a != step_cache_key(plugin_id="p", plugin_version="2", step={"x": 1, "y": [1, 2]})
+    assert step_cache_key(plugin_id="p", plugin_version="1", step={"x": object()}) is None
+
+
+def test_async_cacheable_steps_are_restored_on_rerun():
+    CALLS.clear()
+    taskpack = {"plugin": f"{__name__}:AsyncCachedPlugin"}
+    with tempfile.TemporaryDirectory() as d:
+        cache = StepCache(os.path.join(d, "cache"))
+        first = run_plugin(taskpack, _ctx(d, "run1"), registry=PluginRegistry(), step_cache=cache)
+        second = run_plugin(taskpack, _ctx(d, "run2"), registry=PluginRegistry(), step_cache=cache)
+
+        assert CALLS == ["a.txt", "b.txt", "b.txt"]
+        assert first["execution"]["step_cache"] == {"hits": 0, "misses": 1}
+        assert second["execution"]["step_cache"] == {"hits": 1, "misses": 0}
+        assert [s["status"] for s in second["execution"]["steps"]] == ["cached", "completed"]
+        with open(os.path.join(d, "run2", "a.txt"), encoding="utf-8") as f:
+            assert f.read() == "A"
+
+        changed = run_plugin(
+            dict(taskpack, content="A2"), _ctx(d, "run3"), registry=PluginRegistry(), step_cache=cache
+        )
+        assert changed["execution"]["step_cache"] == {"hits": 0, "misses": 1}
+
+
+def test_sync_plugin_runs_only_uncached_steps():
+    CALLS.clear()
+    taskpack = {"plugin": f"{__name__}:SyncCachedPlugin"}
+    with tempfile.TemporaryDirectory() as d:
+        cache = StepCache(os.path.join(d, "cache"))
+        run_plugin(taskpack, _ctx(d, "run1"), registry=PluginRegistry(), step_cache=cache)
+        second = run_plugin(taskpack, _ctx(d, "run2"), registry=PluginRegistry(), step_cache=cache)
+
+        assert CALLS == ["a.txt", "b.txt", "b.txt"]
+        assert second["execution"]["step_cache"] == {"hits": 1, "misses": 0}
+        assert sorted(second["raw"]["artifacts"]) == ["a.txt", "b.txt"]
+        assert os.path.exists(os.path.join(d, "run2", "a.txt"))
+
+
+def test_without_cache_plan_runs_unchanged():
+    CALLS.clear()
+    with tempfile.TemporaryDirectory() as d:
+        result = run_plugin({"plugin": f"{__name__}:SyncCachedPlugin"}, _ctx(d, "run1"), registry=PluginRegistry())
+        assert CALLS == ["a.txt", "b.txt"]
+        assert "step_cache" not in result["execution"]
+
+
+def test_sync_plugin_without_opt_in_always_gets_the_full_plan():
+    CALLS.clear()
+    taskpack = {"plugin": f"{__name__}:SyncFullPlanPlugin"}
+    with tempfile.TemporaryDirectory() as d:
+        cache = StepCache(os.path.join(d, "cache"))
+        run_plugin(taskpack, _ctx(d, "run1"), registry=PluginRegistry(), step_cache=cache)
+        second = run_plugin(taskpack, _ctx(d, "run2"), registry=PluginRegistry(), step_cache=cache)
+
+        assert CALLS == ["a.txt", "b.txt", "a.txt", "b.txt"]
+        assert second["execution"]["step_cache"] == {"hits": 0, "misses": 0}
+
+
+def test_step_returning_none_is_not_cached():
+    CALLS.clear()
+    taskpack = {"plugin": f"{__name__}:AsyncNoOutputPlugin"}
+    with tempfile.TemporaryDirectory() as d:
+        cache = StepCache(os.path.join(d, "cache"))
+        run_plugin(taskpack, _ctx(d, "run1"), registry=PluginRegistry(), step_cache=cache)
+        second = run_plugin(taskpack, _ctx(d, "run2"), registry=PluginRegistry(), step_cache=cache)
+
+        assert CALLS == ["a.txt", "a.txt"]
+        assert second["execution"]["step_cache"] == {"hits": 0, "misses": 1}
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from tools.orchestrator.orchestrate import TaskPack, build_prompt_context, phase_prompt, render_common_context
+from tools.orchestrator.prompt_context import check_budget, prompt_stats
+
+
+def _tp(tmp_path: Path, spec: str = "Build the thing.") -> TaskPack:
+    return TaskPack(
+        path=tmp_path / "TASK-1",
+        task={"id": "TASK-1", "title": "Example"},
+        spec=spec,
+        risk="Low.",
+        acceptance={"tests": {"commands": ["python -m pytest -q"]}},
+    )
+
+
+def test_context_written_once_content_addressed(tmp_path: Path) -> None:
+    tp = _tp(tmp_path)
+    out_dir = tmp_path / "ctx"
+
+    first = build_prompt_context(tp, out_dir=out_dir)
+    second = build_prompt_context(tp, out_dir=out_dir)
+
+    assert first.path == second.path
+    assert first.path.name == f"{first.sha256}.md"
+    assert first.path.read_text(encoding="utf-8") == render_common_context(tp)
+    assert len(list(out_dir.iterdir())) == 1
+    assert set(first.section_bytes) == {"taskpack", "spec", "risk", "acceptance"}
+    assert first.oversized == []
+
+
+def test_phase_prompt_references_context_path(tmp_path: Path) -> None:
+    tp = _tp(tmp_path, spec="S" * 5000)
+    context = build_prompt_context(tp, out_dir=tmp_path / "ctx")
+
+    by_ref = phase_prompt(tp, "verifier", context=context)
+    inline = phase_prompt(tp, "verifier")
+
+    assert str(context.path.as_posix()) in by_ref
+    assert "S" * 5000 not in by_ref
+    assert "S" * 5000 in inline
+    assert prompt_stats(by_ref)["bytes"] < prompt_stats(inline)["bytes"]
+
+
+def test_budget_reports_oversized_sections(tmp_path: Path) -> None:
+    tp = _tp(tmp_path, spec="x" * 300)
+    context = build_prompt_context(tp, out_dir=tmp_path / "ctx", budget_bytes=200)
+
+    assert "spec" in context.oversized
+    assert "total" in context.oversized
+    assert context.manifest_entry()["section_bytes"]["spec"] == 300
+    assert check_budget({"a": 1}, total_bytes=1, budget_bytes=10) == []
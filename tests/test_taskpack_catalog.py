@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from tools.taskpacks.catalog import REQUIRED_FILES, TaskpackCatalog, TaskpackError
+
+
+def _write_pack(root: Path, name: str, *, skip: tuple[str, ...] = ()) -> Path:
+    tp = root / name
+    tp.mkdir(parents=True)
+    files = {
+        "task.yml": f"id: {name}\ntitle: Demo\nconstraints:\n  allow_network: false\n",
+        "spec.md": "spec",
+        "risk.md": "risk",
+        "acceptance.yml": "tests:\n  commands:\n    - python -m pytest -q\n",
+        "runbook.md": "runbook",
+    }
+    for filename, text in files.items():
+        if filename not in skip:
+            (tp / filename).write_text(text, encoding="utf-8")
+    return tp
+
+
+def test_load_parses_each_file_once(tmp_path: Path) -> None:
+    tp_path = _write_pack(tmp_path, "TASK-1")
+    catalog = TaskpackCatalog()
+
+    first = catalog.load(tp_path)
+    second = catalog.load(tp_path)
+
+    assert first.id == "TASK-1"
+    assert first.acceptance["tests"]["commands"] == ["python -m pytest -q"]
+    assert second.task is first.task
+    assert catalog.parses == 2  # task.yml + acceptance.yml
+    assert catalog.reads == 4
+
+
+def test_changed_file_is_reloaded(tmp_path: Path) -> None:
+    tp_path = _write_pack(tmp_path, "TASK-1")
+    catalog = TaskpackCatalog()
+    assert catalog.load(tp_path).title == "Demo"
+
+    task_yml = tp_path / "task.yml"
+    task_yml.write_text("id: TASK-1\ntitle: Renamed\n", encoding="utf-8")
+    st = task_yml.stat()
+    os.utime(task_yml, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    assert catalog.load(tp_path).title == "Renamed"
+    assert catalog.parses == 3
+
+
+def test_strict_load_reports_missing_and_invalid_files(tmp_path: Path) -> None:
+    catalog = TaskpackCatalog()
+    with pytest.raises(TaskpackError, match="missing required file"):
+        catalog.load(_write_pack(tmp_path, "TASK-1", skip=("spec.md",)))
+
+    broken = _write_pack(tmp_path, "TASK-2")
+    (broken / "acceptance.yml").write_text("tests: [unclosed\n", encoding="utf-8")
+    with pytest.raises(TaskpackError, match="Failed to parse YAML"):
+        catalog.load(broken)
+
+    lenient = catalog.load(broken, strict=False)
+    assert lenient.acceptance == {}
+    assert lenient.errors and lenient.errors[0].startswith("acceptance.yml:")
+
+
+def test_load_all_is_sorted_and_non_strict(tmp_path: Path) -> None:
+    _write_pack(tmp_path, "TASK-2", skip=("runbook.md", "risk.md"))
+    _write_pack(tmp_path, "TASK-1")
+    _write_pack(tmp_path, "templates")
+
+    packs = TaskpackCatalog().load_all(tmp_path, max_workers=2)
+
+    assert [tp.path.name for tp in packs] == ["TASK-1", "TASK-2"]
+    assert packs[0].missing == ()
+    assert packs[1].missing == tuple(f for f in REQUIRED_FILES if f in ("risk.md", "runbook.md"))
+
+
+def test_non_strict_load_records_unreadable_files(tmp_path: Path) -> None:
+    tp_path = _write_pack(tmp_path, "TASK-1")
+    (tp_path / "spec.md").write_bytes(b"\xff\xfe not utf-8 \x80")
+    catalog = TaskpackCatalog()
+
+    lenient = catalog.load(tp_path, strict=False)
+    assert lenient.spec == ""
+    assert lenient.errors and lenient.errors[0].startswith("spec.md:")
+
+    with pytest.raises(TaskpackError, match="Failed to read"):
+        catalog.load(tp_path)
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from tools.acceptance import check_artifact_contains_any, token_search
+
+
+def test_search_is_case_insensitive_without_lowering(tmp_path: Path) -> None:
+    path = tmp_path / "run.log"
+    path.write_bytes("prefix\nRESULT: Déterministe OK\n".encode("utf-8"))
+
+    assert token_search.TokenSearcher(["result"]).search_file(path)
+    assert token_search.TokenSearcher(["DÉTERMINISTE"]).search_file(path)
+    assert not token_search.TokenSearcher(["missing", "absent"]).search_file(path)
+
+
+def test_binary_files_are_skipped_and_size_cap_applies(tmp_path: Path) -> None:
+    binary = tmp_path / "core"
+    binary.write_bytes(b"\x7fELF\x00\x00status pass")
+    late = tmp_path / "big.log"
+    late.write_bytes(b"x" * 4096 + b"status\n")
+    empty = tmp_path / "empty.txt"
+    empty.write_bytes(b"")
+
+    searcher = token_search.TokenSearcher(["status"], max_bytes_per_file=1024)
+    assert not searcher.search_file(binary)
+    assert not searcher.search_file(late)
+    assert not searcher.search_file(empty)
+    assert token_search.TokenSearcher(["status"]).search_file(late)
+
+    stats = searcher.stats
+    assert (stats.files, stats.binary_skipped, stats.truncated, stats.bytes_searched) == (3, 1, 1, 1024)
+
+
+def test_cli_stops_at_first_hit_and_reports_timings(tmp_path: Path, capsys, monkeypatch) -> None:
+    (tmp_path / "a.txt").write_text("nothing\n", encoding="utf-8")
+    (tmp_path / "b.md").write_text("Deterministic run\n", encoding="utf-8")
+    (tmp_path / "c.log").write_text("deterministic again\n", encoding="utf-8")
+    (tmp_path / "blob").write_bytes(b"\x00deterministic")
+
+    searched: list[str] = []
+    original = token_search.TokenSearcher.search_file
+
+    def tracking(self, path, **kwargs):
+        searched.append(Path(path).name)
+        return original(self, path, **kwargs)
+
+    monkeypatch.setattr(token_search.TokenSearcher, "search_file", tracking)
+    code = check_artifact_contains_any.main(["--path", str(tmp_path), "--any", "deterministic", "--timings"])
+
+    out = capsys.readouterr().out
+    assert code == 0
+    assert searched == ["a.txt", "b.md"]
+    assert f"[acceptance] OK: token match found in {tmp_path / 'b.md'}" in out
+    assert "[acceptance] timings: 2 file(s)" in out
+
+
+def test_cli_binary_only_tree_has_no_match(tmp_path: Path, capsys) -> None:
+    (tmp_path / "blob").write_bytes(b"\x00deterministic")
+
+    code = check_artifact_contains_any.main(["--path", str(tmp_path), "--any", "deterministic"])
+
+    assert code == 3
+    assert "none of tokens ['deterministic']" in capsys.readouterr().out
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import subprocess
 from pathlib import Path
 
 import pytest
@@ -11,6 +10,7 @@ from tools.orchestrator.orchestrate import (
     enforce_scope_allowed_paths,
     select_workspace_spec,
 )
+from tools.orchestrator import workspaces
 from tools.orchestrator.workspaces import (
     WorkspaceRegistryError,
     evidence_paths,
@@ -23,17 +23,6 @@ def _write_registry(path: Path, content: str) -> None:
     path.write_text(content, encoding="utf-8")
 
 
-def _init_git_repo(path: Path) -> None:
-    subprocess.run(["git", "init"], cwd=path, check=True)
-    subprocess.run(["git", "config", "user.email", "test@example.com"], cwd=path, check=True)
-    subprocess.run(["git", "config", "user.name", "Test User"], cwd=path, check=True)
-
-
-def _commit_all(path: Path, message: str) -> None:
-    subprocess.run(["git", "add", "-A"], cwd=path, check=True)
-    subprocess.run(["git", "commit", "-m", message], cwd=path, check=True)
-
-
 def test_workspace_registry_loads_valid(tmp_path: Path) -> None:
     registry_path = tmp_path / "registry.yml"
     _write_registry(
@@ -226,20 +215,14 @@ def test_docs_required_check(tmp_path: Path) -> None:
     ensure_required_docs(tp, workspace_root=workspace_root)
 
 
-def test_scope_allowed_paths_enforced(tmp_path: Path) -> None:
+def test_scope_allowed_paths_enforced(tmp_path: Path, init_git_repo, git) -> None:
     repo = tmp_path / "repo"
-    repo.mkdir()
-    _init_git_repo(repo)
-    (repo / "README.md").write_text("base", encoding="utf-8")
-    _commit_all(repo, "base")
-    base_ref = (
-        subprocess.run(["git", "rev-parse", "HEAD"], cwd=repo, check=True, capture_output=True, text=True)
-        .stdout.strip()
-    )
+    base_ref = init_git_repo(repo)
 
     (repo / "src").mkdir()
     (repo / "src" / "ok.txt").write_text("ok", encoding="utf-8")
-    _commit_all(repo, "allowed change")
+    git(repo, "add", "-A")
+    git(repo, "commit", "-m", "allowed change")
 
     tp = TaskPack(
         path=tmp_path,
@@ -251,20 +234,14 @@ def test_scope_allowed_paths_enforced(tmp_path: Path) -> None:
     enforce_scope_allowed_paths(tp, workspace_root=repo, base_ref=base_ref)
 
 
-def test_scope_allowed_paths_violation(tmp_path: Path) -> None:
+def test_scope_allowed_paths_violation(tmp_path: Path, init_git_repo, git) -> None:
     repo = tmp_path / "repo"
-    repo.mkdir()
-    _init_git_repo(repo)
-    (repo / "README.md").write_text("base", encoding="utf-8")
-    _commit_all(repo, "base")
-    base_ref = (
-        subprocess.run(["git", "rev-parse", "HEAD"], cwd=repo, check=True, capture_output=True, text=True)
-        .stdout.strip()
-    )
+    base_ref = init_git_repo(repo)
 
     (repo / "secrets").mkdir()
     (repo / "secrets" / "nope.txt").write_text("nope", encoding="utf-8")
-    _commit_all(repo, "bad change")
+    git(repo, "add", "-A")
+    git(repo, "commit", "-m", "bad change")
 
     tp = TaskPack(
         path=tmp_path,
@@ -275,3 +252,62 @@ def test_scope_allowed_paths_violation(tmp_path: Path) -> None:
     )
     with pytest.raises(SystemExit):
         enforce_scope_allowed_paths(tp, workspace_root=repo, base_ref=base_ref)
+
+
+def test_compiled_registry_is_keyed_by_file_hash(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    workspace_root = tmp_path / "repo"
+    workspace_root.mkdir()
+    registry_path = tmp_path / "registry.yml"
+    body = f"""
+version: 1
+defaults:
+  kind: local_path
+  evidence_mode: in_repo
+  acceptance:
+    - python -m pytest -q
+workspaces:
+  alpha:
+    path: {workspace_root.as_posix()}
+"""
+    _write_registry(registry_path, body)
+    cache_dir = tmp_path / "cache"
+
+    compiled = workspaces.compile_workspace_registry(registry_path, cache_dir=cache_dir)
+    assert compiled.workspaces["alpha"]["acceptance"] == ["python -m pytest -q"]
+    assert compiled.workspaces["alpha"]["evidence_mode"] == "in_repo"
+    assert (cache_dir / f"workspace-registry-{compiled.sha256}.json").is_file()
+
+    # A fresh process (empty in-memory cache) reuses the on-disk form without parsing.
+    monkeypatch.setattr(workspaces, "_COMPILED", {})
+    monkeypatch.setattr(workspaces, "_parse_registry", lambda *a, **k: pytest.fail("registry re-parsed"))
+    resolved = resolve_workspace(
+        spec="alpha", registry_path=registry_path, default_root=tmp_path, cache_dir=cache_dir
+    )
+    assert resolved.root == workspace_root.resolve()
+    assert resolved.acceptance == ["python -m pytest -q"]
+    monkeypatch.undo()
+
+    _write_registry(registry_path, body.replace("in_repo", "external_dir", 1))
+    with pytest.raises(WorkspaceRegistryError):
+        workspaces.compile_workspace_registry(registry_path, cache_dir=cache_dir)
+
+
+def test_validate_workspace_paths_reports_missing_roots(tmp_path: Path) -> None:
+    present = tmp_path / "present"
+    present.mkdir()
+    registry_path = tmp_path / "registry.yml"
+    entries = "".join(
+        f"  ws{i}:\n    path: {(present if i % 2 == 0 else tmp_path / f'missing{i}').as_posix()}\n"
+        for i in range(20)
+    )
+    _write_registry(
+        registry_path,
+        "version: 1\ndefaults:\n  kind: local_path\n  evidence_mode: in_repo\nworkspaces:\n" + entries,
+    )
+
+    problems = workspaces.validate_workspace_paths(
+        workspaces.compile_workspace_registry(registry_path), max_workers=4
+    )
+
+    assert sorted(problems) == sorted(f"ws{i}" for i in range(1, 20, 2))
+    assert problems["ws1"] == [f"path is not a directory: {tmp_path / 'missing1'}"]
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from tools.orchestrator.orchestrate import TaskPack, _rebase_taskpack, git_checkout_branch, isolated_worktree
+from tools.orchestrator.worktrees import LOCK_FILENAME, WorktreePool
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_pool_creates_isolated_worktrees(tmp_path: Path, init_git_repo, git) -> None:
+    repo = tmp_path / "repo"
+    base = init_git_repo(repo)
+    pool = WorktreePool(repo, pool_dir=tmp_path / "pool", max_size=2)
+
+    first = pool.acquire("HEAD")
+    second = pool.acquire("HEAD")
+
+    assert first.path != second.path
+    assert first.base_ref == base
+    assert not first.reused
+    assert git(first.path, "rev-parse", "HEAD") == base
+
+    (first.path / "scratch.txt").write_text("change", encoding="utf-8")
+    assert not (repo / "scratch.txt").exists()
+    assert git(repo, "status", "--porcelain") == ""
+
+    pool.release(first)
+    pool.release(second)
+
+
+def test_pool_reuses_released_worktree_clean(tmp_path: Path, init_git_repo, git) -> None:
+    repo = tmp_path / "repo"
+    init_git_repo(repo)
+    pool = WorktreePool(repo, pool_dir=tmp_path / "pool", max_size=2)
+
+    wt = pool.acquire("HEAD")
+    git(wt.path, "checkout", "-b", "codex/run-1")
+    (wt.path / "scratch.txt").write_text("change", encoding="utf-8")
+    pool.release(wt)
+
+    again = pool.acquire("HEAD")
+    assert again.reused
+    assert again.path == wt.path
+    assert not (again.path / "scratch.txt").exists()
+    # The run branch is no longer checked out, so it can be reused elsewhere.
+    git(repo, "checkout", "codex/run-1")
+    pool.release(again)
+
+
+def test_pool_size_zero_discards_worktree(tmp_path: Path, init_git_repo, git) -> None:
+    repo = tmp_path / "repo"
+    init_git_repo(repo)
+    pool = WorktreePool(repo, pool_dir=tmp_path / "pool", max_size=0)
+
+    wt = pool.acquire("HEAD")
+    pool.release(wt)
+
+    assert not wt.path.exists()
+    assert str(wt.path) not in git(repo, "worktree", "list")
+
+
+def _crash_holding_slot(repo: Path, pool_dir: Path, branch: str) -> Path:
+    """Runs a process that takes a slot, commits on `branch` in it and dies without releasing."""
+    script = textwrap.dedent(
+        f"""
+        import os, subprocess, sys
+        sys.path.insert(0, {str(ROOT)!r})
+        from pathlib import Path
+        from tools.orchestrator.worktrees import WorktreePool
+        wt = WorktreePool(Path({str(repo)!r}), pool_dir=Path({str(pool_dir)!r})).acquire("HEAD")
+        subprocess.run(["git", "checkout", "-q", "-b", {branch!r}], cwd=wt.path, check=True)
+        (wt.path / "planner.txt").write_text("plan", encoding="utf-8")
+        subprocess.run(["git", "add", "-A"], cwd=wt.path, check=True)
+        subprocess.run(["git", "commit", "-q", "-m", "planner"], cwd=wt.path, check=True)
+        print(wt.path)
+        os._exit(1)
+        """
+    )
+    proc = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+    assert proc.returncode == 1, proc.stderr
+    return Path(proc.stdout.strip())
+
+
+def test_stale_lock_from_dead_process_is_reclaimed(tmp_path: Path, init_git_repo) -> None:
+    repo = tmp_path / "repo"
+    init_git_repo(repo)
+    pool_dir = tmp_path / "pool"
+    leaked = _crash_holding_slot(repo, pool_dir, "codex/run-1")
+    assert (pool_dir / f"{leaked.name}{LOCK_FILENAME}").exists()
+
+    pool = WorktreePool(repo, pool_dir=pool_dir, max_size=2)
+    wt = pool.acquire("HEAD")
+
+    # The crashed run's slot is reused instead of growing the pool.
+    assert wt.path == leaked
+    assert wt.reused
+    assert sorted(p.name for p in pool_dir.iterdir() if p.is_dir()) == [leaked.name]
+    assert not (wt.path / "planner.txt").exists()
+    pool.release(wt)
+
+
+def test_live_lock_is_not_reclaimed(tmp_path: Path, init_git_repo) -> None:
+    repo = tmp_path / "repo"
+    init_git_repo(repo)
+    pool = WorktreePool(repo, pool_dir=tmp_path / "pool", max_size=2)
+
+    held = pool.acquire("HEAD")
+    other = pool.acquire("HEAD")
+
+    assert other.path != held.path
+    pool.release(other)
+    pool.release(held)
+
+
+def test_crashed_isolated_run_can_resume_on_its_branch(tmp_path: Path, init_git_repo, git) -> None:
+    repo = tmp_path / "repo"
+    init_git_repo(repo)
+    pool_dir = tmp_path / "pool"
+    # Another slot is free, so the resumed run does not land in the leaked one.
+    spare = WorktreePool(repo, pool_dir=pool_dir)
+    free = spare.acquire("HEAD")
+    _crash_holding_slot(repo, pool_dir, "codex/run-1")
+    spare.release(free)
+    planner_commit = git(repo, "rev-parse", "codex/run-1")
+
+    with isolated_worktree(True, repo_root=repo, base_ref="HEAD", pool_dir=pool_dir, pool_size=4) as wt:
+        assert wt is not None
+        git_checkout_branch("codex/run-1", cwd=wt.path)
+        assert git(wt.path, "rev-parse", "HEAD") == planner_commit
+        assert (wt.path / "planner.txt").read_text(encoding="utf-8") == "plan"
+
+
+def _write_taskpack(root: Path) -> Path:
+    tp_dir = root / "taskpacks" / "TASK-1"
+    tp_dir.mkdir(parents=True)
+    for name in ("task.yml", "spec.md", "risk.md", "acceptance.yml"):
+        (tp_dir / name).write_text(f"{name}\n", encoding="utf-8")
+    return tp_dir
+
+
+def test_rebase_taskpack_inside_workspace(tmp_path: Path) -> None:
+    tp_dir = _write_taskpack(tmp_path / "repo")
+    _write_taskpack(tmp_path / "wt")
+    tp = TaskPack(path=tp_dir, task={}, spec="", risk="", acceptance={})
+
+    moved = _rebase_taskpack(tp, old_root=tmp_path / "repo", new_root=tmp_path / "wt")
+    assert moved.path == tmp_path / "wt" / "taskpacks" / "TASK-1"
+
+    outside = _rebase_taskpack(tp, old_root=tmp_path / "other", new_root=tmp_path / "wt")
+    assert outside.path == tp.path
+
+
+def test_rebase_taskpack_requires_it_committed_at_base(tmp_path: Path) -> None:
+    tp_dir = _write_taskpack(tmp_path / "repo")
+    tp = TaskPack(path=tp_dir, task={}, spec="", risk="", acceptance={})
+    (tmp_path / "wt").mkdir()
+
+    with pytest.raises(SystemExit, match="directory missing"):
+        _rebase_taskpack(tp, old_root=tmp_path / "repo", new_root=tmp_path / "wt")
+
+    _write_taskpack(tmp_path / "wt")
+    (tp_dir / "spec.md").write_text("edited, not committed\n", encoding="utf-8")
+    with pytest.raises(SystemExit, match="files differ: spec.md"):
+        _rebase_taskpack(tp, old_root=tmp_path / "repo", new_root=tmp_path / "wt")
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import os
+import types
+from pathlib import Path
+
+import pytest
+import yaml
+
+from tools.common import yaml_loader
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_pick_loader_falls_back_without_libyaml() -> None:
+    no_libyaml = types.SimpleNamespace(SafeLoader=yaml.SafeLoader)
+    assert yaml_loader.pick_loader(no_libyaml) is yaml.SafeLoader
+    with_libyaml = types.SimpleNamespace(SafeLoader=yaml.SafeLoader, CSafeLoader=object)
+    assert yaml_loader.pick_loader(with_libyaml) is object
+
+
+def test_safe_load_rejects_unsafe_tags() -> None:
+    with pytest.raises(yaml.YAMLError):
+        yaml_loader.safe_load("!!python/object/apply:os.system ['true']")
+
+
+@pytest.mark.skipif(not hasattr(yaml, "CSafeLoader"), reason="PyYAML built without libyaml")
+def test_libyaml_matches_pure_python_for_repo_files() -> None:
+    paths = sorted((ROOT / "taskpacks").rglob("*.yml")) + [
+        ROOT / "workspaces" / "registry.yml",
+        ROOT / "tools" / "orchestrator" / "policy.yml",
+    ]
+    for path in paths:
+        text = path.read_text(encoding="utf-8")
+        assert yaml_loader.safe_load(text) == yaml.safe_load(text), path
+
+
+def test_load_file_cached_reloads_on_change(tmp_path: Path) -> None:
+    path = tmp_path / "policy.yml"
+    path.write_text("max_attempts_per_phase: 2\n", encoding="utf-8")
+    first = yaml_loader.load_file_cached(path)
+    assert yaml_loader.load_file_cached(path) is first
+
+    path.write_text("max_attempts_per_phase: 5\n", encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert yaml_loader.load_file_cached(path) == {"max_attempts_per_phase": 5}
@@ -3,31 +3,62 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 import sys
+import time
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tools.acceptance.token_search import TokenSearcher, iter_files  # noqa: E402
 
 TEXT_EXTS = {".txt", ".md", ".log", ".json", ".yml", ".yaml", ".csv"}
 
-def main() -> int:
+
+def is_candidate(path: Path) -> bool:
+    # Extension-less files are searched too; binary ones are skipped by content sniffing.
+    return path.suffix.lower() in TEXT_EXTS or path.suffix == ""
+
+
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--path", required=True)
     ap.add_argument("--any", nargs="+", required=True, help="Any of these tokens must appear (case-insensitive)")
-    args = ap.parse_args()
+    ap.add_argument(
+        "--max-bytes-per-file",
+        type=int,
+        default=None,
+        help="Only search the first N bytes of each file (default: whole file)",
+    )
+    ap.add_argument("--timings", action="store_true", help="Print files/bytes searched and elapsed time")
+    args = ap.parse_args(argv)
+    if args.max_bytes_per_file is not None and args.max_bytes_per_file <= 0:
+        ap.error("--max-bytes-per-file must be positive")
 
+    started = time.perf_counter()
     root = Path(args.path)
     tokens = [t.lower() for t in args.any]
+    searcher = TokenSearcher(tokens, max_bytes_per_file=args.max_bytes_per_file)
+
+    candidates = 0
+    match = None
+    if root.is_dir():
+        for f in iter_files(root):
+            if not is_candidate(f):
+                continue
+            candidates += 1
+            if searcher.search_file(f):
+                match = f
+                break
 
-    files = [f for f in root.rglob("*") if f.is_file() and (f.suffix.lower() in TEXT_EXTS or f.suffix == "")]
-    if not files:
+    if args.timings:
+        print(f"[acceptance] timings: {searcher.stats.format()}; {time.perf_counter() - started:.3f}s total")
+
+    if not candidates:
         print(f"[acceptance] FAIL: no readable artifact files under {root}")
         return 2
-
-    for f in files:
-        try:
-            data = f.read_text(encoding="utf-8", errors="ignore").lower()
-        except Exception:
-            continue
-        if any(t in data for t in tokens):
-            print(f"[acceptance] OK: token match found in {f}")
-            return 0
+    if match is not None:
+        print(f"[acceptance] OK: token match found in {match}")
+        return 0
 
     print(f"[acceptance] FAIL: none of tokens {tokens} found in artifacts under {root}")
     return 3
@@ -1,23 +1,35 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 import argparse
-import subprocess
+from pathlib import Path
 import sys
 
-def run(cmd: list[str]) -> str:
-    p = subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-    return p.stdout.strip()
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tools.common import git_diff  # noqa: E402
 
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--allowed", nargs="+", required=True, help="Allowed path prefixes (e.g., taskpacks/)")
+    ap.add_argument(
+        "--base-ref",
+        help="Check the branch diff <base-ref>...HEAD instead of uncommitted changes against HEAD",
+    )
     args = ap.parse_args()
 
     allowed = tuple(a if a.endswith("/") else a + "/" for a in args.allowed)
 
-    # Use staged+unstaged; in CI the working tree reflects changes
-    out = run(["git", "diff", "--name-only", "HEAD"])
-    files = [line.strip() for line in out.splitlines() if line.strip()]
+    # Default: staged+unstaged; in CI the working tree reflects changes
+    try:
+        if args.base_ref:
+            files = git_diff.changed_paths(args.base_ref, cwd=Path.cwd())
+        else:
+            files = git_diff.changed_paths("HEAD", None, cwd=Path.cwd())
+    except git_diff.GitDiffError as exc:
+        print(f"[acceptance] FAIL: unable to compute git diff: {exc}")
+        return 2
 
     violations = [f for f in files if not f.startswith(allowed)]
     if violations:
@@ -1,38 +1,19 @@
 #!/usr/bin/env python3
 from __future__ import annotations
-import argparse
 from pathlib import Path
 import sys
 
-FORBIDDEN = ["playtest", "feels", "fun", "looks good", "subjective"]
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
 
-SKIP_DIRS = {".git", ".orchestrator_logs", ".venv", "node_modules", "dist", "build", "__pycache__","tools/acceptance"}
+from tools.acceptance.language_scan import RULES, main as scan_main  # noqa: E402
 
-def main() -> int:
-    ap = argparse.ArgumentParser()
-    ap.add_argument("--path", required=True)
-    args = ap.parse_args()
-
-    root = Path(args.path)
-    hits = []
+FORBIDDEN = list(RULES["qualitative"].phrases)
 
-    for p in root.rglob("*"):
-        if any(part in SKIP_DIRS for part in p.parts):
-            continue
-        if p.is_file() and p.suffix.lower() in {".md", ".txt", ".yml", ".yaml"}:
-            data = p.read_text(encoding="utf-8", errors="ignore").lower()
-            for pat in FORBIDDEN:
-                if pat in data:
-                    hits.append((str(p), pat))
 
-    if hits:
-        print("[acceptance] FAIL: subjective/playtest language detected:")
-        for f, pat in hits[:50]:
-            print(f" - {f}: {pat}")
-        return 2
-
-    print("[acceptance] OK: no subjective/playtest language detected")
-    return 0
+def main() -> int:
+    return scan_main(rules=["qualitative"])
 
 if __name__ == "__main__":
     sys.exit(main())
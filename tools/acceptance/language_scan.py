@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Forbidden-language scanning shared by check_no_qualitative_language.py,
+check_no_deploy_language.py and tools/review/run_review_checks.py.
+
+Every phrase of every rule is compiled into one regex alternation, so each
+file is read once and matched in a single pass regardless of how many rules
+apply to it. Matching is case-insensitive substring matching, as before.
+
+    python tools/acceptance/language_scan.py --rule qualitative --rule deploy --path docs
+"""
+from __future__ import annotations
+
+import argparse
+import bisect
+import dataclasses
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+SKIP_DIRS = {".git", ".orchestrator_logs", ".venv", "node_modules", "dist", "build", "__pycache__"}
+MAX_REPORTED_HITS = 50
+
+_SELF = Path(__file__).resolve()
+
+
+@dataclasses.dataclass(frozen=True)
+class LanguageRule:
+    name: str
+    phrases: Tuple[str, ...]
+    suffixes: frozenset
+    description: str
+
+
+@dataclasses.dataclass(frozen=True)
+class Hit:
+    rule: str
+    path: str
+    line: int
+    column: int
+    phrase: str
+
+    def format(self) -> str:
+        return f"{self.path}:{self.line}:{self.column}: {self.phrase}"
+
+
+RULES: Dict[str, LanguageRule] = {
+    rule.name: rule
+    for rule in (
+        LanguageRule(
+            name="qualitative",
+            phrases=("playtest", "feels", "fun", "looks good", "subjective"),
+            suffixes=frozenset({".md", ".txt", ".yml", ".yaml"}),
+            description="subjective/playtest language",
+        ),
+        LanguageRule(
+            name="deploy",
+            phrases=(
+                "kubectl apply",
+                "terraform apply",
+                "helm install",
+                "aws deploy",
+                "deploy to production",
+                "apply to cluster",
+            ),
+            suffixes=frozenset({".md", ".txt", ".yml", ".yaml", ".sh", ".ps1", ".py", ".js", ".ts"}),
+            description="deployment language",
+        ),
+    )
+}
+
+
+class LanguageScanner:
+    """
+    Single-pass matcher for a set of rules. A zero-width lookahead finds every
+    offset where any phrase starts (so overlapping phrases are all reported);
+    the phrases starting there are then confirmed against the lowered text.
+    """
+
+    def __init__(self, rules: Sequence[LanguageRule]) -> None:
+        self.rules = tuple(rules)
+        self._owners: Dict[str, Tuple[str, ...]] = {}
+        for rule in self.rules:
+            for phrase in rule.phrases:
+                key = phrase.lower()
+                self._owners[key] = self._owners.get(key, ()) + (rule.name,)
+        self._by_first: Dict[str, List[str]] = {}
+        for phrase in sorted(self._owners, key=len, reverse=True):
+            self._by_first.setdefault(phrase[0], []).append(phrase)
+        alternation = "|".join(re.escape(p) for p in sorted(self._owners, key=len, reverse=True))
+        self._pattern = re.compile(f"(?=(?:{alternation}))") if alternation else None
+        self._suffixes = frozenset().union(*(rule.suffixes for rule in self.rules)) if self.rules else frozenset()
+
+    def rules_for(self, path: Path) -> Tuple[str, ...]:
+        suffix = path.suffix.lower()
+        return tuple(rule.name for rule in self.rules if suffix in rule.suffixes)
+
+    def scan_text(self, text: str, *, path: str, rules: Optional[Iterable[str]] = None) -> List[Hit]:
+        wanted = set(rule.name for rule in self.rules) if rules is None else set(rules)
+        if self._pattern is None or not wanted:
+            return []
+        lowered = text.lower()
+        line_starts: Optional[List[int]] = None
+        hits: List[Hit] = []
+        for match in self._pattern.finditer(lowered):
+            pos = match.start()
+            for phrase in self._by_first.get(lowered[pos], ()):
+                if not lowered.startswith(phrase, pos):
+                    continue
+                if line_starts is None:
+                    line_starts = [0] + [i + 1 for i, ch in enumerate(lowered) if ch == "\n"]
+                line = bisect.bisect_right(line_starts, pos)
+                column = pos - line_starts[line - 1] + 1
+                for rule in self._owners[phrase]:
+                    if rule in wanted:
+                        hits.append(Hit(rule=rule, path=path, line=line, column=column, phrase=phrase))
+        return hits
+
+    def scan_file(self, path: Path, *, display: Optional[str] = None) -> List[Hit]:
+        rules = self.rules_for(path)
+        if not rules or path.resolve() == _SELF:
+            return []
+        try:
+            text = path.read_text(encoding="utf-8", errors="ignore")
+        except OSError:
+            return []
+        return self.scan_text(text, path=display if display is not None else str(path), rules=rules)
+
+    def iter_files(self, paths: Iterable[Path]) -> Iterator[Path]:
+        """Files under `paths` (directories are walked) with a suffix some rule scans."""
+        for root in paths:
+            root = Path(root)
+            if root.is_file():
+                candidates: Iterable[Path] = (root,)
+            elif root.is_dir():
+                candidates = sorted(root.rglob("*"))
+            else:
+                continue
+            for path in candidates:
+                if any(part in SKIP_DIRS for part in path.parts):
+                    continue
+                if path.suffix.lower() in self._suffixes and path.is_file():
+                    yield path
+
+    def scan(self, paths: Iterable[Path]) -> List[Hit]:
+        hits: List[Hit] = []
+        for path in self.iter_files(paths):
+            hits.extend(self.scan_file(path))
+        return hits
+
+
+def scanner_for(rule_names: Iterable[str]) -> LanguageScanner:
+    return LanguageScanner([RULES[name] for name in rule_names])
+
+
+def report(hits: Sequence[Hit], rule_names: Sequence[str]) -> Tuple[List[str], bool]:
+    """Acceptance-style output lines per rule, and whether any rule failed."""
+    lines: List[str] = []
+    failed = False
+    for name in rule_names:
+        rule = RULES[name]
+        rule_hits = [hit for hit in hits if hit.rule == name]
+        if rule_hits:
+            failed = True
+            lines.append(f"[acceptance] FAIL: {rule.description} detected:")
+            lines.extend(f" - {hit.format()}" for hit in rule_hits[:MAX_REPORTED_HITS])
+        else:
+            lines.append(f"[acceptance] OK: no {rule.description} detected")
+    return lines, failed
+
+
+def main(argv: Optional[List[str]] = None, *, rules: Optional[Sequence[str]] = None) -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--path", required=True, action="append", help="File or directory to scan (repeatable)")
+    if rules is None:
+        ap.add_argument("--rule", action="append", choices=sorted(RULES), help="Rule to apply (default: all)")
+    args = ap.parse_args(argv)
+
+    rule_names = list(rules if rules is not None else (args.rule or sorted(RULES)))
+    hits = scanner_for(rule_names).scan(Path(p) for p in args.path)
+    lines, failed = report(hits, rule_names)
+    print("\n".join(lines))
+    return 2 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
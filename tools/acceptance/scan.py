@@ -0,0 +1,406 @@
+#!/usr/bin/env python3
+"""
+Combined acceptance scanner: evaluates several acceptance checks over the
+same trees in one pass.
+
+Each rule mirrors one of the standalone scripts in this directory and keeps
+its output lines and exit code:
+
+    --present PATH                          check_artifacts_present.py
+    --contains-any PATH TOKEN [TOKEN ...]   check_artifact_contains_any.py
+    --engine-declared TASK_YML SPEC PATH    check_engine_declared_in_taskpack.py
+    --no-language RULE PATH                 check_no_<RULE>_language.py
+
+Every distinct tree is walked once and every file is read at most once
+(memory-mapped from MMAP_MIN_BYTES up), and only while some rule still
+needs its contents: a contains-any or engine rule stops reading after its
+first match. The process exits with the first non-zero rule exit code, in
+command-line order, so a single-rule invocation behaves exactly like the
+script it replaces.
+
+    python tools/acceptance/scan.py --present artifacts \\
+        --contains-any artifacts build test validate contract --no-language deploy .
+"""
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import mmap
+import os
+import re
+import sys
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple, Union
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tools.acceptance import language_scan  # noqa: E402
+from tools.acceptance.token_search import TokenSearcher  # noqa: E402
+
+MMAP_MIN_BYTES = 1 << 20
+# Same extension filter as check_artifact_contains_any.py (plus extension-less files).
+TEXT_EXTS = {".txt", ".md", ".log", ".json", ".yml", ".yaml", ".csv"}
+# Same tokens as check_engine_declared_in_taskpack.py.
+ENGINE_TOKENS = ("engine", "engine_version", "godot", "unity")
+
+Buffer = Union[bytes, mmap.mmap]
+
+
+@dataclasses.dataclass(frozen=True)
+class RuleResult:
+    label: str
+    exit_code: int
+    lines: List[str]
+
+
+def _contains(parent: str, child: str) -> bool:
+    return child == parent or child.startswith(parent.rstrip(os.sep) + os.sep)
+
+
+class _Content:
+    """One file's bytes, read (or mapped) once and shared by every rule."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._buffer: Optional[Buffer] = None
+        self._text: Optional[str] = None
+        self._language_hits: Optional[List[language_scan.Hit]] = None
+        self._file = None
+
+    @property
+    def buffer(self) -> Buffer:
+        if self._buffer is None:
+            self._file = open(self.path, "rb")
+            size = os.fstat(self._file.fileno()).st_size
+            if size >= MMAP_MIN_BYTES:
+                self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                self._buffer = self._file.read()
+        return self._buffer
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            # Universal newlines, as Path.read_text() gives the standalone scripts.
+            text = bytes(self.buffer).decode("utf-8", errors="ignore")
+            self._text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return self._text
+
+    def language_hits(self, scanner: language_scan.LanguageScanner) -> List[language_scan.Hit]:
+        if self._language_hits is None:
+            self._language_hits = scanner.scan_text(self.text, path=self.path)
+        return self._language_hits
+
+    def close(self) -> None:
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        if self._file is not None:
+            self._file.close()
+        self._buffer = self._file = None
+
+
+class Rule:
+    label = ""
+
+    def roots(self) -> List[str]:
+        """Absolute directories this rule walks."""
+        return []
+
+    def files(self) -> List[str]:
+        """Absolute paths of single files this rule reads."""
+        return []
+
+    def covers(self, path: str) -> bool:
+        return any(_contains(root, path) for root in self.roots())
+
+    def prunes(self, dirname: str) -> bool:
+        """Whether directories named `dirname` can be skipped for this rule."""
+        return False
+
+    def visit(self, path: str) -> None:
+        """Called for every file the rule covers, without reading it."""
+
+    def wants_content(self, path: str) -> bool:
+        return False
+
+    def observe(self, path: str, content: _Content) -> None:
+        pass
+
+    def result(self) -> RuleResult:
+        raise NotImplementedError
+
+
+class PresentRule(Rule):
+    def __init__(self, path: str) -> None:
+        self.arg = path
+        self.root = os.path.abspath(path)
+        self.label = f"present {path}"
+        self.count = 0
+
+    def roots(self) -> List[str]:
+        return [self.root] if os.path.isdir(self.root) else []
+
+    def visit(self, path: str) -> None:
+        self.count += 1
+
+    def result(self) -> RuleResult:
+        p = Path(self.arg)
+        if not os.path.isdir(self.root):
+            return RuleResult(self.label, 2, [f"[acceptance] FAIL: artifacts dir missing: {p}"])
+        if not self.count:
+            return RuleResult(self.label, 3, [f"[acceptance] FAIL: no artifacts found under: {p}"])
+        return RuleResult(self.label, 0, [f"[acceptance] OK: {self.count} artifact file(s) present under {p}"])
+
+
+class ContainsAnyRule(Rule):
+    def __init__(self, path: str, tokens: Sequence[str]) -> None:
+        self.arg = path
+        self.root = os.path.abspath(path)
+        self.tokens = [t.lower() for t in tokens]
+        self.label = f"contains-any {path}"
+        self._searcher = TokenSearcher(self.tokens)
+        self.candidates = 0
+        self.match: Optional[str] = None
+
+    def roots(self) -> List[str]:
+        return [self.root] if os.path.isdir(self.root) else []
+
+    def _candidate(self, path: str) -> bool:
+        suffix = Path(path).suffix
+        return suffix.lower() in TEXT_EXTS or suffix == ""
+
+    def visit(self, path: str) -> None:
+        if self._candidate(path):
+            self.candidates += 1
+
+    def wants_content(self, path: str) -> bool:
+        return self.match is None and self._candidate(path)
+
+    def observe(self, path: str, content: _Content) -> None:
+        if self._searcher.search_buffer(content.buffer):
+            self.match = os.path.join(self.arg, os.path.relpath(path, self.root))
+
+    def result(self) -> RuleResult:
+        if not self.candidates:
+            return RuleResult(self.label, 2, [f"[acceptance] FAIL: no readable artifact files under {Path(self.arg)}"])
+        if self.match is not None:
+            return RuleResult(self.label, 0, [f"[acceptance] OK: token match found in {Path(self.match)}"])
+        return RuleResult(
+            self.label,
+            3,
+            [f"[acceptance] FAIL: none of tokens {self.tokens} found in artifacts under {Path(self.arg)}"],
+        )
+
+
+class EngineDeclaredRule(Rule):
+    def __init__(self, task_yml: str, spec: str, artifact_path: str) -> None:
+        self.declared_files = [os.path.abspath(task_yml), os.path.abspath(spec)]
+        self.root = os.path.abspath(artifact_path)
+        self.label = "engine-declared"
+        self._searcher = TokenSearcher(ENGINE_TOKENS)
+        self.found = False
+
+    def roots(self) -> List[str]:
+        return [self.root] if os.path.isdir(self.root) else []
+
+    def files(self) -> List[str]:
+        return [f for f in self.declared_files if os.path.isfile(f)]
+
+    def covers(self, path: str) -> bool:
+        return path in self.declared_files or super().covers(path)
+
+    def wants_content(self, path: str) -> bool:
+        return not self.found
+
+    def observe(self, path: str, content: _Content) -> None:
+        # Like check_engine_declared_in_taskpack.py, any artifact file may declare the engine.
+        if self._searcher.search_buffer(content.buffer, skip_binary=False):
+            self.found = True
+
+    def result(self) -> RuleResult:
+        if not self.found:
+            return RuleResult(
+                self.label,
+                2,
+                [
+                    "[acceptance] FAIL: engine/version intent not declared (expected one of tokens: "
+                    + ", ".join(ENGINE_TOKENS)
+                    + ")"
+                ],
+            )
+        return RuleResult(self.label, 0, ["[acceptance] OK: engine/version intent declared"])
+
+
+class NoLanguageRule(Rule):
+    """One language_scan rule; all such rules share a single scanner so each file is matched once."""
+
+    def __init__(self, rule_name: str, path: str, scanner: language_scan.LanguageScanner) -> None:
+        self.rule = language_scan.RULES[rule_name]
+        self.arg = path
+        self.root = os.path.abspath(path)
+        self.label = f"no-language {rule_name} {path}"
+        self.scanner = scanner
+        self.hits: List[language_scan.Hit] = []
+
+    def roots(self) -> List[str]:
+        return [self.root] if os.path.isdir(self.root) else []
+
+    def files(self) -> List[str]:
+        return [self.root] if os.path.isfile(self.root) else []
+
+    def prunes(self, dirname: str) -> bool:
+        return dirname in language_scan.SKIP_DIRS
+
+    def _display(self, path: str) -> Path:
+        if path == self.root:
+            return Path(self.arg)
+        return Path(self.arg) / os.path.relpath(path, self.root)
+
+    def wants_content(self, path: str) -> bool:
+        display = self._display(path)
+        if display.suffix.lower() not in self.rule.suffixes:
+            return False
+        if any(part in language_scan.SKIP_DIRS for part in display.parts):
+            return False
+        return Path(path).resolve() != language_scan._SELF
+
+    def observe(self, path: str, content: _Content) -> None:
+        display = str(self._display(path))
+        self.hits.extend(
+            dataclasses.replace(hit, path=display) for hit in content.language_hits(self.scanner) if hit.rule == self.rule.name
+        )
+
+    def result(self) -> RuleResult:
+        lines, failed = language_scan.report(self.hits, [self.rule.name])
+        return RuleResult(self.label, 2 if failed else 0, lines)
+
+
+def _sort_key(top: str, path: str) -> Tuple[str, ...]:
+    # Matches the order of sorted(Path(top).rglob("*")) used by the standalone scripts.
+    return tuple(Path(os.path.relpath(path, top)).parts)
+
+
+def _walk(top: str, rules: Sequence[Rule]) -> List[str]:
+    files: List[str] = []
+    for dirpath, dirnames, filenames in os.walk(top):
+        kept = []
+        for name in dirnames:
+            child = os.path.join(dirpath, name)
+            for rule in rules:
+                if any(_contains(child, root) and root != child for root in rule.roots()):
+                    kept.append(name)  # leads to a deeper rule root
+                    break
+                if rule.covers(child) and not rule.prunes(name):
+                    kept.append(name)
+                    break
+        dirnames[:] = kept
+        files.extend(os.path.join(dirpath, name) for name in filenames)
+    files.sort(key=lambda path: _sort_key(top, path))
+    return files
+
+
+def run_rules(rules: Sequence[Rule]) -> List[RuleResult]:
+    roots = sorted({root for rule in rules for root in rule.roots()}, key=len)
+    tops: List[str] = []
+    for root in roots:
+        if not any(_contains(top, root) for top in tops):
+            tops.append(root)
+
+    seen: set = set()
+    ordered: List[str] = []
+    for top in tops:
+        for path in _walk(top, rules):
+            if path not in seen:
+                seen.add(path)
+                ordered.append(path)
+    for rule in rules:
+        for path in rule.files():
+            if path not in seen:
+                seen.add(path)
+                ordered.append(path)
+
+    for path in ordered:
+        covering = [rule for rule in rules if rule.covers(path)]
+        if not covering or not os.path.isfile(path):
+            continue
+        for rule in covering:
+            rule.visit(path)
+        readers = [rule for rule in covering if rule.wants_content(path)]
+        if not readers:
+            continue
+        content = _Content(path)
+        try:
+            for rule in readers:
+                if rule.wants_content(path):
+                    rule.observe(path, content)
+        except (OSError, ValueError):
+            pass  # unreadable files count as non-matching, as in the standalone scripts
+        finally:
+            content.close()
+    return [rule.result() for rule in rules]
+
+
+class _AppendRule(argparse.Action):
+    def __call__(self, parser, namespace, values, option_string=None):
+        specs = list(getattr(namespace, self.dest, None) or [])
+        specs.append((self.const, list(values)))
+        setattr(namespace, self.dest, specs)
+
+
+def build_rules(specs: Sequence[Tuple[str, List[str]]]) -> List[Rule]:
+    language_names = sorted({values[0] for kind, values in specs if kind == "no-language"})
+    scanner = language_scan.scanner_for(language_names)
+    rules: List[Rule] = []
+    for kind, values in specs:
+        if kind == "present":
+            rules.append(PresentRule(values[0]))
+        elif kind == "contains-any":
+            rules.append(ContainsAnyRule(values[0], values[1:]))
+        elif kind == "engine-declared":
+            rules.append(EngineDeclaredRule(*values))
+        elif kind == "no-language":
+            rules.append(NoLanguageRule(values[0], values[1], scanner))
+    return rules
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--present", dest="rules", action=_AppendRule, const="present", nargs=1, metavar="PATH")
+    ap.add_argument(
+        "--contains-any", dest="rules", action=_AppendRule, const="contains-any", nargs="+", metavar="PATH TOKEN"
+    )
+    ap.add_argument(
+        "--engine-declared",
+        dest="rules",
+        action=_AppendRule,
+        const="engine-declared",
+        nargs=3,
+        metavar=("TASK_YML", "SPEC", "ARTIFACT_PATH"),
+    )
+    ap.add_argument(
+        "--no-language", dest="rules", action=_AppendRule, const="no-language", nargs=2, metavar=("RULE", "PATH")
+    )
+    args = ap.parse_args(argv)
+
+    specs: List[Tuple[str, List[str]]] = args.rules or []
+    if not specs:
+        ap.error("at least one rule is required")
+    for kind, values in specs:
+        if kind == "contains-any" and len(values) < 2:
+            ap.error("--contains-any needs a PATH and at least one TOKEN")
+        if kind == "no-language" and values[0] not in language_scan.RULES:
+            ap.error(f"--no-language: unknown rule {values[0]!r} (choose from {', '.join(sorted(language_scan.RULES))})")
+
+    results = run_rules(build_rules(specs))
+    for result in results:
+        print("\n".join(result.lines))
+    if len(results) > 1:
+        for result in results:
+            print(f"[acceptance] scan: {result.label}: exit {result.exit_code}")
+    return next((result.exit_code for result in results if result.exit_code), 0)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
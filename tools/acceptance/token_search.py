@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Case-insensitive "any of these tokens" search over artifact files, shared
+by check_artifact_contains_any.py and scan.py.
+
+Files are memory-mapped and searched with one compiled bytes regex, so no
+decoded or lowered copy of a file is ever built and memory use does not grow
+with file size. Matching is case-insensitive: ASCII letters through
+re.IGNORECASE, other characters through their lower/upper-case UTF-8
+spellings. A search stops at the first hit, can be capped at a number of
+bytes per file, and skips binary files (a NUL byte within the first
+SNIFF_BYTES).
+"""
+from __future__ import annotations
+
+import dataclasses
+import mmap
+import os
+import re
+import time
+from pathlib import Path
+from typing import Iterator, Optional, Sequence, Union
+
+SNIFF_BYTES = 8192
+
+Buffer = Union[bytes, mmap.mmap]
+
+
+def _token_pattern(token: str) -> bytes:
+    parts = []
+    for ch in token:
+        variants = dict.fromkeys(v for v in (ch, ch.lower(), ch.upper()) if len(v) == 1)
+        if ch.isascii() or len(variants) == 1:
+            parts.append(re.escape(ch.encode("utf-8")))
+        else:
+            parts.append(b"(?:" + b"|".join(re.escape(v.encode("utf-8")) for v in variants) + b")")
+    return b"".join(parts)
+
+
+def is_binary(buffer: Buffer) -> bool:
+    return buffer.find(b"\0", 0, SNIFF_BYTES) != -1
+
+
+@dataclasses.dataclass
+class SearchStats:
+    files: int = 0
+    bytes_searched: int = 0
+    binary_skipped: int = 0
+    truncated: int = 0
+    unreadable: int = 0
+    elapsed_s: float = 0.0
+
+    def format(self) -> str:
+        return (
+            f"{self.files} file(s), {self.bytes_searched} byte(s) searched, "
+            f"{self.binary_skipped} binary skipped, {self.truncated} truncated, "
+            f"{self.unreadable} unreadable, {self.elapsed_s:.3f}s searching"
+        )
+
+
+class TokenSearcher:
+    def __init__(self, tokens: Sequence[str], *, max_bytes_per_file: Optional[int] = None) -> None:
+        if not tokens:
+            raise ValueError("at least one token is required")
+        self._pattern = re.compile(b"|".join(_token_pattern(t) for t in dict.fromkeys(tokens)), re.IGNORECASE)
+        self.max_bytes_per_file = max_bytes_per_file
+        self.stats = SearchStats()
+
+    def search_buffer(self, buffer: Buffer, *, skip_binary: bool = True) -> bool:
+        """Whether any token occurs in `buffer` (up to the per-file cap)."""
+        if skip_binary and is_binary(buffer):
+            self.stats.binary_skipped += 1
+            return False
+        end = len(buffer)
+        if self.max_bytes_per_file is not None and end > self.max_bytes_per_file:
+            end = self.max_bytes_per_file
+            self.stats.truncated += 1
+        self.stats.bytes_searched += end
+        return self._pattern.search(buffer, 0, end) is not None
+
+    def search_file(self, path: Path, *, skip_binary: bool = True) -> bool:
+        self.stats.files += 1
+        started = time.perf_counter()
+        try:
+            with open(path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return False
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                    return self.search_buffer(buffer, skip_binary=skip_binary)
+        except (OSError, ValueError):
+            self.stats.unreadable += 1
+            return False
+        finally:
+            self.stats.elapsed_s += time.perf_counter() - started
+
+
+def iter_files(root: Path) -> Iterator[Path]:
+    """Files under `root` in a stable order, yielded as the tree is walked."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            path = Path(dirpath) / name
+            if path.is_file():
+                yield path
@@ -0,0 +1 @@
+"""Local micro-benchmarks for orchestrator and review tooling (not run in CI)."""
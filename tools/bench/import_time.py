@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Import cost of a module measured with `python -X importtime`.
+
+Runs the import in a fresh interpreter and reports the module's cumulative
+import time plus the most expensive dependencies it pulled in.
+
+    python -m tools.bench.import_time tools.orchestrator.orchestrate --runs 5
+"""
+from __future__ import annotations
+
+import argparse
+import pathlib
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+
+
+def parse_importtime(stderr: str) -> Dict[str, int]:
+    """Maps each imported module to its cumulative import time in microseconds."""
+    cumulative: Dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            value = int(parts[1].strip())
+        except ValueError:
+            continue  # header row
+        cumulative[parts[2].strip()] = value
+    return cumulative
+
+
+def measure_imports(module: str) -> Dict[str, int]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=str(ROOT),
+        text=True,
+        capture_output=True,
+        check=True,
+    )
+    return parse_importtime(proc.stderr)
+
+
+def main(argv: List[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1] if __doc__ else None)
+    ap.add_argument("module", nargs="?", default="tools.orchestrator.orchestrate")
+    ap.add_argument("--runs", type=int, default=5)
+    ap.add_argument("--top", type=int, default=10)
+    args = ap.parse_args(argv)
+
+    runs = [measure_imports(args.module) for _ in range(args.runs)]
+    totals = [run.get(args.module, 0) / 1000.0 for run in runs]
+    print(f"{args.module:<52} median={statistics.median(totals):7.2f} ms  mean={statistics.mean(totals):7.2f} ms")
+    for name, value in sorted(runs[-1].items(), key=lambda kv: -kv[1])[1 : args.top + 1]:
+        print(f"  {name:<50} {value / 1000.0:7.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
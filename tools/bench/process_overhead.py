@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Per-call overhead of the orchestrator's git invocations.
+
+Compares the legacy `shell=True` string path against the argv path used by
+`tools.orchestrator.process`, and the batched `git status --porcelain=v2
+--branch` query against the separate rev-parse/status calls it replaces.
+
+    python -m tools.bench.process_overhead --iterations 50
+"""
+from __future__ import annotations
+
+import argparse
+import pathlib
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable, List
+
+from tools.orchestrator.process import git_status, run_process
+
+
+def _shell(cmd: str, cwd: pathlib.Path) -> None:
+    subprocess.run(cmd, cwd=str(cwd), shell=True, text=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+
+
+def _time(fn: Callable[[], None], iterations: int) -> List[float]:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return samples
+
+
+def _row(label: str, samples: List[float]) -> str:
+    return f"{label:<52} median={statistics.median(samples):7.2f} ms  mean={statistics.mean(samples):7.2f} ms"
+
+
+def main(argv: List[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1] if __doc__ else None)
+    ap.add_argument("--iterations", type=int, default=50)
+    ap.add_argument("--repo", default=".", help="Git repository to run against (default: CWD)")
+    args = ap.parse_args(argv)
+    cwd = pathlib.Path(args.repo).resolve()
+
+    def shell_single() -> None:
+        _shell("git rev-parse HEAD", cwd)
+
+    def argv_single() -> None:
+        run_process(["git", "rev-parse", "HEAD"], cwd=cwd)
+
+    def shell_queries() -> None:
+        _shell("git rev-parse --abbrev-ref HEAD", cwd)
+        _shell("git status --porcelain", cwd)
+        _shell("git rev-parse HEAD", cwd)
+
+    def argv_batched() -> None:
+        git_status(cwd=cwd)
+
+    cases = [
+        ("shell: git rev-parse HEAD", shell_single),
+        ("argv:  git rev-parse HEAD", argv_single),
+        ("shell: rev-parse --abbrev-ref + status + rev-parse", shell_queries),
+        ("argv:  status --porcelain=v2 --branch", argv_batched),
+    ]
+    print(f"iterations={args.iterations} repo={cwd}")
+    for label, fn in cases:
+        fn()  # warm caches
+        print(_row(label, _time(fn, args.iterations)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Parse time of every taskpack YAML file with the pure-Python and libyaml loaders.
+
+Texts are read once up front so only parsing is measured. The libyaml row is
+skipped when PyYAML was built without it.
+
+    python -m tools.bench.yaml_load --iterations 20
+"""
+from __future__ import annotations
+
+import argparse
+import pathlib
+import statistics
+import sys
+import time
+from typing import Any, Callable, List
+
+import yaml
+
+from tools.common.yaml_loader import pick_loader
+
+ROOT = pathlib.Path(__file__).resolve().parents[2]
+
+
+def _time(fn: Callable[[], None], iterations: int) -> List[float]:
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return samples
+
+
+def _row(label: str, samples: List[float]) -> str:
+    return f"{label:<28} median={statistics.median(samples):8.2f} ms  mean={statistics.mean(samples):8.2f} ms"
+
+
+def main(argv: List[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[1] if __doc__ else None)
+    ap.add_argument("--iterations", type=int, default=20)
+    ap.add_argument("--root", default=str(ROOT / "taskpacks"), help="Directory to collect *.yml/*.yaml from")
+    args = ap.parse_args(argv)
+
+    root = pathlib.Path(args.root).resolve()
+    paths = sorted(p for pattern in ("*.yml", "*.yaml") for p in root.rglob(pattern) if p.is_file())
+    texts = [p.read_text(encoding="utf-8") for p in paths]
+    total_kb = sum(len(t.encode("utf-8")) for t in texts) / 1024.0
+
+    def parse_all(loader: Any) -> Callable[[], None]:
+        def _run() -> None:
+            for text in texts:
+                yaml.load(text, Loader=loader)
+
+        return _run
+
+    cases = [("SafeLoader (pure Python)", yaml.SafeLoader)]
+    fast = pick_loader(yaml)
+    if fast is not yaml.SafeLoader:
+        cases.append((f"{fast.__name__} (libyaml)", fast))
+    else:
+        print("libyaml not available; CSafeLoader row skipped")
+
+    print(f"files={len(texts)} size={total_kb:.1f} KiB iterations={args.iterations} root={root}")
+    for label, loader in cases:
+        fn = parse_all(loader)
+        fn()  # warm caches
+        print(_row(label, _time(fn, args.iterations)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Helpers shared by the orchestrator, review and taskpack tooling."""
@@ -0,0 +1,227 @@
+"""
+Changed-files service shared by the orchestrator, review checks and
+acceptance tooling.
+
+One definition of "changed": `git diff <base>...<head>`, i.e. from the merge
+base of the two refs to `head`, with git's default rename detection (a
+rename is reported under its new path). Name-status and numstat are computed
+together once per (merge base, head) commit pair and reused in-process; with a
+cache directory (`ORCH_GIT_DIFF_CACHE_DIR`, set by the orchestrator to the
+run's evidence dir) they are also reused across processes.
+
+With `head_ref=None` the diff is `<base>` against the working tree; that
+result depends on uncommitted state and is never cached.
+"""
+from __future__ import annotations
+
+import dataclasses
+import json
+import os
+import subprocess
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+CACHE_DIR_ENV = "ORCH_GIT_DIFF_CACHE_DIR"
+CACHE_FORMAT = 1
+
+
+class GitDiffError(RuntimeError):
+    pass
+
+
+@dataclasses.dataclass(frozen=True)
+class FileChange:
+    path: str
+    # First letter of git's name-status code: A, C, D, M, R, T, U or X.
+    status: str
+    old_path: Optional[str] = None
+    # None for binary files, which numstat reports as "-".
+    added: Optional[int] = None
+    deleted: Optional[int] = None
+
+
+@dataclasses.dataclass(frozen=True)
+class DiffSummary:
+    base: str
+    head: Optional[str]
+    changes: Tuple[FileChange, ...]
+
+    @property
+    def paths(self) -> List[str]:
+        return [change.path for change in self.changes]
+
+    def changed_lines(self, *, exclude: Sequence[str] = ()) -> int:
+        """Added plus deleted lines, skipping binary files and paths under `exclude` prefixes."""
+        total = 0
+        for change in self.changes:
+            if any(_within(change.path, prefix) for prefix in exclude):
+                continue
+            total += (change.added or 0) + (change.deleted or 0)
+        return total
+
+    def format_stat(self) -> str:
+        """Plain `git diff --stat`-style summary (without the +/- bars)."""
+        if not self.changes:
+            return ""
+        width = max(len(change.path) for change in self.changes)
+        lines = []
+        for change in self.changes:
+            if change.added is None:
+                lines.append(f" {change.path.ljust(width)} | Bin")
+            else:
+                lines.append(f" {change.path.ljust(width)} | {change.added + (change.deleted or 0)}")
+        added = sum(change.added or 0 for change in self.changes)
+        deleted = sum(change.deleted or 0 for change in self.changes)
+        count = len(self.changes)
+        lines.append(
+            f" {count} file{'s' if count != 1 else ''} changed, {added} insertions(+), {deleted} deletions(-)"
+        )
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        return {
+            "format": CACHE_FORMAT,
+            "base": self.base,
+            "head": self.head,
+            "changes": [dataclasses.asdict(change) for change in self.changes],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DiffSummary":
+        return cls(
+            base=str(data["base"]),
+            head=data.get("head"),
+            changes=tuple(FileChange(**change) for change in data["changes"]),
+        )
+
+
+def _within(path: str, prefix: str) -> bool:
+    prefix = prefix.rstrip("/")
+    return path == prefix or path.startswith(prefix + "/")
+
+
+def _git(args: List[str], *, cwd: Path) -> str:
+    proc = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise GitDiffError((proc.stderr or proc.stdout).strip() or f"git {' '.join(args)} failed")
+    return proc.stdout
+
+
+def parse_name_status(output: str) -> List[Tuple[str, str, Optional[str]]]:
+    """(status, path, old_path) from `git diff --name-status -z`."""
+    fields = output.split("\0")
+    entries: List[Tuple[str, str, Optional[str]]] = []
+    i = 0
+    while i < len(fields) and fields[i]:
+        code = fields[i][0]
+        if code in ("R", "C"):
+            entries.append((code, fields[i + 2], fields[i + 1]))
+            i += 3
+        else:
+            entries.append((code, fields[i + 1], None))
+            i += 2
+    return entries
+
+
+def parse_numstat(output: str) -> Dict[str, Tuple[Optional[int], Optional[int]]]:
+    """Path -> (added, deleted) from `git diff --numstat -z`; renames are keyed by the new path."""
+    fields = output.split("\0")
+    stats: Dict[str, Tuple[Optional[int], Optional[int]]] = {}
+    i = 0
+    while i < len(fields) and fields[i]:
+        added, deleted, path = (fields[i].split("\t", 2) + ["", ""])[:3]
+        i += 1
+        if not path:  # rename/copy: the old and new paths follow as separate fields
+            path = fields[i + 1]
+            i += 2
+        stats[path] = (int(added) if added.isdigit() else None, int(deleted) if deleted.isdigit() else None)
+    return stats
+
+
+_MEMO: Dict[Tuple[str, str, Optional[str]], DiffSummary] = {}
+_MEMO_LOCK = threading.Lock()
+
+
+def default_cache_dir() -> Optional[Path]:
+    value = os.getenv(CACHE_DIR_ENV)
+    return Path(value) if value else None
+
+
+def diff_summary(
+    base_ref: str,
+    head_ref: Optional[str] = "HEAD",
+    *,
+    cwd: Path,
+    cache_dir: Optional[Path] = None,
+) -> DiffSummary:
+    """
+    Changes between `base_ref` and `head_ref` (three-dot semantics), or
+    between `base_ref` and the working tree when `head_ref` is None. Raises
+    GitDiffError when git fails (unknown ref, not a repository).
+    """
+    cwd = Path(cwd).resolve()
+    if cache_dir is None:
+        cache_dir = default_cache_dir()
+
+    if head_ref is None:
+        base = _git(["rev-parse", "--verify", f"{base_ref}^{{commit}}"], cwd=cwd).strip()
+        return _compute(base, None, cwd=cwd)
+
+    head = _git(["rev-parse", "--verify", f"{head_ref}^{{commit}}"], cwd=cwd).strip()
+    base = _git(["merge-base", base_ref, head], cwd=cwd).strip()
+    key = (str(cwd), base, head)
+    with _MEMO_LOCK:
+        cached = _MEMO.get(key)
+    if cached is not None:
+        return cached
+
+    cache_path = Path(cache_dir) / f"{base}..{head}.json" if cache_dir is not None else None
+    summary: Optional[DiffSummary] = None
+    if cache_path is not None:
+        try:
+            data = json.loads(cache_path.read_text(encoding="utf-8"))
+            if data.get("format") == CACHE_FORMAT:
+                summary = DiffSummary.from_dict(data)
+        except (OSError, ValueError, KeyError, TypeError):
+            summary = None
+    if summary is None:
+        summary = _compute(base, head, cwd=cwd)
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+                tmp.write_text(json.dumps(summary.to_dict(), sort_keys=True), encoding="utf-8")
+                tmp.replace(cache_path)
+            except OSError:
+                pass
+    with _MEMO_LOCK:
+        _MEMO[key] = summary
+    return summary
+
+
+def _compute(base: str, head: Optional[str], *, cwd: Path) -> DiffSummary:
+    revs = [base] if head is None else [base, head]
+    name_status = parse_name_status(_git(["diff", "--name-status", "-z", *revs, "--"], cwd=cwd))
+    numstat = parse_numstat(_git(["diff", "--numstat", "-z", *revs, "--"], cwd=cwd))
+    changes = []
+    for status, path, old_path in name_status:
+        added, deleted = numstat.get(path, (None, None))
+        changes.append(FileChange(path=path, status=status, old_path=old_path, added=added, deleted=deleted))
+    return DiffSummary(base=base, head=head, changes=tuple(changes))
+
+
+def changed_paths(
+    base_ref: str,
+    head_ref: Optional[str] = "HEAD",
+    *,
+    cwd: Path,
+    cache_dir: Optional[Path] = None,
+) -> List[str]:
+    return diff_summary(base_ref, head_ref, cwd=cwd, cache_dir=cache_dir).paths
+
+
+def clear_memo() -> None:
+    with _MEMO_LOCK:
+        _MEMO.clear()
+
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import functools
+from pathlib import Path
+from typing import Any, Tuple, Type
+
+
+def pick_loader(yaml_module: Any) -> Type[Any]:
+    """libyaml-backed CSafeLoader when PyYAML was built with it, else SafeLoader."""
+    return getattr(yaml_module, "CSafeLoader", None) or yaml_module.SafeLoader
+
+
+@functools.lru_cache(maxsize=None)
+def _loader() -> Type[Any]:
+    import yaml
+
+    return pick_loader(yaml)
+
+
+def loader_name() -> str:
+    return _loader().__name__
+
+
+def safe_load(text: str) -> Any:
+    """Drop-in for yaml.safe_load(text); both loaders accept the same (safe) tag set."""
+    import yaml
+
+    return yaml.load(text, Loader=_loader())
+
+
+def load_file(path: Path) -> Any:
+    return safe_load(Path(path).read_text(encoding="utf-8"))
+
+
+@functools.lru_cache(maxsize=64)
+def _load_file_cached(path: Path, stamp: Tuple[int, int]) -> Any:
+    return load_file(path)
+
+
+def load_file_cached(path: Path) -> Any:
+    """
+    load_file for files that are effectively immutable during a run
+    (taskpacks/schema.yml, tools/orchestrator/policy.yml). Results are
+    memoised per (path, mtime_ns, size), so an edited file is still re-read.
+    The returned object is shared and must not be mutated.
+    """
+    path = Path(path).resolve()
+    st = path.stat()
+    return _load_file_cached(path, (st.st_mtime_ns, st.st_size))
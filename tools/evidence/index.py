@@ -76,6 +76,17 @@ def _collect_artifacts(run_dir: Path, *, repo_root: Path) -> list[dict[str, obje
             )
         )
 
+    review_checks_path = run_dir / schemas.REVIEW_CHECKS_REPORT_FILENAME
+    if review_checks_path.is_file():
+        artifacts.append(
+            _artifact_entry(
+                "review_checks_report",
+                review_checks_path,
+                repo_root=repo_root,
+                schema_version=_extract_schema_version(review_checks_path),
+            )
+        )
+
     # Deterministic behavior: ignore all other files, including evidence_index.json.
     return sorted(artifacts, key=lambda a: (a["type"], a["path"]))
 
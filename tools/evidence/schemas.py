@@ -4,4 +4,5 @@ INDEX_SCHEMA_VERSION = 1
 
 MANIFEST_FILENAME = "manifest.json"
 REVIEW_REPORT_FILENAME = "review_report.json"
+REVIEW_CHECKS_REPORT_FILENAME = "review_checks_report.json"
 INDEX_FILENAME = "evidence_index.json"
@@ -73,3 +73,21 @@ def test_review_report_invalid_json_schema_version_null(tmp_path: Path) -> None:
     artifacts = index["runs"][0]["artifacts"]
     assert [artifact["type"] for artifact in artifacts] == ["manifest", "review_report"]
     assert [artifact["schema_version"] for artifact in artifacts] == [None, None]
+
+
+def test_review_checks_report_is_indexed(tmp_path: Path) -> None:
+    repo_root = tmp_path
+    logs_root = repo_root / ".orchestrator_logs"
+    run_dir = logs_root / "run-checks"
+
+    write_json(run_dir / schemas.MANIFEST_FILENAME, {"run_id": "checks"})
+    write_json(
+        run_dir / schemas.REVIEW_CHECKS_REPORT_FILENAME,
+        {"schema_version": 1, "summary": {"status": "pass"}, "stages": []},
+    )
+
+    index = evidence_index.build_index([logs_root], repo_root=repo_root)
+    artifacts = index["runs"][0]["artifacts"]
+    assert [artifact["type"] for artifact in artifacts] == ["manifest", "review_checks_report"]
+    assert artifacts[1]["path"] == ".orchestrator_logs/run-checks/review_checks_report.json"
+    assert artifacts[1]["schema_version"] == 1
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+CACHE_SCHEMA_VERSION = 1
+CACHEABLE_STATUSES = ("pass", "warning")
+
+
+def deps_hash(deps: List[str]) -> str:
+    return hashlib.sha256(json.dumps(list(deps)).encode("utf-8")).hexdigest()
+
+
+def cache_key(*, tree_hash: str, command: str, deps_digest: str) -> str:
+    payload = json.dumps(
+        {"schema_version": CACHE_SCHEMA_VERSION, "tree": tree_hash, "command": command, "deps": deps_digest},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class AcceptanceCache:
+    """
+    On-disk cache of acceptance command outcomes.
+
+    Entries are keyed by `cache_key(...)` and hold the recorded status plus the
+    command log, so a hit can be replayed without running the command. Only
+    `pass` and `warning` outcomes are stored; failures always re-run.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._entry_path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        if not isinstance(entry, dict) or entry.get("status") not in CACHEABLE_STATUSES:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, *, section: str, command: str, status: str, log: str) -> None:
+        if status not in CACHEABLE_STATUSES:
+            return
+        path = self._entry_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "schema_version": CACHE_SCHEMA_VERSION,
+            "section": section,
+            "command": command,
+            "status": status,
+            "log": log,
+        }
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(entry, sort_keys=True), encoding="utf-8")
+        tmp.replace(path)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"dir": str(self.root), "hits": self.hits, "misses": self.misses}
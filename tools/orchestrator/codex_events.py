@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import json
+import pathlib
+import subprocess
+import time
+from typing import Any, Callable, Dict, IO, Iterable, List, Optional, Tuple
+
+# Item types that represent the agent acting on the workspace rather than talking.
+TOOL_ITEM_TYPES = ("command_execution", "mcp_tool_call", "web_search", "file_change")
+COMPACT_TEXT_LIMIT = 200
+SLOWEST_STEPS = 5
+
+
+def _truncate(value: str, limit: int = COMPACT_TEXT_LIMIT) -> str:
+    return value if len(value) <= limit else value[:limit] + f"...(+{len(value) - limit} chars)"
+
+
+def _compact(value: Any) -> Any:
+    if isinstance(value, str):
+        return _truncate(value)
+    if isinstance(value, dict):
+        return {key: _compact(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_compact(item) for item in value]
+    return value
+
+
+def compact_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of an event with long strings (command output, messages) truncated, including inside lists."""
+    return _compact(event)
+
+
+def error_message(event: Dict[str, Any]) -> Optional[str]:
+    """Message of an `error` / `turn.failed` event (nested under `error.message` for the latter)."""
+    err = event.get("error")
+    message = err.get("message") if isinstance(err, dict) else event.get("message")
+    return str(message) if message else None
+
+
+def _step_label(item: Dict[str, Any]) -> str:
+    for key in ("command", "tool", "query", "text"):
+        value = item.get(key)
+        if isinstance(value, str) and value:
+            return _truncate(value, 80)
+    return str(item.get("type", "unknown"))
+
+
+class EventSummary:
+    """
+    Incremental aggregate over a `codex exec --json` event stream.
+
+    Tolerant of unknown event shapes: usage is summed from any `usage` object,
+    tool calls are counted from `item.started`/`item.completed` items, and step
+    latency is measured between an item's start and completion as observed by
+    the orchestrator.
+    """
+
+    def __init__(self) -> None:
+        self.events = 0
+        self.usage: Dict[str, int] = {}
+        self.tool_calls: Dict[str, int] = {}
+        self.errors: List[str] = []
+        self.steps: List[Dict[str, Any]] = []
+        self._started: Dict[str, float] = {}
+        self._last_at: Optional[float] = None
+
+    def feed(self, event: Dict[str, Any], *, received_at: float) -> None:
+        self.events += 1
+        etype = str(event.get("type", ""))
+
+        usage = event.get("usage")
+        if isinstance(usage, dict):
+            for key, value in usage.items():
+                if isinstance(value, int):
+                    self.usage[key] = self.usage.get(key, 0) + value
+
+        if etype in ("error", "turn.failed"):
+            self.errors.append(_truncate(error_message(event) or etype))
+
+        item = event.get("item")
+        if isinstance(item, dict):
+            item_id = str(item.get("id", ""))
+            item_type = str(item.get("type", "unknown"))
+            if etype == "item.started" and item_id:
+                self._started[item_id] = received_at
+            elif etype == "item.completed":
+                started_at = self._started.pop(item_id, None)
+                if started_at is None:
+                    # Completed without a start event: attribute the gap since
+                    # the previous event to this item.
+                    started_at = self._last_at if self._last_at is not None else received_at
+                if item_type in TOOL_ITEM_TYPES:
+                    self.tool_calls[item_type] = self.tool_calls.get(item_type, 0) + 1
+                self.steps.append(
+                    {
+                        "id": item_id,
+                        "type": item_type,
+                        "label": _step_label(item),
+                        "duration_s": round(max(received_at - started_at, 0.0), 3),
+                    }
+                )
+        self._last_at = received_at
+
+    def slowest_steps(self, n: int = SLOWEST_STEPS) -> List[Dict[str, Any]]:
+        return sorted(self.steps, key=lambda s: (-s["duration_s"], s["id"]))[:n]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "events": self.events,
+            "usage": dict(sorted(self.usage.items())),
+            "tool_calls": dict(sorted(self.tool_calls.items())),
+            "steps": len(self.steps),
+            "slowest_steps": self.slowest_steps(),
+            "errors": list(self.errors),
+        }
+
+
+def consume_stream(
+    lines: Iterable[str],
+    *,
+    events_out: IO[str],
+    text_out: IO[str],
+    clock: Callable[[], float] = time.monotonic,
+) -> EventSummary:
+    """
+    Parses a JSONL event stream line by line as it arrives. JSON events are
+    written compacted to `events_out`; anything else (warnings, plain output)
+    goes to `text_out` unchanged.
+    """
+    summary = EventSummary()
+    for line in lines:
+        stripped = line.strip()
+        if not stripped:
+            continue
+        try:
+            event = json.loads(stripped)
+        except ValueError:
+            text_out.write(line if line.endswith("\n") else line + "\n")
+            continue
+        if not isinstance(event, dict):
+            text_out.write(line if line.endswith("\n") else line + "\n")
+            continue
+        summary.feed(event, received_at=clock())
+        events_out.write(json.dumps(compact_event(event), sort_keys=True) + "\n")
+        # Keep errors and agent messages in the plain log so failure
+        # signatures still see the tail of what happened.
+        if event.get("type") in ("error", "turn.failed"):
+            text_out.write((error_message(event) or stripped) + "\n")
+        elif isinstance(event.get("item"), dict) and event["item"].get("type") == "agent_message":
+            text_out.write(str(event["item"].get("text") or stripped) + "\n")
+    return summary
+
+
+def run_codex_json(
+    argv: List[str],
+    *,
+    cwd: pathlib.Path,
+    events_path: pathlib.Path,
+    log_path: pathlib.Path,
+) -> Tuple[int, str, EventSummary]:
+    with open(events_path, "w", encoding="utf-8") as events_out, open(log_path, "w", encoding="utf-8") as text_out:
+        try:
+            proc = subprocess.Popen(
+                argv,
+                cwd=str(cwd),
+                text=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                bufsize=1,
+            )
+        except FileNotFoundError as exc:
+            text_out.write(f"{exc}\n")
+            return 127, f"{exc}\n", EventSummary()
+        assert proc.stdout is not None
+        summary = consume_stream(proc.stdout, events_out=events_out, text_out=text_out)
+        rc = proc.wait()
+    return rc, log_path.read_text(encoding="utf-8"), summary
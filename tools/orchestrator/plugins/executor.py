@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import dataclasses
+import inspect
+import os
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .interface import ExecutionContext, Plan, ProgressEvent, RawOutput
+from .step_cache import StepCache, is_cacheable, step_cache_key
+
+StepRecord = Dict[str, Any]
+
+
+class StepExecutionError(RuntimeError):
+    """A plan step failed; `steps` holds the per-step records up to that point."""
+
+    def __init__(self, message: str, steps: List[StepRecord]) -> None:
+        super().__init__(message)
+        self.steps = steps
+        # Filled in by execute_plan so callers can still record the run.
+        self.execution: Dict[str, Any] = {"steps": steps}
+
+
+def execution_mode(plugin: Any) -> str:
+    if inspect.iscoroutinefunction(getattr(plugin, "run_step", None)):
+        return "async_steps"
+    if inspect.iscoroutinefunction(getattr(plugin, "run", None)):
+        return "async_run"
+    return "sync"
+
+
+def group_steps(steps: List[Dict[str, Any]]) -> List[List[int]]:
+    """
+    Consecutive steps marked `"independent": True` form one concurrent group;
+    every other step runs alone, in plan order, after the group before it.
+    """
+    groups: List[List[int]] = []
+    for index, step in enumerate(steps):
+        if step.get("independent") and groups and steps[groups[-1][0]].get("independent"):
+            groups[-1].append(index)
+        else:
+            groups.append([index])
+    return groups
+
+
+def merge_outputs(outputs: List[Optional[RawOutput]]) -> RawOutput:
+    artifacts: List[str] = []
+    metadata: Dict[str, Any] = {}
+    for out in outputs:
+        if out is None:
+            continue
+        artifacts.extend(out.artifacts)
+        metadata.update(out.metadata)
+    metadata["steps_ran"] = sum(1 for out in outputs if out is not None)
+    return RawOutput(artifacts=artifacts, metadata=metadata)
+
+
+def _step_keys(plugin: Any, steps: List[Dict[str, Any]], *, require_outputs: bool) -> Dict[int, str]:
+    """
+    Cache keys for the steps that opted in. Synchronous plugins run the plan
+    as a whole, so their cacheable steps must also list `outputs` (paths
+    relative to the artifact dir) for the runner to know what to store.
+    """
+    keys: Dict[int, str] = {}
+    plugin_id, version = plugin.id(), plugin.version()
+    for i, step in enumerate(steps):
+        if not is_cacheable(step) or (require_outputs and not isinstance(step.get("outputs"), list)):
+            continue
+        key = step_cache_key(plugin_id=plugin_id, plugin_version=version, step=step)
+        if key is not None:
+            keys[i] = key
+    return keys
+
+
+async def _run_steps(
+    plugin: Any,
+    plan: Plan,
+    ctx: ExecutionContext,
+    emit: Callable[[ProgressEvent], None],
+    max_concurrency: Optional[int],
+    cache: Optional[StepCache],
+    counts: Dict[str, int],
+) -> Tuple[RawOutput, List[StepRecord]]:
+    steps = plan.steps
+    keys = _step_keys(plugin, steps, require_outputs=False) if cache is not None else {}
+    outputs: List[Optional[RawOutput]] = [None] * len(steps)
+    records: List[StepRecord] = [
+        {
+            "index": i,
+            "action": str(step.get("action", "")),
+            "independent": bool(step.get("independent", False)),
+            "status": "skipped",
+            "duration_s": 0.0,
+        }
+        for i, step in enumerate(steps)
+    ]
+    limit = asyncio.Semaphore(max_concurrency) if max_concurrency else contextlib.nullcontext()
+
+    async def _one(i: int) -> None:
+        action = records[i]["action"]
+        async with limit:
+            started = time.monotonic()
+
+            def _progress(message: str) -> None:
+                emit(ProgressEvent(i, action, "progress", message, round(time.monotonic() - started, 3)))
+
+            key = keys.get(i)
+            if key is not None and cache is not None:
+                restored = cache.restore(key, ctx.artifact_dir)
+                counts["hits" if restored is not None else "misses"] += 1
+                if restored is not None:
+                    outputs[i] = restored
+                    records[i].update(status="cached", duration_s=round(time.monotonic() - started, 3))
+                    emit(ProgressEvent(i, action, "cached", "", records[i]["duration_s"]))
+                    return
+
+            emit(ProgressEvent(i, action, "started"))
+            # Anything that is not an Exception (KeyboardInterrupt, SystemExit) interrupts the step.
+            status = "cancelled"
+            try:
+                outputs[i] = await plugin.run_step(steps[i], ctx, _progress)
+                if key is not None and cache is not None and outputs[i] is not None:
+                    cache.store(key, outputs[i], ctx.artifact_dir)
+            except asyncio.CancelledError:
+                status = "cancelled"
+                raise
+            except Exception as exc:
+                status = "failed"
+                records[i]["error"] = f"{type(exc).__name__}: {exc}"
+                raise
+            else:
+                status = "completed"
+            finally:
+                elapsed = round(time.monotonic() - started, 3)
+                records[i].update(status=status, duration_s=elapsed)
+                emit(ProgressEvent(i, action, status, records[i].get("error", ""), elapsed))
+
+    for group in group_steps(steps):
+        tasks = [asyncio.ensure_future(_one(i)) for i in group]
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        for task in tasks:
+            exc = task.exception() if task in done else None
+            if exc is None:
+                continue
+            if not isinstance(exc, Exception):
+                raise exc
+            failed = records[group[tasks.index(task)]]
+            raise StepExecutionError(f"Plan step {failed['index']} ({failed['action']}) failed: {failed['error']}", records)
+
+    return merge_outputs(outputs), records
+
+
+def _run_whole_plan(
+    plugin: Any,
+    plan: Plan,
+    ctx: ExecutionContext,
+    *,
+    is_async: bool,
+    cache: Optional[StepCache],
+    counts: Dict[str, int],
+) -> RawOutput:
+    def _call(p: Plan) -> RawOutput:
+        return asyncio.run(plugin.run(p, ctx)) if is_async else plugin.run(p, ctx)
+
+    # run() only ever sees the full plan unless the plugin declares it can
+    # take one with the cache-restored steps removed.
+    if cache is None or not plugin.capabilities().accepts_partial_plans:
+        return _call(plan)
+    keys = _step_keys(plugin, plan.steps, require_outputs=True)
+    if not keys:
+        return _call(plan)
+
+    restored: Dict[int, RawOutput] = {}
+    for i, key in keys.items():
+        hit = cache.restore(key, ctx.artifact_dir)
+        counts["hits" if hit is not None else "misses"] += 1
+        if hit is not None:
+            restored[i] = hit
+    cached_artifacts = [a for i in sorted(restored) for a in restored[i].artifacts]
+    remaining = [step for i, step in enumerate(plan.steps) if i not in restored]
+    if not remaining:
+        return RawOutput(artifacts=cached_artifacts, metadata={"steps_ran": 0, "steps_cached": len(restored)})
+
+    raw = _call(dataclasses.replace(plan, steps=remaining) if restored else plan)
+    for i, key in keys.items():
+        if i not in restored:
+            outputs = [os.path.join(ctx.artifact_dir, rel) for rel in plan.steps[i]["outputs"]]
+            cache.store(key, RawOutput(artifacts=outputs), ctx.artifact_dir)
+    metadata = dict(raw.metadata)
+    if restored:
+        metadata["steps_cached"] = len(restored)
+    return RawOutput(artifacts=cached_artifacts + list(raw.artifacts), metadata=metadata)
+
+
+def execute_plan(
+    plugin: Any,
+    plan: Plan,
+    ctx: ExecutionContext,
+    *,
+    on_progress: Optional[Callable[[ProgressEvent], None]] = None,
+    max_concurrency: Optional[int] = None,
+    step_cache: Optional[StepCache] = None,
+) -> Tuple[RawOutput, Dict[str, Any]]:
+    """
+    Runs the plan with whichever execution style the plugin implements and
+    returns (raw output, execution record). Synchronous plugins are called
+    exactly as before unless they declare `accepts_partial_plans`, mark steps
+    cacheable and a step cache is given. Must not be called from a running
+    event loop.
+    """
+    emit = on_progress or (lambda _event: None)
+    mode = execution_mode(plugin)
+    started = time.monotonic()
+    execution: Dict[str, Any] = {"mode": mode}
+    counts = {"hits": 0, "misses": 0}
+    if mode == "async_steps":
+        try:
+            raw, records = asyncio.run(_run_steps(plugin, plan, ctx, emit, max_concurrency, step_cache, counts))
+        except StepExecutionError as exc:
+            exc.execution.update(mode=mode, run_duration_s=round(time.monotonic() - started, 3))
+            raise
+        execution["steps"] = records
+    else:
+        raw = _run_whole_plan(plugin, plan, ctx, is_async=mode == "async_run", cache=step_cache, counts=counts)
+    execution["run_duration_s"] = round(time.monotonic() - started, 3)
+    if step_cache is not None:
+        execution["step_cache"] = counts
+    return raw, execution
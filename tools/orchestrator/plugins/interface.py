@@ -9,6 +9,8 @@ class PluginCapabilities:
     requires_network: bool = False
     requires_cloud_mutations: bool = False
     produces_domain_result: bool = True
+    # Synchronous plugins whose run() accepts a plan with cache-restored steps removed.
+    accepts_partial_plans: bool = False
 
 
 @dataclass(frozen=True)
@@ -49,3 +51,37 @@ class SolutionPlugin(Protocol):
     def plan(self, taskpack: Dict[str, Any], ctx: ExecutionContext) -> Plan: ...
     def run(self, plan: Plan, ctx: ExecutionContext) -> RawOutput: ...
     def report(self, raw: RawOutput, ctx: ExecutionContext) -> List[str]: ...
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """Step-level progress emitted while an async plugin's plan executes."""
+
+    step: int
+    action: str
+    status: str  # started | progress | cached | completed | failed | cancelled
+    message: str = ""
+    elapsed_s: float = 0.0
+
+
+class AsyncSolutionPlugin(Protocol):
+    """
+    Optional async variant of SolutionPlugin. Instead of `run`, the plugin
+    implements the coroutine `run_step`, called once per plan step; the
+    runner executes consecutive steps marked `"independent": True`
+    concurrently and records per-step durations. `progress(message)` streams
+    intermediate progress for the step. All other methods stay synchronous.
+    """
+
+    def id(self) -> str: ...
+    def version(self) -> str: ...
+    def capabilities(self) -> PluginCapabilities: ...
+    def validate(self, taskpack: Dict[str, Any], ctx: ExecutionContext) -> ValidationReport: ...
+    def plan(self, taskpack: Dict[str, Any], ctx: ExecutionContext) -> Plan: ...
+    async def run_step(
+        self,
+        step: Dict[str, Any],
+        ctx: ExecutionContext,
+        progress: Callable[[str], None],
+    ) -> RawOutput: ...
+    def report(self, raw: RawOutput, ctx: ExecutionContext) -> List[str]: ...
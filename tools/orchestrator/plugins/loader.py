@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import dataclasses
 import importlib
-from typing import Any, Dict, Optional, Tuple
+import threading
+from typing import Any, Dict, Iterable, Optional, Tuple
 
-from .interface import SolutionPlugin
+from .interface import PluginCapabilities, SolutionPlugin
+
+REQUIRED_ATTRS = ("id", "version", "capabilities", "validate", "plan", "report")
+# Synchronous plugins implement `run`; async plugins may implement `run_step` instead.
+RUN_ATTRS = ("run", "run_step")
 
 
 class PluginLoadError(RuntimeError):
@@ -26,11 +32,14 @@ def _parse_plugin_spec(spec: str) -> Tuple[str, str]:
     return spec.strip(), "Plugin"
 
 
-def load_plugin(taskpack: Dict[str, Any]) -> SolutionPlugin:
+def plugin_spec(taskpack: Dict[str, Any]) -> str:
     spec: Optional[str] = taskpack.get("plugin")
     if not spec:
         raise PluginLoadError("Taskpack missing 'plugin'. Provide e.g. 'solutions.security.echo.plugin:EchoPlugin'.")
+    return spec
+
 
+def _import_class(spec: str) -> Any:
     module_path, symbol = _parse_plugin_spec(spec)
 
     try:
@@ -39,18 +48,122 @@ def load_plugin(taskpack: Dict[str, Any]) -> SolutionPlugin:
         raise PluginLoadError(f"Failed importing plugin module '{module_path}': {e}") from e
 
     try:
-        cls = getattr(module, symbol)
+        return getattr(module, symbol)
     except AttributeError as e:
         raise PluginLoadError(f"Plugin symbol '{symbol}' not found in module '{module_path}'.") from e
 
+
+def _instantiate(cls: Any, spec: str) -> SolutionPlugin:
     try:
-        plugin = cls()  # type: ignore[call-arg]
+        return cls()  # type: ignore[no-any-return]
     except Exception as e:
         raise PluginLoadError(f"Failed instantiating plugin '{spec}': {e}") from e
 
-    # Minimal duck-typing validation (Protocol isn't enforced at runtime)
-    for attr in ("id", "version", "capabilities", "validate", "plan", "run", "report"):
-        if not hasattr(plugin, attr):
-            raise PluginLoadError(f"Plugin '{spec}' is missing required method '{attr}()'.")
 
-    return plugin  # type: ignore[return-value]
+@dataclasses.dataclass(frozen=True)
+class LoadedPlugin:
+    """A plugin class whose spec, interface and capabilities were checked once."""
+
+    spec: str
+    cls: Any
+    plugin_id: str
+    version: str
+    capabilities: PluginCapabilities
+
+
+class PluginRegistry:
+    """
+    Caches plugin classes and their validated identity/capabilities per spec
+    string, so a batch or long-lived process imports and checks each plugin
+    once. Capabilities are assumed static for a plugin class.
+
+    Each `load` returns a fresh instance unless `reuse_instances=True`, in
+    which case one instance per spec is shared; only enable that for plugins
+    that keep no per-run state.
+    """
+
+    def __init__(self, *, reuse_instances: bool = False) -> None:
+        self.reuse_instances = reuse_instances
+        self._lock = threading.Lock()
+        self._loaded: Dict[str, LoadedPlugin] = {}
+        self._instances: Dict[str, SolutionPlugin] = {}
+        # Instance built to validate a spec, handed out by the next instance() call.
+        self._unclaimed: Dict[str, SolutionPlugin] = {}
+        self.imports = 0
+        self.hits = 0
+
+    def resolve(self, spec: str) -> LoadedPlugin:
+        with self._lock:
+            loaded = self._loaded.get(spec)
+            if loaded is not None:
+                self.hits += 1
+                return loaded
+
+            cls = _import_class(spec)
+            plugin = _instantiate(cls, spec)
+            # Minimal duck-typing validation (Protocol isn't enforced at runtime)
+            for attr in REQUIRED_ATTRS:
+                if not hasattr(plugin, attr):
+                    raise PluginLoadError(f"Plugin '{spec}' is missing required method '{attr}()'.")
+            if not any(hasattr(plugin, attr) for attr in RUN_ATTRS):
+                raise PluginLoadError(f"Plugin '{spec}' is missing required method 'run()' (or async 'run_step()').")
+            loaded = LoadedPlugin(
+                spec=spec,
+                cls=cls,
+                plugin_id=plugin.id(),
+                version=plugin.version(),
+                capabilities=plugin.capabilities(),
+            )
+            self.imports += 1
+            self._loaded[spec] = loaded
+            if self.reuse_instances:
+                self._instances[spec] = plugin
+            else:
+                self._unclaimed[spec] = plugin
+            return loaded
+
+    def instance(self, spec: str) -> SolutionPlugin:
+        loaded = self.resolve(spec)
+        if not self.reuse_instances:
+            with self._lock:
+                plugin = self._unclaimed.pop(spec, None)
+            return plugin if plugin is not None else _instantiate(loaded.cls, spec)
+        with self._lock:
+            plugin = self._instances.get(spec)
+            if plugin is None:
+                plugin = self._instances[spec] = _instantiate(loaded.cls, spec)
+            return plugin
+
+    def load(self, taskpack: Dict[str, Any]) -> SolutionPlugin:
+        return self.instance(plugin_spec(taskpack))
+
+    def prewarm(self, taskpacks: Iterable[Dict[str, Any]]) -> Dict[str, Optional[str]]:
+        """
+        Resolves every plugin named by `taskpacks` (task.yml mappings) up
+        front. Returns spec -> None on success or the load error message, so
+        a batch can report broken plugins before running anything.
+        """
+        results: Dict[str, Optional[str]] = {}
+        for taskpack in taskpacks:
+            spec = taskpack.get("plugin")
+            if not spec or spec in results:
+                continue
+            try:
+                self.resolve(spec)
+                results[spec] = None
+            except PluginLoadError as exc:
+                results[spec] = str(exc)
+        return results
+
+    def clear(self) -> None:
+        with self._lock:
+            self._loaded.clear()
+            self._instances.clear()
+            self._unclaimed.clear()
+
+
+DEFAULT_REGISTRY = PluginRegistry()
+
+
+def load_plugin(taskpack: Dict[str, Any], *, registry: Optional[PluginRegistry] = None) -> SolutionPlugin:
+    return (registry or DEFAULT_REGISTRY).load(taskpack)
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import dataclasses
 import json
 import os
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Optional
 
-from .interface import ExecutionContext
-from .loader import load_plugin
+from .executor import StepExecutionError, execute_plan
+from .interface import ExecutionContext, ProgressEvent
+from .loader import DEFAULT_REGISTRY, PluginRegistry, plugin_spec
+from .sandbox import PluginSandboxError, SandboxLimits, execute_plan_in_worker
+from .step_cache import StepCache
 
 
 def _constraint_allows(ctx: ExecutionContext, key: str) -> bool:
@@ -14,17 +18,37 @@ def _constraint_allows(ctx: ExecutionContext, key: str) -> bool:
     return bool(val) if val is not None else False
 
 
-def run_plugin(taskpack: Dict[str, Any], ctx: ExecutionContext) -> Dict[str, Any]:
-    plugin = load_plugin(taskpack)
-    caps = plugin.capabilities()
+def run_plugin(
+    taskpack: Dict[str, Any],
+    ctx: ExecutionContext,
+    *,
+    registry: Optional[PluginRegistry] = None,
+    max_concurrency: Optional[int] = None,
+    sandbox: Optional[SandboxLimits] = None,
+    step_cache: Optional[StepCache] = None,
+) -> Dict[str, Any]:
+    """
+    Validates, plans, executes and reports one plugin. With `sandbox`, the
+    plan executes in a worker process under those limits (see
+    plugins.sandbox) and the result gains a `resources` block. With
+    `step_cache`, steps marked cacheable are restored instead of re-run.
+    """
+    registry = registry or DEFAULT_REGISTRY
+    spec = plugin_spec(taskpack)
+    # Capability checks use the cached values; no plugin instance is created
+    # for a run the constraints would reject.
+    loaded = registry.resolve(spec)
+    caps = loaded.capabilities
 
     allow_network = _constraint_allows(ctx, "allow_network")
     allow_cloud_mutations = _constraint_allows(ctx, "allow_cloud_mutations")
 
     if caps.requires_network and not allow_network:
-        raise RuntimeError(f"Plugin '{plugin.id()}' requires network, but taskpack constraints disallow it.")
+        raise RuntimeError(f"Plugin '{loaded.plugin_id}' requires network, but taskpack constraints disallow it.")
     if caps.requires_cloud_mutations and not allow_cloud_mutations:
-        raise RuntimeError(f"Plugin '{plugin.id()}' requires cloud mutations, but constraints disallow it.")
+        raise RuntimeError(f"Plugin '{loaded.plugin_id}' requires cloud mutations, but constraints disallow it.")
+
+    plugin = registry.instance(spec)
 
     # Ensure artifact dir exists
     os.makedirs(ctx.artifact_dir, exist_ok=True)
@@ -41,7 +65,38 @@ def run_plugin(taskpack: Dict[str, Any], ctx: ExecutionContext) -> Dict[str, Any
         return result
 
     plan = plugin.plan(taskpack, ctx)
-    raw = plugin.run(plan, ctx)
+    resources: Optional[Dict[str, Any]] = None
+    try:
+        if sandbox is not None:
+            raw, execution, resources = execute_plan_in_worker(
+                spec,
+                plan,
+                ctx,
+                limits=sandbox,
+                on_progress=_progress_writer(ctx),
+                max_concurrency=max_concurrency,
+                step_cache=step_cache,
+            )
+        else:
+            raw, execution = execute_plan(
+                plugin,
+                plan,
+                ctx,
+                on_progress=_progress_writer(ctx),
+                max_concurrency=max_concurrency,
+                step_cache=step_cache,
+            )
+    except (StepExecutionError, PluginSandboxError) as exc:
+        failed: Dict[str, Any] = {
+            "plugin": {"id": plugin.id(), "version": plugin.version()},
+            "validation": {"ok": True, "errors": [], "warnings": validation.warnings},
+            "execution": exc.execution,
+            "status": "RUN_FAILED",
+        }
+        if isinstance(exc, PluginSandboxError):
+            failed["resources"] = exc.resources
+        _write_plugin_result(ctx, failed)
+        raise
     report_artifacts = plugin.report(raw, ctx)
 
     raw_artifacts = [_rel(ctx, a) for a in raw.artifacts]
@@ -52,13 +107,28 @@ def run_plugin(taskpack: Dict[str, Any], ctx: ExecutionContext) -> Dict[str, Any
         "validation": {"ok": True, "errors": [], "warnings": validation.warnings},
         "plan": {"metadata": plan.metadata, "expected_artifacts": plan.expected_artifacts, "steps_count": len(plan.steps)},
         "raw": {"metadata": raw.metadata, "artifacts": raw_artifacts},
+        "execution": execution,
         "report_artifacts": report_artifacts,
         "status": "OK",
     }
+    if resources is not None:
+        result["resources"] = resources
 
     _write_plugin_result(ctx, result)
     return result
 
+def _progress_writer(ctx: ExecutionContext) -> Callable[[ProgressEvent], None]:
+    """Streams step progress to ctx.log and plugin_progress.jsonl as it happens."""
+    path = os.path.join(ctx.artifact_dir, "plugin_progress.jsonl")
+
+    def _emit(event: ProgressEvent) -> None:
+        detail = f": {event.message}" if event.message else ""
+        ctx.log(f"[plugin] step {event.step} {event.action} {event.status} ({event.elapsed_s:.3f}s){detail}")
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(dataclasses.asdict(event), sort_keys=True) + "\n")
+
+    return _emit
+
 def _rel(ctx: ExecutionContext, p: str) -> str:
     # keep it simple and resilient across OS
     try:
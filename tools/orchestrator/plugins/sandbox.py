@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import os
+import pathlib
+import signal
+import subprocess
+import sys
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from .interface import ExecutionContext, Plan, ProgressEvent, RawOutput
+from .step_cache import StepCache
+
+ROOT = pathlib.Path(__file__).resolve().parents[3]
+WORKER_STDERR = "plugin_worker.stderr.log"
+
+
+class PluginSandboxError(RuntimeError):
+    """The sandboxed plan run failed; `resources` holds the worker's usage."""
+
+    def __init__(self, message: str, resources: Dict[str, Any], execution: Optional[Dict[str, Any]] = None) -> None:
+        super().__init__(message)
+        self.resources = resources
+        self.execution = execution or {}
+
+
+@dataclasses.dataclass(frozen=True)
+class SandboxLimits:
+    cpu_seconds: Optional[int] = None
+    memory_mb: Optional[int] = None
+
+    def to_dict(self) -> Dict[str, Optional[int]]:
+        return {"cpu_seconds": self.cpu_seconds, "memory_mb": self.memory_mb}
+
+
+def _apply_limits(limits: SandboxLimits) -> Callable[[], None]:
+    def _preexec() -> None:
+        import resource
+
+        if limits.cpu_seconds:
+            # SIGXCPU at the soft limit, SIGKILL one second later.
+            resource.setrlimit(resource.RLIMIT_CPU, (limits.cpu_seconds, limits.cpu_seconds + 1))
+        if limits.memory_mb:
+            size = limits.memory_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (size, size))
+
+    return _preexec
+
+
+def _describe_exit(status: int) -> Tuple[int, Optional[str]]:
+    code = os.waitstatus_to_exitcode(status)
+    if code < 0:
+        return code, signal.Signals(-code).name
+    return code, None
+
+
+def execute_plan_in_worker(
+    spec: str,
+    plan: Plan,
+    ctx: ExecutionContext,
+    *,
+    limits: SandboxLimits,
+    on_progress: Optional[Callable[[ProgressEvent], None]] = None,
+    max_concurrency: Optional[int] = None,
+    step_cache: Optional[StepCache] = None,
+) -> Tuple[RawOutput, Dict[str, Any], Dict[str, Any]]:
+    """
+    Runs the plan of plugin `spec` in a separate Python process under
+    RLIMIT_CPU / RLIMIT_AS. The context (minus the log callable) and plan go
+    to the worker as one JSON line on stdin; log lines, progress events and
+    the final RawOutput stream back as JSON lines on stdout. Returns (raw,
+    execution record, resource usage). Anything the plugin prints goes to
+    `plugin_worker.stderr.log` in the artifact dir.
+    """
+    request = {
+        "spec": spec,
+        "plan": dataclasses.asdict(plan),
+        "ctx": {k: v for k, v in dataclasses.asdict(ctx).items() if k != "log"},
+        "max_concurrency": max_concurrency,
+        "step_cache_dir": str(step_cache.root) if step_cache is not None else None,
+        # Lets the worker import plugins from the same locations as the parent.
+        "sys_path": [p for p in sys.path if p],
+    }
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT), env.get("PYTHONPATH")]))
+    stderr_path = os.path.join(ctx.artifact_dir, WORKER_STDERR)
+    started = time.monotonic()
+    with open(stderr_path, "w", encoding="utf-8") as stderr:
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "tools.orchestrator.plugins.sandbox"],
+            cwd=ctx.workspace_dir,
+            env=env,
+            text=True,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=stderr,
+            preexec_fn=_apply_limits(limits),
+        )
+        assert proc.stdin is not None and proc.stdout is not None
+        try:
+            proc.stdin.write(json.dumps(request) + "\n")
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+
+        final: Optional[Dict[str, Any]] = None
+        for line in proc.stdout:
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue
+            kind = message.get("type")
+            if kind == "log":
+                ctx.log(message.get("message", ""))
+            elif kind == "progress" and on_progress is not None:
+                on_progress(ProgressEvent(**message["event"]))
+            elif kind in ("result", "error"):
+                final = message
+        proc.stdout.close()
+
+        _, status, usage = os.wait4(proc.pid, 0)
+        code, sig = _describe_exit(status)
+        proc.returncode = code
+
+    resources = {
+        "limits": limits.to_dict(),
+        "exit_code": code,
+        "signal": sig,
+        "wall_s": round(time.monotonic() - started, 3),
+        "cpu_user_s": round(usage.ru_utime, 3),
+        "cpu_system_s": round(usage.ru_stime, 3),
+        "max_rss_kb": usage.ru_maxrss,
+    }
+    if final is None or final.get("type") == "error":
+        if final is not None:
+            reason = final.get("error", "unknown error")
+        elif sig:
+            reason = f"worker killed by {sig}"
+        else:
+            reason = f"worker exited with code {code} without a result"
+        raise PluginSandboxError(
+            f"Sandboxed plugin '{spec}' failed: {reason}",
+            resources,
+            (final or {}).get("execution"),
+        )
+    raw = RawOutput(**final["raw"])
+    return raw, final.get("execution", {}), resources
+
+
+def _worker() -> int:
+    # The protocol keeps a private copy of the stdout pipe. fd 1 itself is
+    # pointed at stderr, so prints, os.write(1, ...), C extensions and child
+    # processes of the plugin all end up in the stderr log instead.
+    sys.stdout.flush()
+    proto = os.fdopen(os.dup(1), "w", encoding="utf-8", buffering=1)
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+
+    def send(message: Dict[str, Any]) -> None:
+        proto.write(json.dumps(message, sort_keys=True) + "\n")
+
+    request = json.loads(sys.stdin.readline())
+    for entry in reversed(request.get("sys_path", [])):
+        if entry not in sys.path:
+            sys.path.insert(0, entry)
+
+    from .executor import StepExecutionError, execute_plan
+    from .loader import PluginRegistry
+
+    def _log(*args: Any, **_kwargs: Any) -> None:
+        send({"type": "log", "message": " ".join(str(a) for a in args)})
+
+    ctx = ExecutionContext(log=_log, **request["ctx"])
+    plan = Plan(**request["plan"])
+    cache_dir = request.get("step_cache_dir")
+    try:
+        plugin = PluginRegistry().instance(request["spec"])
+        raw, execution = execute_plan(
+            plugin,
+            plan,
+            ctx,
+            on_progress=lambda event: send({"type": "progress", "event": dataclasses.asdict(event)}),
+            max_concurrency=request.get("max_concurrency"),
+            step_cache=StepCache(pathlib.Path(cache_dir)) if cache_dir else None,
+        )
+    except StepExecutionError as exc:
+        send({"type": "error", "error": str(exc), "execution": exc.execution})
+        return 1
+    except BaseException as exc:  # noqa: BLE001 - report anything, including MemoryError
+        send({"type": "error", "error": f"{type(exc).__name__}: {exc}"})
+        return 1
+    send({"type": "result", "raw": dataclasses.asdict(raw), "execution": execution})
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(_worker())
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .interface import RawOutput
+
+CACHE_SCHEMA_VERSION = 1
+
+
+def step_cache_key(*, plugin_id: str, plugin_version: str, step: Dict[str, Any]) -> Optional[str]:
+    """
+    Canonical hash of (plugin id, plugin version, step dict). Returns None for
+    steps that are not JSON-serialisable, which are never cached.
+    """
+    try:
+        payload = json.dumps(
+            {"schema_version": CACHE_SCHEMA_VERSION, "plugin": plugin_id, "version": plugin_version, "step": step},
+            sort_keys=True,
+            separators=(",", ":"),
+            allow_nan=False,
+        )
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def is_cacheable(step: Dict[str, Any]) -> bool:
+    return bool(step.get("cacheable"))
+
+
+def _sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class StepCache:
+    """
+    Content-addressed cache of plugin plan-step outputs.
+
+    `objects/<sha[:2]>/<sha>` holds artifact bytes (shared across steps and
+    runs); `steps/<key[:2]>/<key>.json` maps a step key to the artifact paths
+    (relative to ctx.artifact_dir), their hashes and the step's metadata.
+    Only steps marked `"cacheable": True` are looked up or stored, and only
+    artifacts inside the artifact dir are captured.
+    """
+
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / "steps" / key[:2] / f"{key}.json"
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / digest
+
+    def _restorable(self, f: Any) -> bool:
+        if not isinstance(f, dict) or not isinstance(f.get("path"), str) or not isinstance(f.get("sha256"), str):
+            return False
+        rel = Path(f["path"])
+        if rel.is_absolute() or ".." in rel.parts:
+            return False
+        return self._object_path(f["sha256"]).is_file()
+
+    def restore(self, key: str, artifact_dir: str) -> Optional[RawOutput]:
+        """Copies the step's artifacts into `artifact_dir`; None on a miss."""
+        try:
+            entry = json.loads(self._entry_path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        files = entry.get("artifacts") if isinstance(entry, dict) else None
+        if not isinstance(files, list) or not all(self._restorable(f) for f in files):
+            return None
+        restored: List[str] = []
+        for f in files:
+            dest = Path(artifact_dir) / f["path"]
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(self._object_path(f["sha256"]), dest)
+            restored.append(str(dest))
+        return RawOutput(artifacts=restored, metadata=dict(entry.get("metadata", {})))
+
+    def store(self, key: str, raw: RawOutput, artifact_dir: str) -> bool:
+        base = Path(artifact_dir).resolve()
+        files: List[Dict[str, str]] = []
+        for artifact in raw.artifacts:
+            path = Path(artifact).resolve()
+            try:
+                rel = path.relative_to(base)
+            except ValueError:
+                return False  # output outside the artifact dir cannot be restored
+            if not path.is_file():
+                return False
+            digest = _sha256_file(path)
+            obj = self._object_path(digest)
+            if not obj.exists():
+                obj.parent.mkdir(parents=True, exist_ok=True)
+                tmp = obj.with_name(f"{digest}.{os.getpid()}.{threading.get_ident()}.tmp")
+                shutil.copyfile(path, tmp)
+                tmp.replace(obj)
+            files.append({"path": rel.as_posix(), "sha256": digest})
+        try:
+            metadata = json.loads(json.dumps(raw.metadata))
+        except (TypeError, ValueError):
+            return False
+        entry_path = self._entry_path(key)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = entry_path.with_name(f"{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(
+            json.dumps({"schema_version": CACHE_SCHEMA_VERSION, "artifacts": files, "metadata": metadata}, sort_keys=True),
+            encoding="utf-8",
+        )
+        tmp.replace(entry_path)
+        return True
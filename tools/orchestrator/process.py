@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import dataclasses
+import pathlib
+import shlex
+import subprocess
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+Command = Union[str, Sequence[str]]
+
+# Anything the shell would interpret beyond plain word splitting and quoting.
+SHELL_METACHARS = frozenset("|&;<>()$`\\*?[]{}~#!\n")
+
+# First words that only mean something to the shell (builtins and reserved
+# words), or that may not exist as standalone binaries everywhere.
+SHELL_BUILTINS = frozenset(
+    {
+        ".", ":", "[", "alias", "break", "case", "cd", "command", "continue", "eval", "exec", "exit",
+        "export", "false", "for", "function", "getopts", "hash", "if", "read", "readonly", "return",
+        "select", "set", "shift", "source", "test", "times", "trap", "true", "type", "ulimit", "umask",
+        "unalias", "unset", "until", "wait", "while",
+    }
+)
+
+
+def needs_shell(cmd: str) -> bool:
+    return any(ch in SHELL_METACHARS for ch in cmd)
+
+
+def prepare(cmd: Command) -> Tuple[Union[str, List[str]], bool]:
+    """
+    Returns (args, shell) for subprocess.
+
+    argv lists are executed directly. Strings are split with shlex and executed
+    directly unless they use shell syntax (pipes, redirects, globs, variable
+    expansion, env assignments) or start with a shell builtin or keyword
+    (`cd`, `exit`, `export`, `test`, ...), in which case they still go
+    through /bin/sh.
+    """
+    if not isinstance(cmd, str):
+        return [str(part) for part in cmd], False
+    if needs_shell(cmd):
+        return cmd, True
+    try:
+        argv = shlex.split(cmd)
+    except ValueError:
+        return cmd, True
+    if not argv or "=" in argv[0] or argv[0] in SHELL_BUILTINS:
+        # Leading NAME=value assignments and builtins only work through the shell.
+        return cmd, True
+    return argv, False
+
+
+def run_process(
+    cmd: Command,
+    *,
+    cwd: pathlib.Path,
+    env: Optional[Dict[str, str]] = None,
+) -> subprocess.CompletedProcess:
+    args, shell = prepare(cmd)
+    try:
+        return subprocess.run(
+            args,
+            cwd=str(cwd),
+            shell=shell,
+            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            check=False,
+            env=env,
+        )
+    except FileNotFoundError as exc:
+        # Match shell semantics for a missing binary instead of raising.
+        return subprocess.CompletedProcess(args, 127, stdout=f"{exc}\n")
+
+
+@dataclasses.dataclass(frozen=True)
+class GitStatus:
+    branch: str
+    head: str
+    has_changes: bool
+
+
+def parse_porcelain_v2(output: str) -> GitStatus:
+    branch = "HEAD"
+    head = ""
+    has_changes = False
+    for line in output.splitlines():
+        if line.startswith("# branch.head "):
+            value = line[len("# branch.head "):].strip()
+            branch = "HEAD" if value == "(detached)" else value
+        elif line.startswith("# branch.oid "):
+            value = line[len("# branch.oid "):].strip()
+            head = "" if value == "(initial)" else value
+        elif line and not line.startswith("#"):
+            has_changes = True
+    return GitStatus(branch=branch, head=head, has_changes=has_changes)
+
+
+def git_status(*, cwd: pathlib.Path) -> GitStatus:
+    """Branch name, HEAD commit and dirty state from a single git invocation."""
+    proc = run_process(["git", "status", "--porcelain=v2", "--branch"], cwd=cwd)
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, proc.args, output=proc.stdout)
+    return parse_porcelain_v2(proc.stdout or "")
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Linux caps a single argv string at MAX_ARG_STRLEN (32 pages); prompts are
+# passed to `codex exec` as one argument, so anything above this cannot run.
+DEFAULT_BUDGET_BYTES = 128 * 1024
+BYTES_PER_TOKEN = 4
+
+
+@dataclasses.dataclass(frozen=True)
+class PromptContext:
+    text: str
+    sha256: str
+    path: Path
+    section_bytes: Dict[str, int]
+    budget_bytes: int
+    oversized: List[str]
+
+    @property
+    def total_bytes(self) -> int:
+        return len(self.text.encode("utf-8"))
+
+    def manifest_entry(self) -> Dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "sha256": self.sha256,
+            "bytes": self.total_bytes,
+            "approx_tokens": self.total_bytes // BYTES_PER_TOKEN,
+            "section_bytes": dict(self.section_bytes),
+            "budget_bytes": self.budget_bytes,
+            "oversized": list(self.oversized),
+        }
+
+
+def check_budget(section_bytes: Dict[str, int], *, total_bytes: int, budget_bytes: int) -> List[str]:
+    """
+    Names of sections that do not fit the budget on their own, plus `total`
+    when the rendered context as a whole exceeds it. Report-only: nothing is
+    truncated, since dropping spec or acceptance text would change the task.
+    """
+    oversized = [name for name, size in section_bytes.items() if size > budget_bytes]
+    if total_bytes > budget_bytes:
+        oversized.append("total")
+    return oversized
+
+
+def write_prompt_context(
+    sections: Dict[str, str],
+    text: str,
+    *,
+    out_dir: Path,
+    budget_bytes: int = DEFAULT_BUDGET_BYTES,
+) -> PromptContext:
+    """
+    Writes the rendered context once to `<out_dir>/<sha256>.md`. The name is
+    the content hash, so identical contexts across attempts, phases and
+    resumed runs share one file and an existing file is never rewritten.
+    """
+    data = text.encode("utf-8")
+    digest = hashlib.sha256(data).hexdigest()
+    path = out_dir / f"{digest}.md"
+    if not path.exists():
+        out_dir.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(data)
+        tmp.replace(path)
+    section_bytes = {name: len(body.encode("utf-8")) for name, body in sections.items()}
+    return PromptContext(
+        text=text,
+        sha256=digest,
+        path=path,
+        section_bytes=section_bytes,
+        budget_bytes=budget_bytes,
+        oversized=check_budget(section_bytes, total_bytes=len(data), budget_bytes=budget_bytes),
+    )
+
+
+def prompt_stats(prompt: str) -> Dict[str, Any]:
+    data = prompt.encode("utf-8")
+    return {"bytes": len(data), "sha256": hashlib.sha256(data).hexdigest()}
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import random
+import re
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from tools.common.yaml_loader import load_file_cached
+
+POLICY_PATH = Path(__file__).resolve().parent / "policy.yml"
+
+_HEX_RE = re.compile(r"\b(?:0x)?[0-9a-f]{7,}\b", re.IGNORECASE)
+_NUM_RE = re.compile(r"\d+(?:\.\d+)?")
+_TMP_PATH_RE = re.compile(r"/(?:tmp|var/folders)/[^\s:'\"]+")
+_WS_RE = re.compile(r"\s+")
+
+
+@dataclasses.dataclass(frozen=True)
+class RetryPolicy:
+    max_attempts: int = 2
+    repeat_error_signature_limit: int = 2
+    max_total_changed_lines: Optional[int] = None
+    backoff_base_seconds: float = 2.0
+    backoff_max_seconds: float = 60.0
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "RetryPolicy":
+        backoff = data.get("retry_backoff", {}) or {}
+        changed = data.get("max_total_changed_lines")
+        return cls(
+            max_attempts=int(data.get("max_attempts_per_phase", cls.max_attempts)),
+            repeat_error_signature_limit=int(
+                data.get("repeat_error_signature_limit", cls.repeat_error_signature_limit)
+            ),
+            max_total_changed_lines=int(changed) if changed is not None else None,
+            backoff_base_seconds=float(backoff.get("base_seconds", cls.backoff_base_seconds)),
+            backoff_max_seconds=float(backoff.get("max_seconds", cls.backoff_max_seconds)),
+        )
+
+
+def load_retry_policy(path: Path = POLICY_PATH) -> RetryPolicy:
+    if not path.exists():
+        return RetryPolicy()
+    data = load_file_cached(path) or {}
+    if not isinstance(data, dict):
+        raise ValueError(f"policy must be a mapping: {path}")
+    return RetryPolicy.from_dict(data)
+
+
+def backoff_delay(
+    attempt: int,
+    *,
+    base: float,
+    cap: float,
+    rng: Optional[random.Random] = None,
+) -> float:
+    """
+    Equal-jitter exponential backoff for the wait after `attempt` (1-based):
+    half of min(cap, base * 2**(attempt-1)) plus a uniform random share of the
+    other half, so concurrent retries spread out but never retry instantly.
+    """
+    rng = rng or random.Random()
+    ceiling = min(cap, base * (2 ** max(attempt - 1, 0)))
+    return ceiling / 2 + rng.uniform(0, ceiling / 2)
+
+
+def error_signature(log_text: str, *, tail_lines: int = 40) -> str:
+    """
+    Stable fingerprint of a failure from the tail of a phase log.
+
+    Volatile tokens (hashes, numbers, temp paths) are masked so the same
+    deterministic failure produces the same signature across attempts.
+    """
+    lines = [line for line in (log_text or "").splitlines() if line.strip()]
+    normalized = []
+    for line in lines[-tail_lines:]:
+        line = _TMP_PATH_RE.sub("<tmp>", line)
+        line = _HEX_RE.sub("<hex>", line)
+        line = _NUM_RE.sub("<n>", line)
+        normalized.append(_WS_RE.sub(" ", line).strip().lower())
+    digest = hashlib.sha256("\n".join(normalized).encode("utf-8")).hexdigest()
+    return digest[:16]
+
+
+class SignatureTracker:
+    """Counts error signatures; `observe` returns True once a signature hits the limit."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.counts: Dict[str, int] = {}
+
+    def observe(self, signature: str) -> bool:
+        self.counts[signature] = self.counts.get(signature, 0) + 1
+        return self.limit > 0 and self.counts[signature] >= self.limit
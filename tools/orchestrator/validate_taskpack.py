@@ -5,20 +5,26 @@ import pathlib
 import sys
 from typing import Any, Dict
 
-import yaml
-
 
 ROOT = pathlib.Path(__file__).resolve().parents[2]
 
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tools.common.yaml_loader import load_file_cached  # noqa: E402
+from tools.taskpacks import catalog  # noqa: E402
+
 
 def fail(msg: str) -> None:
     print(f"[taskpack-validator] ERROR: {msg}", file=sys.stderr)
     raise SystemExit(2)
 
 
-def load_yaml(path: pathlib.Path) -> Dict[str, Any]:
+def load_yaml(path: pathlib.Path, *, immutable: bool = False) -> Dict[str, Any]:
+    if not path.is_file():
+        fail(f"Failed to parse YAML: {path} (file not found)")
     try:
-        data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        data = (load_file_cached(path) if immutable else catalog.load_yaml(path)) or {}
         return data if isinstance(data, dict) else {}
     except Exception as e:
         fail(f"Failed to parse YAML: {path} ({e})")
@@ -30,7 +36,7 @@ def main() -> None:
         fail("Usage: validate_taskpack.py <taskpack_path>")
 
     tp = pathlib.Path(sys.argv[1]).resolve()
-    schema = load_yaml(ROOT / "taskpacks" / "schema.yml")
+    schema = load_yaml(ROOT / "taskpacks" / "schema.yml", immutable=True)
 
     for fname in schema.get("required_files", []):
         p = tp / fname
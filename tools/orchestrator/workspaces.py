@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import concurrent.futures
 import dataclasses
+import hashlib
+import json
+import os
+import threading
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-import yaml
+from tools.common.yaml_loader import safe_load
+
+# Bump when the compiled JSON layout changes; older cache files are ignored.
+COMPILED_FORMAT = 1
 
 
 class WorkspaceRegistryError(ValueError):
@@ -58,8 +66,12 @@ def _require_list_of_strings(value: Any, *, label: str) -> List[str]:
 
 
 def load_workspace_registry(path: Path) -> Dict[str, Any]:
+    return _parse_registry(path.read_bytes(), path=path)
+
+
+def _parse_registry(raw_bytes: bytes, *, path: Path) -> Dict[str, Any]:
     try:
-        raw = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        raw = safe_load(raw_bytes.decode("utf-8")) or {}
     except Exception as exc:
         raise WorkspaceRegistryError(f"Failed to parse registry: {path} ({exc})") from exc
 
@@ -105,19 +117,134 @@ def load_workspace_registry(path: Path) -> Dict[str, Any]:
     return data
 
 
+@dataclasses.dataclass(frozen=True)
+class CompiledRegistry:
+    """
+    A validated registry with defaults already applied to every entry, so
+    resolving a named workspace is one dict lookup. `sha256` is the hash of
+    the registry file the entries were compiled from.
+    """
+
+    sha256: str
+    defaults: Dict[str, Any]
+    workspaces: Dict[str, Dict[str, Any]]
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "format": COMPILED_FORMAT,
+            "sha256": self.sha256,
+            "defaults": self.defaults,
+            "workspaces": self.workspaces,
+        }
+
+
+def _compile(data: Dict[str, Any], *, sha256: str) -> CompiledRegistry:
+    defaults = data.get("defaults", {}) or {}
+    default_acceptance = list(defaults.get("acceptance", []) or [])
+    workspaces: Dict[str, Dict[str, Any]] = {}
+    for name, entry in (data.get("workspaces", {}) or {}).items():
+        entry = entry or {}
+        evidence_dir = entry.get("evidence_dir")
+        workspaces[name] = {
+            "path": entry["path"],
+            "kind": str(entry.get("kind", defaults.get("kind", "local_path"))),
+            "evidence_mode": str(entry.get("evidence_mode", defaults.get("evidence_mode", "in_repo"))),
+            "evidence_dir": str(evidence_dir) if evidence_dir else None,
+            "acceptance": list(entry.get("acceptance", default_acceptance) or []),
+        }
+    return CompiledRegistry(sha256=sha256, defaults=dict(defaults), workspaces=workspaces)
+
+
+_COMPILED: Dict[str, CompiledRegistry] = {}
+_COMPILED_LOCK = threading.Lock()
+
+
+def compile_workspace_registry(path: Path, *, cache_dir: Optional[Path] = None) -> CompiledRegistry:
+    """
+    Validated, compiled form of the registry at `path`, keyed by the file's
+    sha256. Compiled registries are kept in memory for the process and, when
+    `cache_dir` is given, as `workspace-registry-<sha256>.json` there so later
+    orchestrator starts skip parsing and validation. Any edit to the registry
+    changes the hash and forces a full validation pass.
+    """
+    raw_bytes = path.read_bytes()
+    sha256 = hashlib.sha256(raw_bytes).hexdigest()
+    with _COMPILED_LOCK:
+        compiled = _COMPILED.get(sha256)
+    if compiled is not None:
+        return compiled
+
+    cache_file = cache_dir / f"workspace-registry-{sha256}.json" if cache_dir else None
+    if cache_file is not None and cache_file.is_file():
+        try:
+            cached = json.loads(cache_file.read_text(encoding="utf-8"))
+            if cached.get("format") == COMPILED_FORMAT and cached.get("sha256") == sha256:
+                compiled = CompiledRegistry(
+                    sha256=sha256,
+                    defaults=dict(cached["defaults"]),
+                    workspaces=dict(cached["workspaces"]),
+                )
+        except (OSError, ValueError, KeyError, TypeError):
+            compiled = None  # unreadable cache entry: recompile and overwrite
+
+    if compiled is None:
+        compiled = _compile(_parse_registry(raw_bytes, path=path), sha256=sha256)
+        if cache_file is not None:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(compiled.to_json(), sort_keys=True) + "\n", encoding="utf-8")
+            tmp.replace(cache_file)
+
+    with _COMPILED_LOCK:
+        _COMPILED[sha256] = compiled
+    return compiled
+
+
+def validate_workspace_paths(
+    registry: CompiledRegistry,
+    *,
+    max_workers: Optional[int] = None,
+) -> Dict[str, List[str]]:
+    """
+    Filesystem checks for every workspace, run concurrently since each is a
+    handful of stat calls that may hit slow or network mounts. Returns the
+    problems per workspace name; workspaces without problems are omitted.
+    """
+
+    def _check(item: tuple[str, Dict[str, Any]]) -> tuple[str, List[str]]:
+        name, entry = item
+        problems: List[str] = []
+        root = Path(entry["path"]).expanduser()
+        if not root.is_dir():
+            problems.append(f"path is not a directory: {root}")
+        evidence_dir = entry.get("evidence_dir")
+        if entry["evidence_mode"] == "external_dir" and evidence_dir:
+            evidence = Path(evidence_dir).expanduser()
+            if not evidence.is_dir() and not evidence.parent.is_dir():
+                problems.append(f"evidence_dir cannot be created: {evidence}")
+        return name, problems
+
+    items = sorted(registry.workspaces.items())
+    if not items:
+        return {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return {name: problems for name, problems in pool.map(_check, items) if problems}
+
+
 def resolve_workspace(
     *,
     spec: Optional[str],
     registry_path: Path,
     default_root: Path,
+    cache_dir: Optional[Path] = None,
 ) -> WorkspaceConfig:
-    registry: Optional[Dict[str, Any]] = None
+    registry: Optional[CompiledRegistry] = None
     if registry_path.exists():
-        registry = load_workspace_registry(registry_path)
+        registry = compile_workspace_registry(registry_path, cache_dir=cache_dir)
 
     defaults: Dict[str, Any] = {}
     if registry:
-        defaults = registry.get("defaults", {}) or {}
+        defaults = registry.defaults
 
     if not spec:
         _fail(
@@ -136,30 +263,20 @@ def resolve_workspace(
             acceptance=list(defaults.get("acceptance", []) or []),
         )
 
-    if registry:
-        workspaces = registry.get("workspaces", {}) or {}
-        if spec in workspaces:
-            entry = workspaces[spec] or {}
-            path_value = _require_str(entry.get("path"), label=f"workspace.{spec}.path")
-            root = Path(path_value).expanduser().resolve()
-            if not root.exists():
-                _fail(f"workspace.{spec}.path does not exist: {root}")
-            evidence_mode = str(entry.get("evidence_mode", defaults.get("evidence_mode", "in_repo")))
-            evidence_dir = entry.get("evidence_dir")
-            evidence_dir_path_local = (
-                Path(str(evidence_dir)).expanduser().resolve() if evidence_dir else None
-            )
-            if evidence_mode == "external_dir" and not evidence_dir_path_local:
-                _fail(f"workspace.{spec}.evidence_dir required for external_dir mode")
-            acceptance = entry.get("acceptance", defaults.get("acceptance", [])) or []
-            return WorkspaceConfig(
-                name=spec,
-                root=root,
-                kind=str(entry.get("kind", defaults.get("kind", "local_path"))),
-                evidence_mode=evidence_mode,
-                evidence_dir=evidence_dir_path_local,
-                acceptance=list(acceptance),
-            )
+    entry = registry.workspaces.get(spec) if registry else None
+    if entry is not None:
+        root = Path(entry["path"]).expanduser().resolve()
+        if not root.exists():
+            _fail(f"workspace.{spec}.path does not exist: {root}")
+        evidence_dir = entry["evidence_dir"]
+        return WorkspaceConfig(
+            name=spec,
+            root=root,
+            kind=entry["kind"],
+            evidence_mode=entry["evidence_mode"],
+            evidence_dir=Path(evidence_dir).expanduser().resolve() if evidence_dir else None,
+            acceptance=list(entry["acceptance"]),
+        )
 
     # Interpret as path
     root = Path(spec).expanduser().resolve()
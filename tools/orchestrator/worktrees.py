@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+
+
+class WorktreeError(RuntimeError):
+    pass
+
+
+LOCK_FILENAME = ".orchestrator_worktree.lock"
+
+
+@dataclasses.dataclass(frozen=True)
+class Worktree:
+    path: Path
+    repo_root: Path
+    base_ref: str
+    reused: bool
+    lock_path: Path
+
+
+def _git(args: List[str], *, cwd: Path, check: bool = True) -> subprocess.CompletedProcess:
+    proc = subprocess.run(
+        ["git", *args],
+        cwd=str(cwd),
+        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        check=False,
+    )
+    if check and proc.returncode != 0:
+        raise WorktreeError(f"git {' '.join(args)} failed in {cwd}: {(proc.stdout or '').strip()}")
+    return proc
+
+
+def default_pool_dir(repo_root: Path) -> Path:
+    # Keep pooled worktrees outside the workspace so `git add -A` in the main
+    # checkout never picks them up as embedded repositories.
+    digest = hashlib.sha256(str(repo_root.resolve()).encode("utf-8")).hexdigest()[:12]
+    return Path(tempfile.gettempdir()) / "codex-orchestrator-worktrees" / f"{repo_root.name}-{digest}"
+
+
+def _lock_owner(lock_path: Path) -> Optional[int]:
+    try:
+        text = lock_path.read_text(encoding="utf-8").strip()
+    except OSError:
+        return None
+    return int(text) if text.isdigit() else None
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # exists, owned by another user
+    except OSError:
+        return False
+    return True
+
+
+def _is_stale(lock_path: Path) -> bool:
+    """A lock whose recorded PID no longer runs (the run crashed or was killed)."""
+    pid = _lock_owner(lock_path)
+    return pid is not None and pid != os.getpid() and not _pid_alive(pid)
+
+
+def _create_lock(lock_path: Path) -> bool:
+    try:
+        fd = os.open(str(lock_path), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        return False
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(f"{os.getpid()}\n")
+    return True
+
+
+def _try_lock(lock_path: Path) -> bool:
+    if _create_lock(lock_path):
+        return True
+    if not _is_stale(lock_path):
+        return False
+    # Reclaim under a guard file so two processes cannot both remove the stale
+    # lock and then each take a fresh one.
+    guard = lock_path.with_name(f"{lock_path.name}.reclaim")
+    if not _create_lock(guard):
+        return False
+    try:
+        if not _is_stale(lock_path):
+            return False
+        lock_path.unlink(missing_ok=True)
+        return _create_lock(lock_path)
+    finally:
+        guard.unlink(missing_ok=True)
+
+
+def _registered_worktrees(repo_root: Path) -> List[Path]:
+    out = _git(["worktree", "list", "--porcelain"], cwd=repo_root).stdout or ""
+    paths = []
+    for line in out.splitlines():
+        if line.startswith("worktree "):
+            paths.append(Path(line[len("worktree "):]).resolve())
+    return paths
+
+
+class WorktreePool:
+    """
+    Pool of detached `git worktree` checkouts for one repository.
+
+    Slots are directories named `wt-<n>` under `pool_dir`. A slot is claimed by
+    creating its lock file exclusively, so concurrent orchestrator processes on
+    the same runner never share a checkout. The lock records the owner's PID; a
+    lock whose owner has died is reclaimed, so crashed runs neither leak slots
+    nor keep their branch checked out. Released slots are reset to a clean
+    detached state and kept for the next run unless the pool is over `max_size`
+    (`max_size=0` makes every worktree disposable).
+    """
+
+    def __init__(self, repo_root: Path, *, pool_dir: Optional[Path] = None, max_size: int = 4) -> None:
+        if max_size < 0:
+            raise WorktreeError("worktree pool max_size must not be negative")
+        self.repo_root = repo_root.resolve()
+        self.pool_dir = (pool_dir or default_pool_dir(self.repo_root)).resolve()
+        self.max_size = max_size
+
+    def _slots(self) -> List[Path]:
+        if not self.pool_dir.is_dir():
+            return []
+        return sorted(p for p in self.pool_dir.iterdir() if p.is_dir() and p.name.startswith("wt-"))
+
+    def _lock_path(self, slot: Path) -> Path:
+        return self.pool_dir / f"{slot.name}{LOCK_FILENAME}"
+
+    def reclaim_stale(self) -> List[Path]:
+        """
+        Frees slots whose lock is held by a dead process. Each one is detached
+        (so the crashed run's branch can be checked out again) or discarded if
+        it cannot be reset, then unlocked for reuse.
+        """
+        reclaimed = []
+        for slot in self._slots():
+            lock_path = self._lock_path(slot)
+            if not lock_path.exists() or not _is_stale(lock_path) or not _try_lock(lock_path):
+                continue
+            try:
+                head = _git(["rev-parse", "HEAD"], cwd=slot, check=False).stdout.strip()
+                self._reset(slot, head or "HEAD")
+            except WorktreeError:
+                self._discard(slot)
+            finally:
+                lock_path.unlink(missing_ok=True)
+            reclaimed.append(slot)
+        return reclaimed
+
+    def acquire(self, base_ref: str) -> Worktree:
+        self.pool_dir.mkdir(parents=True, exist_ok=True)
+        base_sha = _git(["rev-parse", "--verify", f"{base_ref}^{{commit}}"], cwd=self.repo_root).stdout.strip()
+        self.reclaim_stale()
+        registered = set(_registered_worktrees(self.repo_root))
+
+        for slot in self._slots():
+            lock_path = self._lock_path(slot)
+            if not _try_lock(lock_path):
+                continue
+            if slot.resolve() not in registered:
+                # Directory git no longer knows about (e.g. discarded or pruned); rebuild it in place.
+                shutil.rmtree(slot, ignore_errors=True)
+                return self._create(slot, lock_path, base_sha)
+            try:
+                self._reset(slot, base_sha)
+            except WorktreeError:
+                self._discard(slot)
+                lock_path.unlink(missing_ok=True)
+                continue
+            return Worktree(path=slot, repo_root=self.repo_root, base_ref=base_sha, reused=True, lock_path=lock_path)
+
+        index = 0
+        while True:
+            slot = self.pool_dir / f"wt-{index}"
+            lock_path = self._lock_path(slot)
+            if not slot.exists() and _try_lock(lock_path):
+                break
+            index += 1
+        return self._create(slot, lock_path, base_sha)
+
+    def _create(self, slot: Path, lock_path: Path, base_sha: str) -> Worktree:
+        _git(["worktree", "prune"], cwd=self.repo_root, check=False)
+        try:
+            _git(["worktree", "add", "--detach", str(slot), base_sha], cwd=self.repo_root)
+        except WorktreeError:
+            lock_path.unlink(missing_ok=True)
+            raise
+        return Worktree(path=slot, repo_root=self.repo_root, base_ref=base_sha, reused=False, lock_path=lock_path)
+
+    def release(self, worktree: Worktree) -> None:
+        try:
+            if len(self._slots()) > self.max_size:
+                self._discard(worktree.path)
+            else:
+                self._reset(worktree.path, worktree.base_ref)
+        except WorktreeError:
+            self._discard(worktree.path)
+        finally:
+            worktree.lock_path.unlink(missing_ok=True)
+
+    def _reset(self, slot: Path, base_sha: str) -> None:
+        _git(["checkout", "--detach", "--force", base_sha], cwd=slot)
+        _git(["reset", "--hard", base_sha], cwd=slot)
+        _git(["clean", "-ffdx"], cwd=slot)
+
+    def _discard(self, slot: Path) -> None:
+        _git(["worktree", "remove", "--force", str(slot)], cwd=self.repo_root, check=False)
+        _git(["worktree", "prune"], cwd=self.repo_root, check=False)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Syntax check for Python files without writing bytecode.
+
+Sources are compiled in memory with the builtin `compile()` (what
+py_compile/compileall do before writing a .pyc), so no `__pycache__`
+directories are created. Files that compiled cleanly are remembered by the
+sha256 of their contents, per interpreter cache tag, and are not compiled
+again while unchanged.
+
+    python tools/review/compile_check.py tools/review/run_review.py ...
+"""
+from __future__ import annotations
+
+import concurrent.futures
+import dataclasses
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Iterable, Optional
+
+CACHE_FORMAT = 1
+# Keeps the cache bounded; older entries are dropped first.
+MAX_CACHE_ENTRIES = 20000
+
+
+@dataclasses.dataclass(frozen=True)
+class CompileResult:
+    checked: int
+    cached: int
+    errors: list[str]
+    failed_paths: list[str] = dataclasses.field(default_factory=list)
+
+
+def compile_error(path: str) -> Optional[str]:
+    """None when `path` compiles, otherwise a one-line `path:line: error`."""
+    try:
+        source = Path(path).read_bytes()
+    except OSError as exc:
+        return f"{path}: {exc}"
+    try:
+        compile(source, path, "exec", dont_inherit=True)
+    except SyntaxError as exc:
+        return f"{path}:{exc.lineno or 0}: {type(exc).__name__}: {exc.msg}"
+    except ValueError as exc:  # e.g. source containing null bytes
+        return f"{path}: {type(exc).__name__}: {exc}"
+    return None
+
+
+def _digest(path: str) -> Optional[str]:
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def default_cache_path(git_dir: Path) -> Path:
+    from tools.review.run_review import CACHE_DIRNAME
+
+    return git_dir / CACHE_DIRNAME / f"compile-{sys.implementation.cache_tag}.json"
+
+
+def _load_cache(cache_path: Optional[Path]) -> list[str]:
+    if cache_path is None:
+        return []
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return []
+    if not isinstance(data, dict) or data.get("format") != CACHE_FORMAT:
+        return []
+    ok = data.get("ok")
+    return [d for d in ok if isinstance(d, str)] if isinstance(ok, list) else []
+
+
+def _store_cache(cache_path: Path, ok: list[str]) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps({"format": CACHE_FORMAT, "ok": ok[-MAX_CACHE_ENTRIES:]}), encoding="utf-8")
+    tmp.replace(cache_path)
+
+
+def check_files(
+    paths: Iterable[str],
+    *,
+    cache_path: Optional[Path] = None,
+    parallel: bool = False,
+    max_workers: Optional[int] = None,
+) -> CompileResult:
+    """
+    Compiles every path whose contents are not already known to compile.
+    With `parallel`, cache misses are compiled on a process pool.
+    """
+    files = sorted(set(paths))
+    known = _load_cache(cache_path)
+    known_set = set(known)
+    digests = {path: _digest(path) for path in files}
+    todo = [path for path in files if digests[path] is None or digests[path] not in known_set]
+
+    if parallel and len(todo) > 1:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as pool:
+            outcomes = list(pool.map(compile_error, todo, chunksize=16))
+    else:
+        outcomes = [compile_error(path) for path in todo]
+
+    errors = [error for error in outcomes if error is not None]
+    fresh = [digests[path] for path, error in zip(todo, outcomes) if error is None and digests[path] is not None]
+    if cache_path is not None and fresh:
+        fresh_set = set(fresh)
+        merged = [d for d in known if d not in fresh_set] + list(dict.fromkeys(fresh))
+        try:
+            _store_cache(cache_path, merged)
+        except OSError:
+            pass
+    return CompileResult(
+        checked=len(todo),
+        cached=len(files) - len(todo),
+        errors=errors,
+        failed_paths=[path for path, error in zip(todo, outcomes) if error is not None],
+    )
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    paths = sys.argv[1:] if argv is None else argv
+    result = check_files(paths, parallel=True)
+    for error in result.errors:
+        print(error)
+    return 1 if result.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
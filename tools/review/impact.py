@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Test impact analysis for review checks.
+
+Builds a file-level import graph of the repo's Python sources and test files
+with `ast` (no code is imported or executed) and maps a set of changed paths
+to the test files that import them, directly or transitively. Per-file
+imports are cached by (mtime_ns, size), so only edited files are re-parsed.
+
+    python tools/review/impact.py tools/evidence/index.py tools/review/run_review.py
+"""
+from __future__ import annotations
+
+import ast
+import dataclasses
+import fnmatch
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Iterable, Optional, Sequence
+
+# Directories whose contents are importable as top-level modules.
+IMPORT_ROOTS = (".", "solutions/security/detection-strategy-generator/src")
+# Where importable sources live (scanned for the graph).
+SOURCE_DIRS = ("tools", "solutions/security/detection-strategy-generator/src")
+# Where test files live; files named test_*.py under these are tests.
+TEST_DIRS = (
+    "tests",
+    "tools/evidence/tests",
+    "tools/review/tests",
+    "solutions/security/detection-strategy-generator/tests",
+)
+# Changes to these affect every test: pytest config and the YAML inputs
+# (policy, taskpack schema and taskpacks, workspace registry) that tests
+# read from disk rather than import.
+GLOBAL_TRIGGERS = frozenset(
+    {
+        "pytest.ini",
+        "pyproject.toml",
+        "uv.lock",
+        "conftest.py",
+        "tools/orchestrator/policy.yml",
+        "taskpacks/schema.yml",
+        "workspaces/registry.yml",
+    }
+)
+# fnmatch patterns; `*` also matches `/`.
+GLOBAL_TRIGGER_PATTERNS = ("taskpacks/*.yml", "taskpacks/*.yaml")
+
+SKIP_DIRS = {".git", ".orchestrator_logs", ".venv", "node_modules", "__pycache__"}
+CACHE_FORMAT = 1
+
+
+@dataclasses.dataclass
+class ImportGraph:
+    # Repo-relative posix path -> repo-relative paths it imports.
+    deps: dict[str, set[str]]
+    tests: list[str]
+
+    def dependents(self) -> dict[str, set[str]]:
+        reverse: dict[str, set[str]] = {}
+        for path, deps in self.deps.items():
+            for dep in deps:
+                reverse.setdefault(dep, set()).add(path)
+        return reverse
+
+
+def _iter_py_files(root: Path, dirs: Iterable[str]) -> Iterable[Path]:
+    for rel in dirs:
+        base = root / rel
+        if not base.is_dir():
+            continue
+        for path in base.rglob("*.py"):
+            if not any(part in SKIP_DIRS for part in path.relative_to(root).parts):
+                yield path
+
+
+def module_name(rel_path: str, import_roots: Sequence[str]) -> Optional[str]:
+    """Dotted module name of a repo-relative file under the deepest import root."""
+    best: Optional[tuple[str, ...]] = None
+    for import_root in import_roots:
+        prefix = () if import_root in ("", ".") else tuple(Path(import_root).parts)
+        parts = tuple(Path(rel_path).with_suffix("").parts)
+        if parts[: len(prefix)] == prefix and (best is None or len(prefix) > len(best)):
+            best = prefix
+    if best is None:
+        return None
+    parts = list(Path(rel_path).with_suffix("").parts[len(best):])
+    if parts and parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts) or None
+
+
+def parse_imports(source: str, module: Optional[str], *, is_package: bool) -> list[str]:
+    """
+    Module names referenced by import statements anywhere in the source
+    (including function-local imports), plus dotted string literals, which
+    catch `python -m pkg.mod` command lines and importlib-style specs.
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return []
+    package = (module or "") if is_package else (module or "").rpartition(".")[0]
+    names: set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                base_parts = package.split(".") if package else []
+                if node.level > 1:
+                    base_parts = base_parts[: len(base_parts) - (node.level - 1)]
+                base = ".".join(filter(None, [*base_parts, node.module or ""]))
+            else:
+                base = node.module or ""
+            if base:
+                names.add(base)
+            names.update(f"{base}.{alias.name}" if base else alias.name for alias in node.names if alias.name != "*")
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+            value = node.value.split(":", 1)[0]
+            if "." in value and value.replace(".", "").replace("_", "").isalnum() and not value[0].isdigit():
+                names.add(value)
+    return sorted(names)
+
+
+def _load_cache(cache_path: Optional[Path]) -> dict[str, list]:
+    if cache_path is None:
+        return {}
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("format") != CACHE_FORMAT or not isinstance(data.get("files"), dict):
+        return {}
+    return data["files"]
+
+
+def _store_cache(cache_path: Path, files: dict[str, list]) -> None:
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps({"format": CACHE_FORMAT, "files": files}, sort_keys=True), encoding="utf-8")
+    tmp.replace(cache_path)
+
+
+def default_cache_path(git_dir: Path) -> Path:
+    from tools.review.run_review import CACHE_DIRNAME
+
+    return git_dir / CACHE_DIRNAME / "impact-graph.json"
+
+
+def build_graph(
+    root: Path,
+    *,
+    cache_path: Optional[Path] = None,
+    import_roots: Sequence[str] = IMPORT_ROOTS,
+    source_dirs: Sequence[str] = SOURCE_DIRS,
+    test_dirs: Sequence[str] = TEST_DIRS,
+) -> ImportGraph:
+    root = Path(root)
+    files = sorted({p.relative_to(root).as_posix() for p in _iter_py_files(root, [*source_dirs, *test_dirs])})
+    modules: dict[str, str] = {}
+    for rel in files:
+        name = module_name(rel, import_roots)
+        if name:
+            modules.setdefault(name, rel)
+
+    cached = _load_cache(cache_path)
+    fresh: dict[str, list] = {}
+    imports: dict[str, list[str]] = {}
+    for rel in files:
+        st = (root / rel).stat()
+        stamp = [st.st_mtime_ns, st.st_size]
+        entry = cached.get(rel)
+        if isinstance(entry, list) and len(entry) == 2 and entry[0] == stamp:
+            names = list(entry[1])
+        else:
+            source = (root / rel).read_text(encoding="utf-8", errors="replace")
+            names = parse_imports(source, module_name(rel, import_roots), is_package=rel.endswith("/__init__.py"))
+        fresh[rel] = [stamp, names]
+        imports[rel] = names
+    if cache_path is not None and fresh != cached:
+        try:
+            _store_cache(cache_path, fresh)
+        except OSError:
+            pass
+
+    deps: dict[str, set[str]] = {}
+    for rel in files:
+        targets: set[str] = set()
+        for name in imports[rel]:
+            # `import a.b.c` also executes a/__init__ and a/b/__init__.
+            parts = name.split(".")
+            for i in range(1, len(parts) + 1):
+                target = modules.get(".".join(parts[:i]))
+                if target and target != rel:
+                    targets.add(target)
+        deps[rel] = targets
+
+    tests: list[str] = []
+    test_prefixes = tuple(f"{d.rstrip('/')}/" for d in test_dirs)
+    for rel in files:
+        if rel.startswith(test_prefixes) and Path(rel).name.startswith("test_"):
+            tests.append(rel)
+            # conftest.py files in the test's directory and its parents apply to it.
+            for parent in Path(rel).parents:
+                conftest = (parent / "conftest.py").as_posix()
+                if conftest in deps:
+                    deps[rel].add(conftest)
+    return ImportGraph(deps=deps, tests=tests)
+
+
+def is_global_trigger(path: str) -> bool:
+    return path in GLOBAL_TRIGGERS or any(fnmatch.fnmatchcase(path, pattern) for pattern in GLOBAL_TRIGGER_PATTERNS)
+
+
+def _affected(reverse: dict[str, set[str]], start: Iterable[str]) -> set[str]:
+    affected: set[str] = set()
+    stack = list(start)
+    while stack:
+        path = stack.pop()
+        if path in affected:
+            continue
+        affected.add(path)
+        stack.extend(reverse.get(path, ()))
+    return affected
+
+
+def impacted_tests(graph: ImportGraph, changed_files: Iterable[str]) -> list[str]:
+    """
+    Test files affected by `changed_files`: changed tests themselves plus tests
+    that transitively import a changed file. A change to a global trigger
+    (pytest config, lock file, root conftest, policy/schema/taskpack YAML)
+    selects every test.
+    """
+    changed = {Path(f).as_posix() for f in changed_files}
+    if any(is_global_trigger(f) for f in changed):
+        return list(graph.tests)
+    affected = _affected(graph.dependents(), (f for f in changed if f in graph.deps))
+    return [test for test in graph.tests if test in affected]
+
+
+def unmapped_paths(graph: ImportGraph, changed_files: Iterable[str]) -> list[str]:
+    """
+    Changed paths the graph cannot map to a test: files outside it (data,
+    config, scripts elsewhere) and sources no test imports, such as scripts
+    tests only run by path. Callers should not treat these as untested.
+    """
+    tests = set(graph.tests)
+    reverse = graph.dependents()
+    unmapped: list[str] = []
+    for f in dict.fromkeys(Path(p).as_posix() for p in changed_files):
+        if is_global_trigger(f):
+            continue
+        if f not in graph.deps or not (_affected(reverse, [f]) & tests):
+            unmapped.append(f)
+    return unmapped
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    changed = sys.argv[1:] if argv is None else argv
+    graph = build_graph(Path.cwd())
+    for test in impacted_tests(graph, changed):
+        print(test)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,12 +2,22 @@
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
+import dataclasses
 import datetime as dt
+import fnmatch
+import hashlib
 import json
+import os
+import subprocess
 import sys
+import time
 from pathlib import Path
 from typing import Any, Callable, Iterable
 
+from tools.common import git_diff
+from tools.taskpacks import catalog
+
 TIER1_FILES = [
     "docs/System Overview.md",
     "docs/Architecture & Roadmap.md",
@@ -21,21 +31,21 @@ TIER1_FILES = [
     "docs/TEAM_GUIDE.md",
 ]
 
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
 RELEASE_NOTES_DIR = "docs/releases"
 RELEASE_NOTES_GLOB = "RELEASE_NOTES_*.md"
 
-REQUIRED_TASKPACK_FILES = [
-    "task.yml",
-    "spec.md",
-    "acceptance.yml",
-    "risk.md",
-    "runbook.md",
-]
+REQUIRED_TASKPACK_FILES = list(catalog.REQUIRED_FILES)
 
-SCHEMA_VERSION = 1
+SCHEMA_VERSION = 2
 TOOL_NAME = "tools.review.run_review"
 TOOL_VERSION = "unknown"
 
+# Per-commit check results reused by --changed-since, under the git dir.
+CACHE_DIRNAME = "codex-review-cache"
+CACHE_FORMAT = 1
+
 CATEGORY_DOCS = "docs"
 CATEGORY_TASKPACK = "taskpack"
 CATEGORY_REPO = "repo"
@@ -99,6 +109,29 @@ def rfc3339_utc_now() -> str:
     return timestamp.replace("+00:00", "Z")
 
 
+CheckFunc = Callable[[Path], list[dict[str, object]]]
+
+
+@dataclasses.dataclass(frozen=True)
+class ReviewCheck:
+    name: str
+    func: CheckFunc
+    # Glob patterns (relative to the repo root) of every path the check reads.
+    inputs: tuple[str, ...]
+
+
+CHECKS: list[ReviewCheck] = []
+
+
+def register_check(*, inputs: Iterable[str]) -> Callable[[CheckFunc], CheckFunc]:
+    def decorator(func: CheckFunc) -> CheckFunc:
+        CHECKS.append(ReviewCheck(name=func.__name__, func=func, inputs=tuple(inputs)))
+        return func
+
+    return decorator
+
+
+@register_check(inputs=[*TIER1_FILES, RELEASE_NOTES_DIR, f"{RELEASE_NOTES_DIR}/{RELEASE_NOTES_GLOB}"])
 def check_tier1_docs(root: Path) -> list[dict[str, object]]:
     violations: list[dict[str, object]] = []
 
@@ -142,6 +175,7 @@ def check_tier1_docs(root: Path) -> list[dict[str, object]]:
     return violations
 
 
+@register_check(inputs=["taskpacks", "taskpacks/TASK-*", *(f"taskpacks/TASK-*/{name}" for name in REQUIRED_TASKPACK_FILES)])
 def check_taskpack_structure(root: Path) -> list[dict[str, object]]:
     violations: list[dict[str, object]] = []
     taskpacks_root = root / "taskpacks"
@@ -157,14 +191,12 @@ def check_taskpack_structure(root: Path) -> list[dict[str, object]]:
         )
         return violations
 
-    taskpack_dirs = sorted(
-        [p for p in taskpacks_root.iterdir() if p.is_dir() and p.name.startswith("TASK-")],
-        key=lambda p: p.name,
-    )
-    for taskpack_dir in taskpack_dirs:
+    # Existence only: stat the required files rather than loading the taskpacks.
+    for taskpack_dir in catalog.taskpack_dirs(taskpacks_root):
+        missing = catalog.missing_files(taskpack_dir)
         for filename in REQUIRED_TASKPACK_FILES:
             rel_path = f"taskpacks/{taskpack_dir.name}/{filename}"
-            if not (taskpack_dir / filename).is_file():
+            if filename in missing:
                 violations.append(
                     build_violation(
                         RULE_TASKPACK_FILE_MISSING,
@@ -178,18 +210,230 @@ def check_taskpack_structure(root: Path) -> list[dict[str, object]]:
     return violations
 
 
-CHECKS: list[Callable[[Path], list[dict[str, object]]]] = [
-    check_tier1_docs,
-    check_taskpack_structure,
-]
+def check_reads(check: ReviewCheck, paths: Iterable[str]) -> bool:
+    """True when any path (or one of its parent directories) matches the check's inputs."""
+    for path in paths:
+        parts = path.split("/")
+        candidates = ["/".join(parts[: i + 1]) for i in range(len(parts))]
+        if any(fnmatch.fnmatchcase(c, pattern) for c in candidates for pattern in check.inputs):
+            return True
+    return False
 
 
-def generate_report(root: Path, mode: str) -> dict[str, Any]:
-    violations: list[dict[str, object]] = []
-    for check in CHECKS:
-        violations.extend(check(root))
+def _git(root: Path, *args: str) -> str | None:
+    try:
+        proc = subprocess.run(["git", *args], cwd=root, capture_output=True, text=True, check=False)
+    except OSError:
+        return None
+    return proc.stdout if proc.returncode == 0 else None
+
+
+def resolve_commit(root: Path, ref: str) -> str | None:
+    out = _git(root, "rev-parse", "--verify", "--quiet", f"{ref}^{{commit}}")
+    return out.strip() if out else None
+
+
+def changed_paths(root: Path, ref: str) -> set[str] | None:
+    """
+    Root-relative paths that differ between `ref` and the working tree, per
+    tools.common.git_diff (a rename counts as both its old and new path),
+    plus untracked (non-ignored) files. None when git cannot tell.
+    """
+    prefix = _git(root, "rev-parse", "--show-prefix")
+    untracked = _git(root, "ls-files", "--others", "--exclude-standard")
+    if prefix is None or untracked is None:
+        return None
+    try:
+        summary = git_diff.diff_summary(ref, None, cwd=root)
+    except (git_diff.GitDiffError, OSError):
+        return None
+    prefix = prefix.strip()
+    paths = {line for line in untracked.splitlines() if line}
+    for change in summary.changes:
+        for path in (change.path, change.old_path):
+            if path and path.startswith(prefix):
+                paths.add(path[len(prefix):])
+    return paths
+
+
+def _module_file(name: str) -> Path | None:
+    base = REPO_ROOT.joinpath(*name.split("."))
+    for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def check_source_files(checks: Iterable[ReviewCheck] | None = None) -> list[Path]:
+    """
+    This module, the modules defining the registered checks and every in-repo
+    module they import, directly or transitively.
+    """
+    from tools.review import impact
+
+    pending = [Path(__file__).resolve()]
+    for check in CHECKS if checks is None else checks:
+        module_path = getattr(sys.modules.get(check.func.__module__), "__file__", None)
+        if module_path:
+            pending.append(Path(module_path).resolve())
+    seen: set[Path] = set()
+    while pending:
+        path = pending.pop()
+        if path in seen or not path.is_relative_to(REPO_ROOT):
+            continue
+        seen.add(path)
+        try:
+            source = path.read_text(encoding="utf-8")
+        except OSError:
+            continue
+        rel = path.relative_to(REPO_ROOT).as_posix()
+        module = impact.module_name(rel, (".",))
+        for name in impact.parse_imports(source, module, is_package=path.name == "__init__.py"):
+            parts = name.split(".")
+            for i in range(1, len(parts) + 1):
+                target = _module_file(".".join(parts[:i]))
+                if target is not None:
+                    pending.append(target.resolve())
+    return sorted(seen)
+
+
+def checks_fingerprint(checks: Iterable[ReviewCheck] | None = None) -> str:
+    """Changes whenever the registered checks or any module they depend on change."""
+    checks = list(CHECKS if checks is None else checks)
+    h = hashlib.sha256()
+    for path in check_source_files(checks):
+        h.update(path.relative_to(REPO_ROOT).as_posix().encode("utf-8") + b"\0")
+        h.update(path.read_bytes())
+    for check in checks:
+        h.update(json.dumps([check.name, check.func.__module__, list(check.inputs)]).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _cache_path(cache_dir: Path, commit: str) -> Path:
+    return cache_dir / f"{commit}.json"
+
+
+def load_cached_results(cache_dir: Path, commit: str, fingerprint: str) -> dict[str, list[dict[str, object]]] | None:
+    try:
+        entry = json.loads(_cache_path(cache_dir, commit).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get("format") != CACHE_FORMAT or entry.get("fingerprint") != fingerprint:
+        return None
+    results = entry.get("checks")
+    if not isinstance(results, dict) or set(results) != {check.name for check in CHECKS}:
+        return None
+    return results
+
+
+def store_cached_results(
+    cache_dir: Path,
+    commit: str,
+    fingerprint: str,
+    results: dict[str, list[dict[str, object]]],
+) -> None:
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    path = _cache_path(cache_dir, commit)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(
+        json.dumps({"format": CACHE_FORMAT, "fingerprint": fingerprint, "commit": commit, "checks": results}, sort_keys=True),
+        encoding="utf-8",
+    )
+    tmp.replace(path)
+
+
+def _timed(check: ReviewCheck, root: Path) -> tuple[list[dict[str, object]], float]:
+    started = time.perf_counter()
+    violations = check.func(root)
+    return violations, round(time.perf_counter() - started, 6)
+
+
+def run_checks(
+    root: Path,
+    checks: Iterable[ReviewCheck] | None = None,
+    *,
+    max_workers: int | None = None,
+) -> tuple[dict[str, list[dict[str, object]]], dict[str, float]]:
+    """
+    Runs the checks on a thread pool. Returns each check's violations and
+    duration in seconds, both keyed by check name in registration order.
+    """
+    selected = list(CHECKS if checks is None else checks)
+    results: dict[str, list[dict[str, object]]] = {}
+    timings: dict[str, float] = {}
+    if not selected:
+        return results, timings
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers or len(selected)) as pool:
+        futures = [pool.submit(_timed, check, root) for check in selected]
+        for check, future in zip(selected, futures):
+            results[check.name], timings[check.name] = future.result()
+    return results, timings
+
+
+def _run_incremental(
+    root: Path,
+    ref: str,
+    *,
+    max_workers: int | None,
+) -> tuple[dict[str, list[dict[str, object]]], dict[str, float], dict[str, Any]]:
+    """
+    Reuses the cached results for `ref`'s commit for every check whose inputs
+    did not change since then, and reruns the rest. Without a cache entry (or
+    outside a git repository) every check runs. The merged results are stored
+    for HEAD when the working tree matches HEAD for every check's inputs.
+    """
+    fingerprint = checks_fingerprint()
+    git_dir_out = _git(root, "rev-parse", "--absolute-git-dir")
+    cache_dir = Path(git_dir_out.strip()) / CACHE_DIRNAME if git_dir_out else None
+    commit = resolve_commit(root, ref) if cache_dir is not None else None
+    changed = changed_paths(root, commit) if commit is not None else None
+
+    cached: dict[str, list[dict[str, object]]] | None = None
+    if cache_dir is not None and commit is not None and changed is not None:
+        cached = load_cached_results(cache_dir, commit, fingerprint)
+
+    if cached is None:
+        selected = list(CHECKS)
+    else:
+        selected = [check for check in CHECKS if check_reads(check, changed or ())]
+    ran, timings = run_checks(root, selected, max_workers=max_workers)
+    results = {check.name: ran[check.name] if check.name in ran else (cached or {})[check.name] for check in CHECKS}
+
+    if cache_dir is not None:
+        head = resolve_commit(root, "HEAD")
+        dirty = changed_paths(root, "HEAD") if head is not None else None
+        if head is not None and dirty is not None and not any(check_reads(check, dirty) for check in CHECKS):
+            try:
+                store_cached_results(cache_dir, head, fingerprint, results)
+            except OSError:
+                pass
+
+    incremental = {
+        "ref": ref,
+        "commit": commit,
+        "cache": "hit" if cached is not None else "miss",
+        "changed_paths": None if changed is None else len(changed),
+        "checks_run": [check.name for check in selected],
+        "checks_reused": [check.name for check in CHECKS if check.name not in ran],
+    }
+    return results, timings, incremental
 
-    sorted_violations = sort_violations(violations)
+
+def generate_report(
+    root: Path,
+    mode: str,
+    *,
+    max_workers: int | None = None,
+    changed_since: str | None = None,
+) -> dict[str, Any]:
+    started = time.perf_counter()
+    incremental: dict[str, Any] | None = None
+    if changed_since is None:
+        results, check_timings = run_checks(root, max_workers=max_workers)
+    else:
+        results, check_timings, incremental = _run_incremental(root, changed_since, max_workers=max_workers)
+
+    sorted_violations = sort_violations(v for violations in results.values() for v in violations)
     status = "pass" if not sorted_violations else "fail"
 
     report: dict[str, Any] = {
@@ -204,7 +448,13 @@ def generate_report(root: Path, mode: str) -> dict[str, Any]:
         },
         "root": root.resolve().as_posix(),
         "violations": sorted_violations,
+        "timings": {
+            "total_s": round(time.perf_counter() - started, 6),
+            "checks": check_timings,
+        },
     }
+    if incremental is not None:
+        report["incremental"] = incremental
     return report
 
 
@@ -217,8 +467,8 @@ def write_report(report_text: str, report_path: Path) -> None:
     report_path.write_text(report_text, encoding="utf-8")
 
 
-def run_review(root: Path, mode: str, report_path: Path) -> int:
-    report = generate_report(root, mode)
+def run_review(root: Path, mode: str, report_path: Path, *, changed_since: str | None = None) -> int:
+    report = generate_report(root, mode, changed_since=changed_since)
     report_text = serialize_report(report)
     write_report(report_text, report_path)
 
@@ -240,13 +490,19 @@ def parse_args(argv: list[str]) -> argparse.Namespace:
         default="review-report.json",
         help="Path to write JSON report",
     )
+    parser.add_argument(
+        "--changed-since",
+        metavar="REF",
+        default=None,
+        help="Only rerun checks whose inputs changed since REF; reuse cached results for the rest",
+    )
     return parser.parse_args(argv)
 
 
 def main(argv: list[str] | None = None) -> int:
     args = parse_args(argv or sys.argv[1:])
     try:
-        return run_review(Path.cwd(), args.mode, Path(args.report_path))
+        return run_review(Path.cwd(), args.mode, Path(args.report_path), changed_since=args.changed_since)
     except Exception as exc:  # pragma: no cover - defensive error path
         print(f"review: error: {exc}", file=sys.stderr)
         return 1
@@ -2,13 +2,27 @@
 from __future__ import annotations
 
 import argparse
+import dataclasses
+import importlib.util
 import os
 from pathlib import Path
 import subprocess
 import sys
-import tempfile
-import shutil
-from typing import Iterable
+import threading
+import time
+from typing import Callable, Iterable
+
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from tools.acceptance import language_scan  # noqa: E402
+from tools.common import git_diff  # noqa: E402
+from tools.review import compile_check, impact  # noqa: E402
+from tools.review.run_review import TOOL_VERSION, rfc3339_utc_now, serialize_report  # noqa: E402
+
+JSON_SCHEMA_VERSION = 1
+TOOL_NAME = "tools.review.run_review_checks"
 
 ALLOWED_PREFIXES = (
     ".github/workflows/",
@@ -16,6 +30,11 @@ ALLOWED_PREFIXES = (
     "solutions/",
     "taskpacks/",
     "tools/acceptance/",
+    # Review-approved additions; each is new tooling with no orchestrator side effects.
+    "tools/bench/",  # standalone benchmarks, never imported by the orchestrator or hooks
+    "tools/common/",  # shared git diff and YAML loading used by review, acceptance and orchestrator
+    "tools/evidence/",  # evidence index and schemas; indexes run output, never mutates repo state
+    "tools/taskpacks/",  # read-only taskpack catalog shared by review and orchestrator
     "tools/review/",
     "scripts/",
     "tests/",
@@ -31,8 +50,30 @@ ALLOWED_FILES = {
 ORCHESTRATOR_ALLOWLIST = {
     # Add explicit paths here if orchestrator changes are approved.
     "tools/orchestrator/orchestrate.py",
+    # Review-approved: run isolation, resume and command execution.
+    "tools/orchestrator/worktrees.py",
+    "tools/orchestrator/process.py",
+    "tools/orchestrator/retry.py",
+    "tools/orchestrator/policy.yml",
+    "tools/orchestrator/acceptance_cache.py",
+    # Review-approved: phase prompt and Codex event handling.
+    "tools/orchestrator/prompt_context.py",
+    "tools/orchestrator/codex_events.py",
+    # Review-approved: taskpack and workspace loading.
+    "tools/orchestrator/validate_taskpack.py",
+    "tools/orchestrator/workspaces.py",
+    # Review-approved: plugin registry, execution and sandboxing.
+    "tools/orchestrator/plugins/loader.py",
+    "tools/orchestrator/plugins/runner.py",
+    "tools/orchestrator/plugins/executor.py",
+    "tools/orchestrator/plugins/interface.py",
+    "tools/orchestrator/plugins/sandbox.py",
+    "tools/orchestrator/plugins/step_cache.py",
 }
 
+# Always-safe tests run by --fast when impact analysis cannot vouch for a change.
+CANARY_TESTS = ("tests/test_taskpack_canaries.py",)
+
 TIER1_DOCS = {
     "docs/Current Status.md": {"non_empty": True},
     "docs/GOVERNANCE.md": {"non_empty": False},
@@ -45,16 +86,37 @@ REQUIRED_PATHS_FOR_TIER1_CHECK = (
     "tools/orchestrator/",
 )
 
+FORBIDDEN_LANGUAGE_RULES = ("qualitative", "deploy")
+
+
+# Child processes of running stages, so stages over the time budget can be stopped.
+_RUNNING: set[subprocess.Popen] = set()
+_RUNNING_LOCK = threading.Lock()
+
 
 def run_cmd(cmd: list[str], env: dict[str, str] | None = None) -> tuple[int, str]:
-    proc = subprocess.run(
+    proc = subprocess.Popen(
         cmd,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
         text=True,
         env=env,
     )
-    return proc.returncode, proc.stdout.strip()
+    with _RUNNING_LOCK:
+        _RUNNING.add(proc)
+    try:
+        output, _ = proc.communicate()
+    finally:
+        with _RUNNING_LOCK:
+            _RUNNING.discard(proc)
+    return proc.returncode, output.strip()
+
+
+def terminate_running_commands() -> None:
+    with _RUNNING_LOCK:
+        procs = list(_RUNNING)
+    for proc in procs:
+        proc.kill()
 
 
 def git_ref_exists(ref: str) -> bool:
@@ -73,11 +135,10 @@ def resolve_base_ref(explicit_ref: str | None) -> str:
 
 
 def get_changed_files(base_ref: str) -> tuple[list[str], str | None]:
-    code, output = run_cmd(["git", "diff", "--name-only", f"{base_ref}...HEAD"])
-    if code != 0:
-        return [], output
-    files = [line.strip() for line in output.splitlines() if line.strip()]
-    return files, None
+    try:
+        return git_diff.changed_paths(base_ref, cwd=Path.cwd()), None
+    except git_diff.GitDiffError as exc:
+        return [], str(exc)
 
 
 def format_list(title: str, items: Iterable[str]) -> list[str]:
@@ -89,7 +150,7 @@ def format_list(title: str, items: Iterable[str]) -> list[str]:
     return lines
 
 
-def check_scope(changed_files: list[str]) -> tuple[list[str], bool]:
+def check_scope(changed_files: list[str], offending: list[str] | None = None) -> tuple[list[str], bool]:
     lines: list[str] = []
     hard_fail = False
 
@@ -112,6 +173,9 @@ def check_scope(changed_files: list[str]) -> tuple[list[str], bool]:
             continue
         out_of_scope.append(f)
 
+    if offending is not None:
+        offending.extend(dict.fromkeys(orchestrator_hits + out_of_scope))
+
     if out_of_scope:
         hard_fail = True
         lines.append("[FAIL] Out-of-scope path change detected")
@@ -123,7 +187,7 @@ def check_scope(changed_files: list[str]) -> tuple[list[str], bool]:
     return lines, hard_fail
 
 
-def check_tier1_docs(changed_files: list[str]) -> tuple[list[str], bool]:
+def check_tier1_docs(changed_files: list[str], offending: list[str] | None = None) -> tuple[list[str], bool]:
     lines: list[str] = []
     hard_fail = False
 
@@ -140,6 +204,8 @@ def check_tier1_docs(changed_files: list[str]) -> tuple[list[str], bool]:
         if not path.exists():
             lines.append(f"[FAIL] Missing required doc: {path_str}")
             hard_fail = True
+            if offending is not None:
+                offending.append(path_str)
             continue
         if rules.get("non_empty"):
             try:
@@ -147,78 +213,137 @@ def check_tier1_docs(changed_files: list[str]) -> tuple[list[str], bool]:
             except OSError as exc:
                 lines.append(f"[FAIL] Unable to read {path_str}: {exc}")
                 hard_fail = True
+                if offending is not None:
+                    offending.append(path_str)
                 continue
             if not content:
                 lines.append(f"[FAIL] Required doc is empty: {path_str}")
                 hard_fail = True
+                if offending is not None:
+                    offending.append(path_str)
                 continue
         lines.append(f"[PASS] {path_str}")
 
     return lines, hard_fail
 
 
-def copy_changed_files(changed_files: list[str]) -> Path | None:
-    if not changed_files:
-        return None
-    temp_dir = Path(tempfile.mkdtemp(prefix="review-checks-"))
-    for rel_path in changed_files:
-        src = Path(rel_path)
-        if not src.exists() or not src.is_file():
-            continue
-        dest = temp_dir / rel_path
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(src, dest)
-    return temp_dir
-
-
-def check_forbidden_language(changed_files: list[str]) -> tuple[list[str], bool]:
+def check_forbidden_language(changed_files: list[str], offending: list[str] | None = None) -> tuple[list[str], bool]:
     lines: list[str] = []
     hard_fail = False
 
-    scoped_root = copy_changed_files(changed_files)
-    if scoped_root is None:
+    if not changed_files:
         return ["[SKIP] Forbidden language checks (no changed files)"], False
 
-    checks = [
-        [sys.executable, "tools/acceptance/check_no_qualitative_language.py", "--path", str(scoped_root)],
-        [sys.executable, "tools/acceptance/check_no_deploy_language.py", "--path", str(scoped_root)],
-    ]
-    for cmd in checks:
-        code, output = run_cmd(cmd)
-        label = " ".join(cmd)
-        if code != 0:
+    # Changed files are scanned in place, each read once for all rules.
+    scanner = language_scan.scanner_for(FORBIDDEN_LANGUAGE_RULES)
+    hits = scanner.scan(Path(f) for f in changed_files)
+    if offending is not None:
+        offending.extend(dict.fromkeys(hit.path for hit in hits))
+    for name in FORBIDDEN_LANGUAGE_RULES:
+        label = f"No {language_scan.RULES[name].description} in changed files ({name})"
+        rule_hits = [hit.format() for hit in hits if hit.rule == name]
+        if rule_hits:
             hard_fail = True
             lines.append(f"[FAIL] {label}")
-            if output:
-                lines.extend(format_list("Output:", output.splitlines()))
+            lines.extend(format_list("Output:", rule_hits[: language_scan.MAX_REPORTED_HITS]))
         else:
             lines.append(f"[PASS] {label}")
 
-    shutil.rmtree(scoped_root, ignore_errors=True)
     return lines, hard_fail
 
 
-def check_compileall() -> tuple[list[str], bool]:
-    code, output = run_cmd([sys.executable, "-m", "compileall", "-q", "."])
+def list_python_files() -> list[str]:
+    code, output = run_cmd(["git", "ls-files", "--cached", "--others", "--exclude-standard", "--", "*.py"])
     if code != 0:
-        lines = ["[FAIL] python -m compileall -q ."]
-        if output:
-            lines.extend(format_list("Output:", output.splitlines()))
+        return []
+    return [line for line in output.splitlines() if line and Path(line).is_file()]
+
+
+def git_dir() -> Path | None:
+    code, output = run_cmd(["git", "rev-parse", "--absolute-git-dir"])
+    return Path(output) if code == 0 and output else None
+
+
+def compile_cache_path() -> Path | None:
+    directory = git_dir()
+    return compile_check.default_cache_path(directory) if directory is not None else None
+
+
+def check_compileall(
+    mode: str,
+    changed_files: list[str],
+    offending: list[str] | None = None,
+) -> tuple[list[str], bool]:
+    if mode == "fast":
+        files = [f for f in changed_files if f.endswith(".py") and Path(f).is_file()]
+        scope = "changed Python files"
+    else:
+        files = list_python_files()
+        scope = "tracked Python files"
+    if not files:
+        return [f"[SKIP] Compile check (no {scope})"], False
+
+    result = compile_check.check_files(files, cache_path=compile_cache_path(), parallel=mode == "full")
+    label = f"Compile check: {len(files)} {scope} ({result.checked} compiled, {result.cached} unchanged)"
+    if offending is not None:
+        offending.extend(result.failed_paths)
+    if result.errors:
+        lines = [f"[FAIL] {label}"]
+        lines.extend(format_list("Output:", result.errors))
         return lines, True
-    return ["[PASS] python -m compileall -q ."], False
+    return [f"[PASS] {label}"], False
+
+
+def select_impacted_tests(changed_files: list[str]) -> list[str]:
+    """
+    Tests for --fast: the impacted tests, plus the canary tests (the original
+    fast set) whenever nothing is selected or a changed path is one the
+    import graph cannot map, such as YAML inputs or scripts run by path.
+    """
+    directory = git_dir()
+    graph = impact.build_graph(
+        Path.cwd(),
+        cache_path=impact.default_cache_path(directory) if directory is not None else None,
+    )
+    tests = impact.impacted_tests(graph, changed_files)
+    if not tests or impact.unmapped_paths(graph, changed_files):
+        tests = list(dict.fromkeys([*CANARY_TESTS, *tests]))
+    return tests
+
+
+def failed_test_paths(pytest_output: str) -> list[str]:
+    """Test files named in pytest's short summary (`FAILED path::test`, `ERROR path`)."""
+    paths: dict[str, None] = {}
+    for line in pytest_output.splitlines():
+        for prefix in ("FAILED ", "ERROR "):
+            if line.startswith(prefix):
+                target = line[len(prefix):].split(" - ", 1)[0].split("::", 1)[0].strip()
+                if target:
+                    paths[target] = None
+    return list(paths)
 
 
-def check_tests(mode: str) -> tuple[list[str], bool]:
+def check_tests(mode: str, changed_files: list[str], offending: list[str] | None = None) -> tuple[list[str], bool]:
     env = os.environ.copy()
     env["PYTHONPATH"] = "." + os.pathsep + env.get("PYTHONPATH", "")
 
     if mode == "fast":
-        cmd = [sys.executable, "-m", "pytest", "-q", "tests/test_taskpack_canaries.py"]
+        try:
+            tests = select_impacted_tests(changed_files)
+        except Exception as exc:  # fall back to the canary rather than skipping tests
+            print(f"[review-checks] test impact analysis failed ({exc}); running canary tests", file=sys.stderr)
+            tests = list(CANARY_TESTS)
+        cmd = [sys.executable, "-m", "pytest", "-q"]
+        if len(tests) > 1 and importlib.util.find_spec("xdist") is not None:
+            cmd += ["-n", "auto"]
+        cmd += tests
     else:
         cmd = [sys.executable, "-m", "pytest", "-q"]
 
     code, output = run_cmd(cmd, env=env)
     label = " ".join(cmd)
+    if code != 0 and offending is not None:
+        offending.extend(failed_test_paths(output))
     if code != 0:
         lines = [f"[FAIL] {label}"]
         if output:
@@ -227,6 +352,160 @@ def check_tests(mode: str) -> tuple[list[str], bool]:
     return [f"[PASS] {label}"], False
 
 
+@dataclasses.dataclass(frozen=True)
+class Stage:
+    name: str
+    title: str
+    # Called with a list to collect offending paths into.
+    run: Callable[[list[str]], tuple[list[str], bool]]
+
+
+@dataclasses.dataclass
+class StageResult:
+    name: str
+    title: str
+    lines: list[str]
+    failed: bool
+    duration_s: float
+    timed_out: bool = False
+    paths: list[str] = dataclasses.field(default_factory=list)
+
+    @property
+    def status(self) -> str:
+        if self.timed_out:
+            return "timeout"
+        if self.failed:
+            return "fail"
+        if self.lines and all(line.startswith("[SKIP]") for line in self.lines):
+            return "skip"
+        return "pass"
+
+
+def _run_stage(stage: Stage) -> StageResult:
+    started = time.monotonic()
+    paths: list[str] = []
+    lines, failed = stage.run(paths)
+    return StageResult(stage.name, stage.title, lines, failed, round(time.monotonic() - started, 3), paths=paths)
+
+
+# Threads of stages still running when the time budget ran out.
+_ABANDONED: list[threading.Thread] = []
+
+
+def run_stages(stages: list[Stage], *, deadline: float | None = None) -> list[StageResult]:
+    """
+    Runs independent stages concurrently, each into its own buffer, and
+    returns their results in `stages` order. Stages still running at
+    `deadline` (time.monotonic()) have their commands killed and are reported
+    as skipped, without failing the run. In-process work cannot be killed,
+    so stages run on daemon threads; see `exit_after_stages`.
+    """
+    started = time.monotonic()
+    outcomes: dict[int, tuple[StageResult | None, BaseException | None]] = {}
+
+    def _target(index: int, stage: Stage) -> None:
+        try:
+            outcomes[index] = (_run_stage(stage), None)
+        except BaseException as exc:
+            outcomes[index] = (None, exc)
+
+    threads = [
+        threading.Thread(target=_target, args=(i, stage), name=f"review-stage-{stage.name}", daemon=True)
+        for i, stage in enumerate(stages)
+    ]
+    for thread in threads:
+        thread.start()
+    timeout = None if deadline is None else max(0.0, deadline - started)
+    for thread in threads:
+        thread.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+    finished = dict(outcomes)
+    if len(finished) < len(stages):
+        terminate_running_commands()
+        _ABANDONED.extend(t for i, t in enumerate(threads) if i not in finished)
+
+    results: list[StageResult] = []
+    for i, stage in enumerate(stages):
+        if i not in finished:
+            results.append(
+                StageResult(
+                    stage.name,
+                    stage.title,
+                    [f"[SKIP] Stage exceeded the time budget after {timeout:.0f}s (not blocking)"],
+                    False,
+                    round(time.monotonic() - started, 3),
+                    timed_out=True,
+                )
+            )
+            continue
+        result, exc = finished[i]
+        if exc is not None:
+            raise exc
+        assert result is not None
+        results.append(result)
+    return results
+
+
+def exit_after_stages(code: int) -> None:
+    """
+    Exits with `code`. If stages were abandoned over the time budget, exits
+    immediately with os._exit: a normal exit would wait for their executors
+    (e.g. the compile check's worker pool) and block past the budget.
+    Only call once the report has been written.
+    """
+    if any(thread.is_alive() for thread in _ABANDONED):
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+    sys.exit(code)
+
+
+def build_json_report(
+    *,
+    mode: str,
+    base_ref: str,
+    changed_files: list[str],
+    results: list[StageResult],
+    total_s: float,
+    error: str | None = None,
+) -> dict:
+    failed = [r.name for r in results if r.failed]
+    if error is not None:
+        status = "error"
+    else:
+        status = "fail" if failed else "pass"
+    report: dict = {
+        "schema_version": JSON_SCHEMA_VERSION,
+        "generated_at": rfc3339_utc_now(),
+        "tool": {"name": TOOL_NAME, "version": TOOL_VERSION},
+        "mode": mode,
+        "base_ref": base_ref,
+        "summary": {
+            "stages": len(results),
+            "failed": len(failed),
+            "skipped": sum(1 for r in results if r.status in ("skip", "timeout")),
+            "status": status,
+        },
+        "changed_files": changed_files,
+        "stages": [
+            {
+                "name": r.name,
+                "title": r.title,
+                "status": r.status,
+                "duration_s": r.duration_s,
+                "paths": sorted(r.paths),
+            }
+            for r in results
+        ],
+        "timings": {
+            "total_s": round(total_s, 3),
+            "stages": {r.name: r.duration_s for r in results},
+        },
+    }
+    if error is not None:
+        report["error"] = error
+    return report
+
+
 def write_report(report_text: str, report_file: str | None) -> None:
     if not report_file:
         return
@@ -235,25 +514,52 @@ def write_report(report_text: str, report_file: str | None) -> None:
     path.write_text(report_text, encoding="utf-8")
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
     ap = argparse.ArgumentParser()
     mode = ap.add_mutually_exclusive_group()
     mode.add_argument("--fast", action="store_true", help="Run fast checks (default)")
     mode.add_argument("--full", action="store_true", help="Run full checks")
     ap.add_argument("--base-ref", help="Git base ref for diff")
     ap.add_argument("--report-file", help="Write report to a file path")
-    args = ap.parse_args()
+    ap.add_argument(
+        "--json",
+        dest="json_file",
+        help="Also write a machine-readable JSON report (stage status, duration, offending paths)",
+    )
+    ap.add_argument(
+        "--time-budget",
+        type=float,
+        default=None,
+        help="Seconds after which still-running stages are reported as skipped instead of blocking",
+    )
+    args = ap.parse_args(argv)
+    started = time.monotonic()
+    deadline = None if args.time_budget is None else started + args.time_budget
 
     selected_mode = "full" if args.full else "fast"
     base_ref = resolve_base_ref(args.base_ref)
 
     report_lines = ["Review Checks Report", f"Mode: {selected_mode}", f"Base ref: {base_ref}"]
 
+    def write_json(changed: list[str], results: list[StageResult], error: str | None = None) -> None:
+        if not args.json_file:
+            return
+        report = build_json_report(
+            mode=selected_mode,
+            base_ref=base_ref,
+            changed_files=changed,
+            results=results,
+            total_s=time.monotonic() - started,
+            error=error,
+        )
+        write_report(serialize_report(report) + "\n", args.json_file)
+
     if run_cmd(["git", "rev-parse", "--is-inside-work-tree"])[0] != 0:
         report_lines.append("[FAIL] Git repository not detected")
         report_text = "\n".join(report_lines)
         print(report_text)
         write_report(report_text, args.report_file)
+        write_json([], [], error="git repository not detected")
         return 2
 
     changed_files, diff_error = get_changed_files(base_ref)
@@ -263,43 +569,38 @@ def main() -> int:
         report_text = "\n".join(report_lines)
         print(report_text)
         write_report(report_text, args.report_file)
+        write_json([], [], error="unable to compute git diff")
         return 2
 
     report_lines.extend(format_list("Changed files:", changed_files))
 
+    # The stages are independent; they run concurrently and report in this order.
+    stages = [
+        Stage("scope", "Scope & Boundary Checks", lambda paths: check_scope(changed_files, paths)),
+        Stage("tier1_docs", "Tier-1 Documentation Checks", lambda paths: check_tier1_docs(changed_files, paths)),
+        Stage("compile", "Compile Checks", lambda paths: check_compileall(selected_mode, changed_files, paths)),
+        Stage("tests", "Test Checks", lambda paths: check_tests(selected_mode, changed_files, paths)),
+        Stage(
+            "forbidden_language",
+            "Forbidden Language Checks",
+            lambda paths: check_forbidden_language(changed_files, paths),
+        ),
+    ]
+    results = run_stages(stages, deadline=deadline)
     failures = False
-
-    scope_lines, scope_fail = check_scope(changed_files)
-    report_lines.append("Scope & Boundary Checks:")
-    report_lines.extend(scope_lines)
-    failures = failures or scope_fail
-
-    tier_lines, tier_fail = check_tier1_docs(changed_files)
-    report_lines.append("Tier-1 Documentation Checks:")
-    report_lines.extend(tier_lines)
-    failures = failures or tier_fail
-
-    compile_lines, compile_fail = check_compileall()
-    report_lines.append("Compile Checks:")
-    report_lines.extend(compile_lines)
-    failures = failures or compile_fail
-
-    test_lines, test_fail = check_tests(selected_mode)
-    report_lines.append("Test Checks:")
-    report_lines.extend(test_lines)
-    failures = failures or test_fail
-
-    forbidden_lines, forbidden_fail = check_forbidden_language(changed_files)
-    report_lines.append("Forbidden Language Checks:")
-    report_lines.extend(forbidden_lines)
-    failures = failures or forbidden_fail
+    for result in results:
+        report_lines.append(f"{result.title}: [{result.duration_s:.2f}s]")
+        report_lines.extend(result.lines)
+        failures = failures or result.failed
+    report_lines.append(f"Total elapsed: {time.monotonic() - started:.2f}s")
 
     report_text = "\n".join(report_lines)
     print(report_text)
     write_report(report_text, args.report_file)
+    write_json(changed_files, results)
 
     return 2 if failures else 0
 
 
 if __name__ == "__main__":
-    sys.exit(main())
+    exit_after_stages(main())
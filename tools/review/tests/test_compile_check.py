@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from tools.review import compile_check, run_review_checks
+
+
+def test_check_files_reports_errors_and_caches_successes(tmp_path: Path) -> None:
+    good = tmp_path / "good.py"
+    bad = tmp_path / "bad.py"
+    good.write_text("x = 1\n", encoding="utf-8")
+    bad.write_text("def broken(:\n", encoding="utf-8")
+    cache_path = tmp_path / "cache" / "compile.json"
+
+    first = compile_check.check_files([str(good), str(bad)], cache_path=cache_path)
+    assert first.checked == 2
+    assert first.cached == 0
+    assert len(first.errors) == 1
+    assert first.errors[0].startswith(f"{bad}:1: SyntaxError")
+
+    second = compile_check.check_files([str(good), str(bad)], cache_path=cache_path, parallel=True)
+    assert second.checked == 1  # only the failing file is compiled again
+    assert second.cached == 1
+
+    good.write_text("x = 2\n", encoding="utf-8")
+    third = compile_check.check_files([str(good)], cache_path=cache_path)
+    assert third.checked == 1
+
+    assert not list(tmp_path.rglob("__pycache__"))
+
+
+def test_fast_mode_only_compiles_changed_python_files(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(run_review_checks, "compile_cache_path", lambda: None)
+    (tmp_path / "ok.py").write_text("y = 1\n", encoding="utf-8")
+    (tmp_path / "untouched.py").write_text("def nope(:\n", encoding="utf-8")
+
+    lines, hard_fail = run_review_checks.check_compileall("fast", ["ok.py", "README.md", "removed.py"])
+    assert hard_fail is False
+    assert lines == ["[PASS] Compile check: 1 changed Python files (1 compiled, 0 unchanged)"]
+
+    lines, hard_fail = run_review_checks.check_compileall("fast", ["README.md"])
+    assert (lines, hard_fail) == (["[SKIP] Compile check (no changed Python files)"], False)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from tools.review import impact
+
+
+def write(root: Path, rel: str, text: str = "") -> None:
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def build(root: Path, **kwargs) -> impact.ImportGraph:
+    return impact.build_graph(root, import_roots=(".",), source_dirs=("pkg",), test_dirs=("tests",), **kwargs)
+
+
+def test_impacted_tests_follow_transitive_and_lazy_imports(tmp_path: Path) -> None:
+    write(tmp_path, "pkg/__init__.py")
+    write(tmp_path, "pkg/core.py", "VALUE = 1\n")
+    write(tmp_path, "pkg/api.py", "from .core import VALUE\n")
+    write(tmp_path, "pkg/cli.py", "def main():\n    from pkg import api\n")
+    write(tmp_path, "pkg/worker.py", "X = 1\n")
+    write(tmp_path, "tests/test_api.py", "from pkg.api import VALUE\n")
+    write(tmp_path, "tests/test_cli.py", "import pkg.cli\n")
+    write(tmp_path, "tests/test_worker.py", "CMD = ['python', '-m', 'pkg.worker']\n")
+    write(tmp_path, "tests/test_other.py", "import json\n")
+
+    graph = build(tmp_path)
+
+    assert impact.impacted_tests(graph, ["pkg/core.py"]) == ["tests/test_api.py", "tests/test_cli.py"]
+    assert impact.impacted_tests(graph, ["pkg/worker.py"]) == ["tests/test_worker.py"]
+    assert impact.impacted_tests(graph, ["tests/test_other.py"]) == ["tests/test_other.py"]
+    assert impact.impacted_tests(graph, ["docs/readme.md"]) == []
+    assert impact.impacted_tests(graph, ["pytest.ini"]) == graph.tests
+
+
+def test_graph_cache_reparses_only_changed_files(tmp_path: Path, monkeypatch) -> None:
+    write(tmp_path, "pkg/__init__.py")
+    write(tmp_path, "pkg/a.py", "X = 1\n")
+    write(tmp_path, "tests/test_a.py", "import json\n")
+    cache_path = tmp_path / "cache" / "impact.json"
+    build(tmp_path, cache_path=cache_path)
+
+    parsed: list[str] = []
+    original = impact.parse_imports
+    monkeypatch.setattr(impact, "parse_imports", lambda source, *a, **k: parsed.append(source) or original(source, *a, **k))
+    write(tmp_path, "tests/test_a.py", "from pkg import a\n")
+
+    graph = build(tmp_path, cache_path=cache_path)
+    assert parsed == ["from pkg import a\n"]
+    assert impact.impacted_tests(graph, ["pkg/a.py"]) == ["tests/test_a.py"]
+
+
+def test_yaml_inputs_select_every_test_and_unmapped_paths_are_reported(tmp_path: Path) -> None:
+    write(tmp_path, "pkg/__init__.py")
+    write(tmp_path, "pkg/core.py", "X = 1\n")
+    write(tmp_path, "pkg/script.py", "print('run by path')\n")
+    write(tmp_path, "tests/test_core.py", "from pkg import core\n")
+    write(tmp_path, "tests/test_script.py", "CMD = ['python', 'pkg/script.py']\n")
+
+    graph = build(tmp_path)
+
+    for path in ("taskpacks/schema.yml", "taskpacks/TASK-1/task.yml", "tools/orchestrator/policy.yml"):
+        assert impact.impacted_tests(graph, [path]) == graph.tests
+        assert impact.unmapped_paths(graph, [path]) == []
+    assert impact.unmapped_paths(graph, ["pkg/core.py", "pkg/script.py", "docs/readme.md"]) == [
+        "pkg/script.py",
+        "docs/readme.md",
+    ]
+
+
+def test_fast_selection_falls_back_to_the_canary(tmp_path: Path, monkeypatch) -> None:
+    from tools.review import run_review_checks
+
+    write(tmp_path, "tools/__init__.py")
+    write(tmp_path, "tools/core.py", "X = 1\n")
+    write(tmp_path, "tests/test_core.py", "from tools import core\n")
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(run_review_checks, "git_dir", lambda: None)
+
+    canary = list(run_review_checks.CANARY_TESTS)
+    assert run_review_checks.select_impacted_tests(["tools/core.py"]) == ["tests/test_core.py"]
+    assert run_review_checks.select_impacted_tests(["docs/readme.md"]) == canary
+    assert run_review_checks.select_impacted_tests(["tools/core.py", "next_prompt.yml"]) == [*canary, "tests/test_core.py"]
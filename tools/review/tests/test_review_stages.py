@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+import textwrap
+import time
+
+from tools.review import run_review_checks
+from tools.review.run_review_checks import Stage
+
+
+def test_stages_run_concurrently_and_report_in_order() -> None:
+    def slow(paths: list[str]) -> tuple[list[str], bool]:
+        time.sleep(0.3)
+        return ["[PASS] slow"], False
+
+    def failing(paths: list[str]) -> tuple[list[str], bool]:
+        time.sleep(0.3)
+        paths.append("docs/bad.md")
+        return ["[FAIL] failing"], True
+
+    started = time.monotonic()
+    results = run_review_checks.run_stages(
+        [
+            Stage("slow", "Slow", slow),
+            Stage("failing", "Failing", failing),
+            Stage("fast", "Fast", lambda paths: (["[PASS] fast"], False)),
+        ]
+    )
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.55
+    assert [r.title for r in results] == ["Slow", "Failing", "Fast"]
+    assert [r.lines for r in results] == [["[PASS] slow"], ["[FAIL] failing"], ["[PASS] fast"]]
+    assert [r.failed for r in results] == [False, True, False]
+    assert [r.status for r in results] == ["pass", "fail", "pass"]
+    assert results[1].paths == ["docs/bad.md"]
+    assert results[0].duration_s >= 0.3
+
+
+def test_stage_over_budget_is_skipped_and_its_command_killed() -> None:
+    def hanging(paths: list[str]) -> tuple[list[str], bool]:
+        code, _ = run_review_checks.run_cmd([sys.executable, "-c", "import time; time.sleep(30)"])
+        return [f"[FAIL] exited {code}"], True
+
+    started = time.monotonic()
+    results = run_review_checks.run_stages(
+        [Stage("hanging", "Hanging", hanging), Stage("quick", "Quick", lambda paths: (["[PASS] quick"], False))],
+        deadline=started + 0.5,
+    )
+
+    assert time.monotonic() - started < 5
+    assert results[0].timed_out is True
+    assert results[0].failed is False
+    assert results[0].status == "timeout"
+    assert results[0].lines[0].startswith("[SKIP] Stage exceeded the time budget")
+    assert results[1].lines == ["[PASS] quick"]
+    # The killed command lets the stage thread finish instead of lingering.
+    for _ in range(50):
+        if not run_review_checks._RUNNING:
+            break
+        time.sleep(0.05)
+    assert not run_review_checks._RUNNING
+
+
+def test_in_process_stage_over_budget_does_not_delay_exit() -> None:
+    script = textwrap.dedent(
+        """
+        import concurrent.futures, time
+        from tools.review import run_review_checks
+        from tools.review.run_review_checks import Stage
+
+        def busy(paths):
+            # Executor worker threads are joined at interpreter exit.
+            with concurrent.futures.ThreadPoolExecutor(1) as pool:
+                pool.submit(time.sleep, 30).result()
+            return ["[PASS] busy"], False
+
+        results = run_review_checks.run_stages([Stage("busy", "Busy", busy)], deadline=time.monotonic() + 0.3)
+        print(results[0].status)
+        run_review_checks.exit_after_stages(3)
+        """
+    )
+    started = time.monotonic()
+    proc = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=20)
+
+    assert time.monotonic() - started < 10
+    assert proc.returncode == 3
+    assert proc.stdout.strip() == "timeout"
+
+
+def test_json_report_lists_stage_status_duration_and_paths() -> None:
+    results = [
+        run_review_checks.StageResult("scope", "Scope & Boundary Checks", ["[FAIL] x"], True, 0.01, paths=["b.py", "a.py"]),
+        run_review_checks.StageResult("tier1_docs", "Tier-1 Documentation Checks", ["[SKIP] y"], False, 0.0),
+        run_review_checks.StageResult("tests", "Test Checks", ["[SKIP] z"], False, 2.5, timed_out=True),
+    ]
+
+    report = run_review_checks.build_json_report(
+        mode="fast",
+        base_ref="origin/main",
+        changed_files=["a.py", "b.py"],
+        results=results,
+        total_s=2.51,
+    )
+
+    assert report["schema_version"] == run_review_checks.JSON_SCHEMA_VERSION
+    assert report["tool"]["name"] == "tools.review.run_review_checks"
+    assert report["summary"] == {"stages": 3, "failed": 1, "skipped": 2, "status": "fail"}
+    assert report["stages"][0] == {
+        "name": "scope",
+        "title": "Scope & Boundary Checks",
+        "status": "fail",
+        "duration_s": 0.01,
+        "paths": ["a.py", "b.py"],
+    }
+    assert [stage["status"] for stage in report["stages"]] == ["fail", "skip", "timeout"]
+    assert report["timings"] == {"total_s": 2.51, "stages": {"scope": 0.01, "tier1_docs": 0.0, "tests": 2.5}}
+
+
+def test_failed_test_paths_reads_pytest_short_summary() -> None:
+    output = "\n".join(
+        [
+            "..F",
+            "FAILED tests/test_a.py::test_one - AssertionError: boom",
+            "FAILED tests/test_a.py::test_two",
+            "ERROR tools/review/tests/test_b.py - ImportError",
+        ]
+    )
+    assert run_review_checks.failed_test_paths(output) == ["tests/test_a.py", "tools/review/tests/test_b.py"]
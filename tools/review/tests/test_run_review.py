@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import json
+import subprocess
 from pathlib import Path
 
+import pytest
+
 from tools.review import run_review
 
 
@@ -44,18 +47,20 @@ def test_report_schema_stability(tmp_path: Path) -> None:
         "summary",
         "root",
         "violations",
+        "timings",
     ]
     assert list(report["summary"].keys()) == ["checks", "violations", "status"]
 
     assert_sorted_keys(
         report_text,
-        ["generated_at", "mode", "root", "schema_version", "summary", "tool", "violations"],
+        ["generated_at", "mode", "root", "schema_version", "summary", "timings", "tool", "violations"],
     )
 
-    assert report["schema_version"] == 1
+    assert report["schema_version"] == 2
     assert report["tool"]["name"] == "tools.review.run_review"
     assert report["tool"]["version"] == "unknown"
     assert report["summary"]["checks"] == len(run_review.CHECKS)
+    assert set(report["timings"]["checks"]) == {check.name for check in run_review.CHECKS}
     assert report["summary"]["violations"] == 2
     assert report["summary"]["status"] == "fail"
     assert report["generated_at"].endswith("Z")
@@ -152,3 +157,99 @@ def test_negative_case_missing_taskpack_file(tmp_path: Path) -> None:
             "path": "taskpacks/TASK-EXAMPLE/acceptance.yml",
         }
     ]
+
+
+def test_taskpack_structure_only_checks_existence(tmp_path: Path, monkeypatch) -> None:
+    create_minimal_repo(tmp_path)
+    (tmp_path / "taskpacks/TASK-EXAMPLE/spec.md").write_bytes(b"\xff\xfe not utf-8")
+    monkeypatch.setattr(run_review.catalog, "load_all", lambda *a, **k: pytest.fail("taskpacks parsed"))
+
+    assert run_review.check_taskpack_structure(tmp_path) == []
+
+
+def test_checks_declare_inputs_and_run_in_registration_order(tmp_path: Path) -> None:
+    create_minimal_repo(tmp_path)
+    (tmp_path / "docs/GOVERNANCE.md").unlink()
+    (tmp_path / "taskpacks/TASK-EXAMPLE/runbook.md").unlink()
+
+    assert [check.name for check in run_review.CHECKS] == ["check_tier1_docs", "check_taskpack_structure"]
+    for check in run_review.CHECKS:
+        assert check.inputs
+
+    results, timings = run_review.run_checks(tmp_path, max_workers=2)
+    assert list(results) == ["check_tier1_docs", "check_taskpack_structure"]
+    assert [v["path"] for v in results["check_tier1_docs"]] == ["docs/GOVERNANCE.md"]
+    assert [v["path"] for v in results["check_taskpack_structure"]] == ["taskpacks/TASK-EXAMPLE/runbook.md"]
+    assert list(timings) == ["check_tier1_docs", "check_taskpack_structure"]
+    assert all(duration >= 0 for duration in timings.values())
+
+
+def git(root: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@example.com", *args],
+        cwd=root,
+        check=True,
+        capture_output=True,
+    )
+
+
+def test_check_reads_matches_declared_inputs_and_parent_dirs() -> None:
+    checks = {check.name: check for check in run_review.CHECKS}
+    assert run_review.check_reads(checks["check_tier1_docs"], ["docs/GOVERNANCE.md"])
+    assert not run_review.check_reads(checks["check_tier1_docs"], ["tools/review/run_review.py"])
+    assert run_review.check_reads(checks["check_taskpack_structure"], ["taskpacks/TASK-NEW/notes.txt"])
+    assert not run_review.check_reads(checks["check_taskpack_structure"], ["docs/GOVERNANCE.md"])
+
+
+def test_changed_since_reuses_cached_results(tmp_path: Path) -> None:
+    create_minimal_repo(tmp_path)
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "add", "-A")
+    git(tmp_path, "commit", "-q", "-m", "base")
+
+    # No cached results for the base commit yet: every check runs, and the
+    # clean tree seeds the cache for HEAD.
+    first = run_review.generate_report(tmp_path, "advisory", changed_since="HEAD")
+    assert first["incremental"]["cache"] == "miss"
+    assert first["incremental"]["checks_run"] == [check.name for check in run_review.CHECKS]
+    assert (tmp_path / ".git" / run_review.CACHE_DIRNAME).is_dir()
+
+    (tmp_path / "taskpacks/TASK-EXAMPLE/risk.md").unlink()
+    second = run_review.generate_report(tmp_path, "advisory", changed_since="HEAD")
+    assert second["incremental"]["cache"] == "hit"
+    assert second["incremental"]["changed_paths"] == 1
+    assert second["incremental"]["checks_run"] == ["check_taskpack_structure"]
+    assert second["incremental"]["checks_reused"] == ["check_tier1_docs"]
+    assert list(second["timings"]["checks"]) == ["check_taskpack_structure"]
+
+    # The merged report matches a full run of the same tree.
+    full = run_review.generate_report(tmp_path, "advisory")
+    assert second["violations"] == full["violations"]
+    assert second["summary"] == full["summary"]
+
+
+def test_changed_since_outside_git_runs_everything(tmp_path: Path) -> None:
+    create_minimal_repo(tmp_path)
+    (tmp_path / "docs/GOVERNANCE.md").unlink()
+    report = run_review.generate_report(tmp_path, "advisory", changed_since="origin/main")
+    assert report["incremental"]["cache"] == "miss"
+    assert report["incremental"]["commit"] is None
+    assert [v["path"] for v in report["violations"]] == ["docs/GOVERNANCE.md"]
+
+
+def test_changed_paths_uses_the_shared_diff_service(tmp_path: Path) -> None:
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "old.md").write_text("same content\n" * 5, encoding="utf-8")
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "add", "-A")
+    git(tmp_path, "commit", "-q", "-m", "base")
+    git(tmp_path, "mv", "docs/old.md", "docs/new.md")
+    (tmp_path / "notes.txt").write_text("untracked\n", encoding="utf-8")
+
+    assert run_review.changed_paths(tmp_path, "HEAD") == {"docs/old.md", "docs/new.md", "notes.txt"}
+    assert run_review.changed_paths(tmp_path / "docs", "HEAD") == {"old.md", "new.md"}
+
+
+def test_checks_fingerprint_covers_modules_the_checks_import() -> None:
+    files = {path.relative_to(run_review.REPO_ROOT).as_posix() for path in run_review.check_source_files()}
+    assert {"tools/review/run_review.py", "tools/taskpacks/catalog.py", "tools/common/yaml_loader.py"} <= files
@@ -0,0 +1,5 @@
+from __future__ import annotations
+
+from .catalog import TaskPack, TaskpackCatalog, TaskpackError, load, load_all
+
+__all__ = ["TaskPack", "TaskpackCatalog", "TaskpackError", "load", "load_all"]
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import concurrent.futures
+import dataclasses
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from tools.common.yaml_loader import safe_load
+
+# Files a TaskPack view is built from; load() with strict=True requires them.
+CORE_FILES = ("task.yml", "spec.md", "risk.md", "acceptance.yml")
+# Mirrors taskpacks/schema.yml `required_files`; used for `TaskPack.missing`.
+REQUIRED_FILES = ("task.yml", "spec.md", "acceptance.yml", "risk.md", "runbook.md")
+
+_Stamp = Tuple[int, int]
+
+
+class TaskpackError(ValueError):
+    pass
+
+
+@dataclasses.dataclass
+class TaskPack:
+    path: Path
+    task: dict
+    spec: str
+    risk: str
+    acceptance: dict
+    # Populated by non-strict loads (load_all): required files that are not
+    # present and YAML files that failed to parse.
+    missing: Tuple[str, ...] = ()
+    errors: Tuple[str, ...] = ()
+
+    @property
+    def id(self) -> str:
+        return str(self.task.get("id", "TASK-UNKNOWN"))
+
+    @property
+    def title(self) -> str:
+        return str(self.task.get("title", "Untitled"))
+
+    @property
+    def allow_network(self) -> bool:
+        return bool(self.task.get("constraints", {}).get("allow_network", False))
+
+    @property
+    def allow_cloud_mutations(self) -> bool:
+        return bool(self.task.get("constraints", {}).get("allow_cloud_mutations", False))
+
+    @property
+    def preferred_skills(self) -> List[str]:
+        return list(self.task.get("skills", {}).get("prefer", []))
+
+
+def _stamp(path: Path) -> Optional[_Stamp]:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def taskpack_dirs(taskpacks_root: Path, *, pattern: str = "TASK-*") -> List[Path]:
+    """Directories under `taskpacks_root` matching `pattern`, sorted by name."""
+    return sorted((p for p in Path(taskpacks_root).glob(pattern) if p.is_dir()), key=lambda p: p.name)
+
+
+def missing_files(tp_path: Path) -> Tuple[str, ...]:
+    """REQUIRED_FILES absent from `tp_path`; stat calls only, nothing is read."""
+    return tuple(name for name in REQUIRED_FILES if not (Path(tp_path) / name).is_file())
+
+
+class TaskpackCatalog:
+    """
+    Process-wide cache of taskpack file contents.
+
+    Each file is read (and YAML parsed) once and reused until its
+    (mtime_ns, size) changes. Parsed YAML is shared between callers and must
+    be treated as read-only. Safe to use from multiple threads.
+    """
+
+    def __init__(self, yaml_loader: Callable[[str], Any] = safe_load) -> None:
+        self._yaml_loader = yaml_loader
+        self._lock = threading.Lock()
+        self._text: Dict[Path, Tuple[_Stamp, str]] = {}
+        self._yaml: Dict[Path, Tuple[_Stamp, Any]] = {}
+        self.reads = 0
+        self.parses = 0
+
+    def _read(self, path: Path) -> Optional[Tuple[_Stamp, str]]:
+        stamp = _stamp(path)
+        if stamp is None:
+            return None
+        with self._lock:
+            cached = self._text.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached
+        entry = (stamp, path.read_text(encoding="utf-8"))
+        with self._lock:
+            self.reads += 1
+            self._text[path] = entry
+        return entry
+
+    def read_text(self, path: Path) -> Optional[str]:
+        """File contents, or None when the file does not exist."""
+        entry = self._read(Path(path).resolve())
+        return entry[1] if entry is not None else None
+
+    def load_yaml(self, path: Path) -> Any:
+        """Parsed YAML (None for a missing file); parse errors propagate."""
+        path = Path(path).resolve()
+        entry = self._read(path)
+        if entry is None:
+            return None
+        stamp, text = entry
+        with self._lock:
+            cached = self._yaml.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        data = self._yaml_loader(text)
+        with self._lock:
+            self.parses += 1
+            self._yaml[path] = (stamp, data)
+        return data
+
+    def load(self, tp_path: Path, *, strict: bool = True) -> TaskPack:
+        """
+        TaskPack view of one directory. strict=True raises TaskpackError for a
+        missing core file or an unreadable or unparsable one; strict=False
+        records them in `missing`/`errors` and substitutes empty values.
+        """
+        tp_path = Path(tp_path)
+        if strict:
+            for name in CORE_FILES:
+                if not (tp_path / name).is_file():
+                    raise TaskpackError(f"Task pack missing required file: {tp_path / name}")
+
+        errors: List[str] = []
+
+        def _mapping(name: str) -> dict:
+            try:
+                data = self.load_yaml(tp_path / name)
+            except (OSError, UnicodeDecodeError) as exc:
+                if strict:
+                    raise TaskpackError(f"Failed to read: {tp_path / name} ({exc})") from exc
+                errors.append(f"{name}: {exc}")
+                return {}
+            except Exception as exc:
+                if strict:
+                    raise TaskpackError(f"Failed to parse YAML: {tp_path / name} ({exc})") from exc
+                errors.append(f"{name}: {exc}")
+                return {}
+            return data if isinstance(data, dict) else {}
+
+        def _text(name: str) -> str:
+            try:
+                return self.read_text(tp_path / name) or ""
+            except (OSError, UnicodeDecodeError) as exc:
+                if strict:
+                    raise TaskpackError(f"Failed to read: {tp_path / name} ({exc})") from exc
+                errors.append(f"{name}: {exc}")
+                return ""
+
+        task = _mapping("task.yml")
+        acceptance = _mapping("acceptance.yml")
+        return TaskPack(
+            path=tp_path,
+            task=task,
+            spec=_text("spec.md"),
+            risk=_text("risk.md"),
+            acceptance=acceptance,
+            missing=missing_files(tp_path),
+            errors=tuple(errors),
+        )
+
+    def load_all(
+        self,
+        taskpacks_root: Path,
+        *,
+        pattern: str = "TASK-*",
+        max_workers: Optional[int] = None,
+    ) -> List[TaskPack]:
+        """Non-strict loads of every directory matching `pattern`, sorted by name."""
+        dirs = taskpack_dirs(taskpacks_root, pattern=pattern)
+        if not dirs:
+            return []
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(lambda d: self.load(d, strict=False), dirs))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._text.clear()
+            self._yaml.clear()
+
+
+CATALOG = TaskpackCatalog()
+
+
+def read_text(path: Path) -> Optional[str]:
+    return CATALOG.read_text(path)
+
+
+def load_yaml(path: Path) -> Any:
+    return CATALOG.load_yaml(path)
+
+
+def load(tp_path: Path, *, strict: bool = True) -> TaskPack:
+    return CATALOG.load(tp_path, strict=strict)
+
+
+def load_all(taskpacks_root: Path, *, pattern: str = "TASK-*", max_workers: Optional[int] = None) -> List[TaskPack]:
+    return CATALOG.load_all(taskpacks_root, pattern=pattern, max_workers=max_workers)
+